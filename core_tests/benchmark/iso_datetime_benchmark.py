@@ -0,0 +1,114 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+Compares the legacy strptime / isoformat / strftime ISODatetime paths with the fast paths, over one million
+recorder-style DB rows: parsing the rec field, formatting it back, then sorting and deduplicating by rec.
+
+cd core_tests
+python -m benchmark.iso_datetime_benchmark
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+import dateutil.tz
+
+from mrcs_core.data.iso_datetime import ISODatetime
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ISODatetimeBenchmark(object):
+    """
+    ISODatetime parse, format and deduplication benchmark
+    """
+
+    ROW_COUNT = 1_000_000
+
+    __UTC_ZONE = dateutil.tz.tzutc()
+    __LOCAL_ZONE = dateutil.tz.tzlocal()
+    __DB_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+    @staticmethod
+    def rows(count, seed=0):
+        rnd = random.Random(seed)
+        rec = datetime(2025, 10, 25, 12, 0, 0)
+
+        rows = []
+        for _ in range(count):
+            rec += timedelta(milliseconds=rnd.choice((0, 1, 3, 20)))  # includes duplicates
+            rows.append(rec.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3])
+
+        rnd.shuffle(rows)
+
+        return rows
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def legacy_parse(cls, field):
+        db_naive = ISODatetime.strptime(field, cls.__DB_FORMAT)
+        db_utc = db_naive.replace(tzinfo=cls.__UTC_ZONE)
+
+        return db_utc.astimezone(cls.__LOCAL_ZONE)
+
+
+    @classmethod
+    def legacy_format(cls, iso):
+        return iso.astimezone(cls.__UTC_ZONE).strftime(cls.__DB_FORMAT)[:-3]
+
+
+    @staticmethod
+    def legacy_dedup(isos):
+        unique = {}
+        for iso in sorted(isos):
+            unique.setdefault(iso.isoformat(), iso)  # previously unhashable - keyed by string
+
+        return list(unique.values())
+
+
+    @staticmethod
+    def fast_dedup(isos):
+        return list(dict.fromkeys(sorted(isos)))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def run(cls, count=ROW_COUNT):
+        ISODatetime.set_local_zone(cls.__LOCAL_ZONE)
+
+        rows = cls.rows(count)
+        timings = {}
+
+        for name, parse, format_db, dedup in (
+                ('legacy', cls.legacy_parse, cls.legacy_format, cls.legacy_dedup),
+                ('fast', ISODatetime.construct_from_db_field, ISODatetime.dbformat, cls.fast_dedup)):
+            start = time.perf_counter()
+            isos = [parse(row) for row in rows]
+            timings[f'{name}_parse'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for iso in isos:
+                format_db(iso)
+            timings[f'{name}_format'] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            unique = dedup(isos)
+            timings[f'{name}_dedup'] = time.perf_counter() - start
+
+            timings[f'{name}_unique'] = len(unique)
+
+        return timings
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    for key, value in ISODatetimeBenchmark.run().items():
+        print(f'{key:>14}: {value:10.3f}' if isinstance(value, float) else f'{key:>14}: {value:10d}')
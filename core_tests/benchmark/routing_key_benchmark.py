@@ -0,0 +1,102 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+Compares the legacy regex / split / re-join routing key construction with the single-pass parser, both uncached
+and memoised, over a recorded-style stream of one million routing keys.
+
+cd core_tests
+python -m benchmark.routing_key_benchmark
+"""
+
+import random
+import re
+import time
+
+from mrcs_core.data.equipment_identity import EquipmentFilter, EquipmentIdentifier, EquipmentType
+from mrcs_core.messaging.routing_key import PublicationRoutingKey
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RoutingKeyBenchmark(object):
+    """
+    routing key construction benchmark
+    """
+
+    STREAM_LENGTH = 1_000_000
+    DISTINCT_KEYS = 500
+
+
+    @staticmethod
+    def stream(length, distinct_keys, seed=0):
+        rnd = random.Random(seed)
+        types = [str(equipment_type) for equipment_type in EquipmentType]
+
+        keys = []
+        for _ in range(distinct_keys):
+            source = f'{rnd.choice(types)}.{rnd.choice(("*", "001", "002"))}.{rnd.randint(1, 120):03d}'
+            target = f'{rnd.choice(types + ["*"])}.{rnd.choice(("*", "001"))}.{rnd.choice(("*", "003", "016"))}'
+            keys.append(f'{source}.{target}')
+
+        return [rnd.choice(keys) for _ in range(length)]
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def legacy(routing):
+        # the original path: uncompiled regex, split, re-join, then split again per specification...
+        if not re.fullmatch(r'[A-Z*]+\.[0-9*-]+\.[0-9*]+\.[A-Z*]+\.[0-9*-]+\.[0-9*]+', routing):
+            raise ValueError(routing)
+
+        pieces = routing.split('.')
+
+        source_pieces = '.'.join(pieces[:3]).split('.')
+        source = EquipmentIdentifier(EquipmentType(source_pieces[0]),
+                                     None if source_pieces[1] == '*' else int(source_pieces[1]),
+                                     int(source_pieces[2]))
+
+        target_pieces = '.'.join(pieces[3:]).split('.')
+        target = EquipmentFilter(None if target_pieces[0] == '*' else EquipmentType(target_pieces[0]),
+                                 None if target_pieces[1] == '*' else int(target_pieces[1]),
+                                 None if target_pieces[2] == '*' else int(target_pieces[2]))
+
+        return PublicationRoutingKey(source, target)
+
+
+    @staticmethod
+    def single_pass(routing):
+        return PublicationRoutingKey(*PublicationRoutingKey._parse(routing, EquipmentIdentifier))
+
+
+    @staticmethod
+    def memoised(routing):
+        return PublicationRoutingKey.construct_from_jdict(routing)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def run(cls, length=STREAM_LENGTH, distinct_keys=DISTINCT_KEYS):
+        stream = cls.stream(length, distinct_keys)
+        timings = {}
+
+        for name, construct in (('legacy', cls.legacy), ('single_pass', cls.single_pass),
+                                ('memoised', cls.memoised)):
+            start = time.perf_counter()
+
+            for routing in stream:
+                construct(routing)
+
+            timings[name] = time.perf_counter() - start
+
+        return timings
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    for key, elapsed in RoutingKeyBenchmark.run().items():
+        print(f'{key:>12}: {elapsed:6.3f} s')
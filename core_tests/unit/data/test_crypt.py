@@ -0,0 +1,137 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/data/test_crypt.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import io
+import unittest
+from base64 import b64encode
+
+from Crypto.Cipher import AES
+from Crypto.Hash import SHA256
+
+from mrcs_core.data.crypt import Crypt, CryptMode
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestCrypt(unittest.TestCase):
+    __KEY = 'secret'
+    __TEXTS = ['', 'a', '0123456789abcde', '0123456789abcdef', '{"name": "café", "value": 17}', 'x' * 1000]
+
+
+    @classmethod
+    def __legacy_encrypt(cls, key, plain_text):
+        source = plain_text.encode()
+        iv = bytes(range(AES.block_size))
+        padding = AES.block_size - len(source) % AES.block_size
+
+        encryptor = AES.new(SHA256.new(key.encode()).digest(), AES.MODE_CBC, iv)
+
+        return b64encode(iv + encryptor.encrypt(source + bytes([padding]) * padding)).decode()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_text(self):
+        for mode in CryptMode:
+            for text in self.__TEXTS:
+                self.assertEqual(text, Crypt.decrypt(self.__KEY, Crypt.encrypt(self.__KEY, text, mode=mode)))
+
+
+    def test_gcm_prefix(self):
+        self.assertTrue(Crypt.encrypt(self.__KEY, 'abc', mode=CryptMode.GCM).startswith('gcm:'))
+        self.assertFalse(Crypt.encrypt(self.__KEY, 'abc').startswith('gcm:'))
+
+
+    def test_legacy(self):
+        for text in self.__TEXTS:
+            self.assertEqual(text, Crypt.decrypt(self.__KEY, self.__legacy_encrypt(self.__KEY, text)))
+
+
+    def test_wrong_key(self):
+        cypher_text = Crypt.encrypt(self.__KEY, 'abc', mode=CryptMode.GCM)
+
+        with self.assertRaises(KeyError):
+            Crypt.decrypt('wrong', cypher_text)
+
+
+    def test_truncated(self):
+        for mode in CryptMode:
+            with self.assertRaises(ValueError):
+                Crypt.session(self.__KEY).decrypt_bytes(b'\x00' * 8, mode=mode)
+
+
+    def test_session(self):
+        self.assertIs(Crypt.session(self.__KEY), Crypt.session(self.__KEY))
+        self.assertIsNot(Crypt.session(self.__KEY), Crypt.session('other'))
+
+
+    def test_stream(self):
+        crypt = Crypt.session(self.__KEY)
+
+        for mode in CryptMode:
+            for size in (0, 1, 15, 16, 17, 1000, 4096):
+                data = bytes(i % 251 for i in range(size))
+
+                for chunk_size in (1, 16, 100):
+                    encrypted = io.BytesIO()
+                    crypt.encrypt_stream(io.BytesIO(data), encrypted, mode=mode, chunk_size=chunk_size)
+
+                    self.assertEqual(data, bytes(crypt.decrypt_bytes(encrypted.getvalue(), mode=mode)))
+
+                    decrypted = io.BytesIO()
+                    crypt.decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted, mode=mode, chunk_size=chunk_size)
+
+                    self.assertEqual(data, decrypted.getvalue())
+
+
+    def test_text_stream(self):
+        crypt = Crypt.session(self.__KEY)
+
+        for text in self.__TEXTS:
+            cypher_texts = [crypt.encrypt_text(text, mode=mode) for mode in CryptMode]
+            cypher_texts.append(self.__legacy_encrypt(self.__KEY, text) + '\n')
+
+            for cypher_text in cypher_texts:
+                for chunk_size in (1, 16, 100):
+                    decrypted = io.BytesIO()
+                    crypt.decrypt_text_stream(io.BytesIO(cypher_text.encode()), decrypted, chunk_size=chunk_size)
+
+                    self.assertEqual(text, decrypted.getvalue().decode())
+
+
+    def test_text_stream_invalid(self):
+        crypt = Crypt.session(self.__KEY)
+        cypher_text = crypt.encrypt_text('x' * 100, mode=CryptMode.GCM).encode()  # a wrong key is always detected
+
+        with self.assertRaises(ValueError):
+            crypt.decrypt_text_stream(io.BytesIO(cypher_text[:-5]), io.BytesIO())
+
+        with self.assertRaises(KeyError):
+            Crypt.session('wrong').decrypt_text_stream(io.BytesIO(cypher_text), io.BytesIO())
+
+
+    def test_stream_tampered(self):
+        crypt = Crypt.session(self.__KEY)
+
+        encrypted = io.BytesIO()
+        crypt.encrypt_stream(io.BytesIO(b'x' * 100), encrypted, mode=CryptMode.GCM)
+
+        tampered = bytearray(encrypted.getvalue())
+        tampered[20] ^= 0x01
+
+        with self.assertRaises(KeyError):
+            crypt.decrypt_stream(io.BytesIO(tampered), io.BytesIO(), mode=CryptMode.GCM)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -58,6 +58,25 @@ class TestEquipmentFilter(unittest.TestCase):
         self.assertEqual('BOS.001.*', obj1.as_json())
 
 
+    def test_hash(self):
+        obj1 = EquipmentFilter.construct_from_jdict(json.loads('"BOS.01.*"'))
+        obj2 = EquipmentFilter.construct_from_jdict(json.loads('"BOS.02.*"'))
+        self.assertEqual(2, len({obj1, obj2, obj1}))
+
+
+    def test_interned(self):
+        obj1 = EquipmentFilter.construct_from_jdict(json.loads('"BOS.01.*"'))
+        obj2 = EquipmentFilter.construct_from_jdict(json.loads('"BOS.01.*"'))
+        self.assertIs(obj1, obj2)
+
+
+    def test_immutable(self):
+        obj1 = EquipmentFilter.construct_from_jdict(json.loads('"BOS.01.*"'))
+
+        with self.assertRaises(AttributeError):
+            obj1.equipment_type = None
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == "__main__":
@@ -58,6 +58,25 @@ class TestEquipmentIdentifier(unittest.TestCase):
         self.assertEqual('BOS.001.002', obj1.as_json())
 
 
+    def test_hash(self):
+        obj1 = EquipmentIdentifier.construct_from_jdict(json.loads('"BOS.01.02"'))
+        obj2 = EquipmentIdentifier.construct_from_jdict(json.loads('"BOS.01.03"'))
+        self.assertEqual(2, len({obj1, obj2, obj1}))
+
+
+    def test_interned(self):
+        obj1 = EquipmentIdentifier.construct_from_jdict(json.loads('"BOS.01.02"'))
+        obj2 = EquipmentIdentifier.construct_from_jdict(json.loads('"BOS.01.02"'))
+        self.assertIs(obj1, obj2)
+
+
+    def test_immutable(self):
+        obj1 = EquipmentIdentifier.construct_from_jdict(json.loads('"BOS.01.02"'))
+
+        with self.assertRaises(AttributeError):
+            obj1.equipment_type = None
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == "__main__":
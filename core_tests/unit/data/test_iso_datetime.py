@@ -70,6 +70,43 @@ class TestISODatetime(unittest.TestCase):
         self.assertEqual('2025-08-26T01:23:45.678+01:00', obj1.as_json())
 
 
+    def test_eq_offset(self):
+        obj1 = ISODatetime.construct_from_jdict(json.loads('"2025-08-26T01:23:45.678+01:00"'))
+        obj2 = ISODatetime.construct_from_jdict(json.loads('"2025-08-26T00:23:45.678+00:00"'))
+        self.assertEqual(False, obj1 == obj2)
+
+
+    def test_eq_millis(self):
+        obj1 = ISODatetime(2025, 8, 26, 1, 23, 45, 678000, tzinfo=ZoneInfo('Europe/London'))
+        obj2 = ISODatetime(2025, 8, 26, 1, 23, 45, 678999, tzinfo=ZoneInfo('Europe/London'))
+        self.assertEqual(True, obj1 == obj2)
+        self.assertEqual(hash(obj1), hash(obj2))
+
+
+    def test_dedup(self):
+        ISODatetime.set_local_zone(ZoneInfo('Europe/London'))
+        fields = ['2025-08-26 01:23:45.678', '2025-08-26 01:23:45.678', '2025-08-26 01:23:45.679']
+        self.assertEqual(2, len(set(ISODatetime.construct_from_db_field(field) for field in fields)))
+
+
+    def test_db_round_trip(self):
+        ISODatetime.set_local_zone(ZoneInfo('Europe/London'))
+
+        for field in ('2025-03-30 00:59:59.999', '2025-03-30 01:00:00.000', '2025-10-26 00:30:00.000',
+                      '2025-10-26 01:30:00.000'):
+            obj1 = ISODatetime.construct_from_db_field(field)
+            self.assertEqual(field, obj1.dbformat())
+
+
+    def test_db_fold(self):
+        ISODatetime.set_local_zone(ZoneInfo('Europe/London'))
+        obj1 = ISODatetime.construct_from_db_field('2025-10-26 00:30:00.000')
+        obj2 = ISODatetime.construct_from_db_field('2025-10-26 01:30:00.000')
+        self.assertEqual('2025-10-26T01:30:00.000+01:00', obj1.isoformat())
+        self.assertEqual('2025-10-26T01:30:00.000+00:00', obj2.isoformat())
+        self.assertEqual(False, obj1 == obj2)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == "__main__":
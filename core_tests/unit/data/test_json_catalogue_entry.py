@@ -0,0 +1,110 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/data/test_json_catalogue_entry.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import os
+import tempfile
+import unittest
+from collections import OrderedDict
+
+from mrcs_core.data.json import JSONCatalogueEntry
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Entry(JSONCatalogueEntry):
+    location = None
+
+    @classmethod
+    def catalogue_location(cls):
+        return cls.location
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        return None if jdict is None else cls(jdict.get('name'), jdict.get('value'))
+
+
+    def __init__(self, name, value):
+        self.__name = name
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('name', self.name), ('value', self.value)])
+
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Entry:{{name:{self.name}, value:{self.value}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestJSONCatalogueEntry(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+        Entry.location = self.__dir.name
+
+
+    def tearDown(self):
+        Entry.invalidate_index()
+        self.__dir.cleanup()
+
+
+    def test_list(self):
+        Entry('b.1', 2).store()
+        Entry('a.1', 1).store()
+
+        self.assertEqual(('a.1', 'b.1'), Entry.list())
+        self.assertTrue(Entry.exists('a.1'))
+        self.assertFalse(Entry.exists('c.1'))
+
+
+    def test_store_invalidates(self):
+        Entry('a.1', 1).store()
+        self.assertFalse(Entry.exists('b.1'))
+
+        Entry('b.1', 2).store()
+        self.assertTrue(Entry.exists('b.1'))
+
+
+    def test_external_change(self):
+        Entry('a.1', 1).store()
+        self.assertTrue(Entry.exists('a.1'))
+
+        os.remove(os.path.join(self.__dir.name, 'a-1.json'))
+
+        stat = os.stat(self.__dir.name)  # ensure that the directory mtime has ticked
+        os.utime(self.__dir.name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertFalse(Entry.exists('a.1'))
+
+
+    def test_retrieve_many(self):
+        for i in range(10):
+            Entry(f'e.{i}', i).store()
+
+        entries = Entry.retrieve_many(f'e.{i}' for i in reversed(range(10)))
+
+        self.assertEqual(list(reversed(range(10))), [entry.value for entry in entries])
+        self.assertEqual((), Entry.retrieve_many([]))
+        self.assertEqual(3, Entry.retrieve_many(['e.3'])[0].value)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
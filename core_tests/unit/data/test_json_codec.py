@@ -0,0 +1,142 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/data/test_json_codec.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import json
+import unittest
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum, IntEnum, StrEnum
+from pathlib import Path
+
+from mrcs_core.data.json import JSONCodec, JSONify, OrjsonCodec, StdlibJSONCodec
+from mrcs_core.messaging.message import Message
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Colour(Enum):
+    RED = 'red'
+
+
+class Count(IntEnum):
+    ONE = 1
+
+
+class Name(StrEnum):
+    A = 'a'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestJSONCodec(unittest.TestCase):
+    __filename1 = Path(__file__).parent.parent / 'messaging' / 'data' / 'message.json'
+    with open(__filename1) as fp:
+        __jdict1 = json.load(fp)
+
+    __VALUES = (
+        None, True, 0, -1, 2 ** 64, 0.1, -0.0, 1e15, 1e16, 1e-4, 1e-5, 5e-324, float('nan'), float('inf'),
+        Decimal('1.25'), Decimal('3'), 'a\x00\x1f\x7f é/"\\', [], {}, (1, 2), {'x': [1, {'y': None}]},
+        {1: 'int key'}, OrderedDict([('b', 1), ('a', 2)]),
+    )
+
+
+    def test_stdlib_compact(self):
+        codec = StdlibJSONCodec()
+
+        for value in self.__VALUES:
+            expected = json.dumps(value, cls=JSONify, ensure_ascii=False, separators=(',', ':'))
+            self.assertEqual(expected, codec.dumps(value), repr(value))
+
+
+    @unittest.skipUnless(OrjsonCodec.is_available(), 'orjson is not installed')
+    def test_orjson_compact(self):
+        codec = OrjsonCodec()
+
+        for value in self.__VALUES:
+            self.assertEqual(StdlibJSONCodec().dumps(value), codec.dumps(value), repr(value))
+
+
+    @unittest.skipUnless(OrjsonCodec.is_available(), 'orjson is not installed')
+    def test_orjson_message(self):
+        obj1 = Message.construct_from_jdict(self.__jdict1)
+        self.assertEqual(StdlibJSONCodec().dumps(obj1), OrjsonCodec().dumps(obj1))
+
+
+    @unittest.skipUnless(OrjsonCodec.is_available(), 'orjson is not installed')
+    def test_orjson_parity(self):
+        values = ({1, 2}, frozenset((1,)), {'x': {3}}, datetime(2026, 10, 18, tzinfo=timezone.utc), date(2026, 10, 18),
+                  uuid.UUID(int=1), Colour.RED, Count.ONE, Name.A, [Count.ONE], {'n': Name.A})
+
+        for value in values:
+            try:
+                expected = StdlibJSONCodec().dumps(value)
+            except TypeError:
+                with self.assertRaises(TypeError, msg=repr(value)):
+                    OrjsonCodec().dumps(value)
+                continue
+
+            self.assertEqual(expected, OrjsonCodec().dumps(value), repr(value))
+
+
+    @unittest.skipUnless(OrjsonCodec.is_available(), 'orjson is not installed')
+    def test_orjson_loads(self):
+        codec = OrjsonCodec()
+
+        self.assertEqual(self.__jdict1, codec.loads(json.dumps(self.__jdict1).encode()))
+        self.assertTrue(codec.loads('[NaN]')[0] != codec.loads('[NaN]')[0])
+
+        with self.assertRaises(ValueError):
+            codec.loads('{"unterminated": ')
+
+
+    @unittest.skipUnless(OrjsonCodec.is_available(), 'orjson is not installed')
+    def test_orjson_loads_wide_int(self):
+        codec = OrjsonCodec()
+
+        for value in (2 ** 64, -2 ** 63 - 1, 10 ** 30):
+            self.assertEqual([value], codec.loads(f'[{value}]'))
+            self.assertEqual([value], codec.loads(f'[{value}]'.encode()))
+            self.assertIsInstance(codec.loads(f'[{value}]')[0], int)
+
+
+    def test_dumps_compact(self):
+        obj1 = Message.construct_from_jdict(self.__jdict1)
+        jstr = JSONify.dumps(obj1, separators=JSONify.COMPACT_SEPARATORS)
+
+        self.assertEqual('{"origin":"fe6114f0-c054","routing":"CRT.*.016.*.*.*",'
+                         '"body":{"type":"TurnoutReport","addr":2,"position":"P1"}}', jstr)
+
+
+    def test_payload_compact(self):
+        obj1 = Message.construct_from_jdict(self.__jdict1)
+
+        self.assertEqual(b'{"origin":"fe6114f0-c054","body":{"type":"TurnoutReport","addr":2,"position":"P1"}}',
+                         obj1.payload.as_bytes())
+
+
+    def test_set_default(self):
+        codec = StdlibJSONCodec()
+
+        JSONCodec.set_default(codec)
+        try:
+            self.assertIs(codec, JSONCodec.default())
+        finally:
+            JSONCodec.set_default(None)
+
+        self.assertIsNot(codec, JSONCodec.default())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/data/test_json_fields.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import unittest
+from collections import OrderedDict
+from enum import Enum, unique
+
+from mrcs_core.data.json import JSONable, JSONify
+from mrcs_core.data.json_fields import JSONEnumField, JSONField, JSONNestedField, JSONNestedListField, json_fields
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+@unique
+class Colour(Enum):
+    RED = 1
+    GREEN = 2
+
+
+@json_fields(
+    JSONField('n', 'number'),
+    is_typed=False
+)
+class Leaf(JSONable):
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        return None if jdict is None else cls(jdict.get('n'))
+
+
+    def __init__(self, number):
+        self.number = number
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Leaf:{{number:{self.number}}}'
+
+
+@json_fields(
+    JSONField('name', 'name'),
+    JSONEnumField('colour', 'colour', Colour),
+    JSONEnumField('shade', 'shade', Colour, is_optional=True),
+    JSONNestedField('leaf', 'leaf', Leaf, is_required=True),
+    JSONNestedListField('leaves', 'leaves', Leaf)
+)
+class Tree(JSONable):
+    def __init__(self, name, colour, shade, leaf, leaves):
+        self.name = name
+        self.colour = colour
+        self.shade = shade
+        self.leaf = leaf
+        self.leaves = leaves
+
+
+    def __eq__(self, other):
+        return self.name == other.name  # hand-written - retained
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Tree:{{name:{self.name}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestJSONFields(unittest.TestCase):
+
+    def test_as_json(self):
+        obj = Tree('oak', Colour.GREEN, None, Leaf(1), [Leaf(2), Leaf(3)])
+        jdict = JSONify.as_jdict(obj)
+
+        self.assertEqual(['type', 'name', 'colour', 'shade', 'leaf', 'leaves'], list(jdict.keys()))
+        self.assertEqual(OrderedDict([('type', 'Tree'), ('name', 'oak'), ('colour', 'GREEN'), ('shade', None),
+                                      ('leaf', {'n': 1}), ('leaves', ({'n': 2}, {'n': 3}))]), jdict)
+
+
+    def test_round_trip(self):
+        obj1 = Tree('oak', Colour.GREEN, Colour.RED, Leaf(1), [Leaf(2)])
+        obj2 = Tree.construct_from_jdict(JSONify.as_jdict(obj1))
+
+        self.assertEqual(Colour.RED, obj2.shade)
+        self.assertEqual(Leaf(1), obj2.leaf)
+        self.assertEqual([Leaf(2)], obj2.leaves)
+
+
+    def test_construct_missing_list(self):
+        obj = Tree.construct_from_jdict({'type': 'Tree', 'name': 'ash', 'colour': 'RED', 'leaf': {'n': 1}})
+
+        self.assertIsNone(obj.shade)
+        self.assertEqual([], obj.leaves)
+
+
+    def test_construct_wrong_type(self):
+        with self.assertRaises(TypeError):
+            Tree.construct_from_jdict({'type': 'Leaf', 'name': 'ash', 'colour': 'RED', 'leaf': {'n': 1}})
+
+
+    def test_construct_missing_required(self):
+        with self.assertRaises(ValueError):
+            Tree.construct_from_jdict({'type': 'Tree', 'name': 'ash', 'colour': 'RED'})
+
+
+    def test_construct_invalid_enum(self):
+        with self.assertRaises(KeyError):
+            Tree.construct_from_jdict({'type': 'Tree', 'name': 'ash', 'colour': 'BLUE', 'leaf': {'n': 1}})
+
+
+    def test_eq(self):
+        self.assertEqual(Leaf(1), Leaf(1))
+        self.assertNotEqual(Leaf(1), Leaf(2))
+        self.assertNotEqual(Leaf(1), None)
+        self.assertIsNone(Leaf.__hash__)
+
+
+    def test_retained(self):
+        self.assertTrue(Tree('oak', Colour.GREEN, None, Leaf(1), []) == Tree('oak', Colour.RED, None, Leaf(2), []))
+        self.assertEqual(None, Leaf.construct_from_jdict(None))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/data/test_jsonify.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import unittest
+from collections import OrderedDict
+
+from mrcs_core.data.json import JSONable, JSONify
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Node(JSONable):
+    """
+    a test JSONable, with optional children
+    """
+
+
+    def __init__(self, label, *children):
+        self.__label = label
+        self.__children = list(children)
+
+
+    def as_json(self, **kwargs):
+        jdict = OrderedDict()
+
+        jdict['label'] = self.__label if kwargs.get('upper') is None else self.__label.upper()
+        jdict['children'] = self.__children
+
+        return jdict
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Node:{{label:{self.__label}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestJSONify(unittest.TestCase):
+
+    def test_as_jdict(self):
+        obj1 = Node('a', Node('b'), Node('c', Node('d')))
+        self.assertEqual("{'label': 'a', 'children': ({'label': 'b', 'children': ()}, "
+                         "{'label': 'c', 'children': ({'label': 'd', 'children': ()},)})}", str(obj1.as_jdict()))
+
+
+    def test_as_jdict_kwargs(self):
+        obj1 = Node('a', Node('b'))
+        self.assertEqual({'label': 'A', 'children': ({'label': 'B', 'children': ()},)}, obj1.as_jdict(upper=True))
+
+
+    def test_as_jdict_sequences(self):
+        jdict = JSONify.as_jdict({'list': [Node('a')], 'tuple': (Node('b'),), 'set': {1}})
+        self.assertEqual({'list': ({'label': 'a', 'children': ()},), 'tuple': ({'label': 'b', 'children': ()},),
+                          'set': (1,)}, jdict)
+
+
+    def test_as_jdict_scalar(self):
+        self.assertEqual(None, JSONify.as_jdict(None))
+        self.assertEqual('abc', JSONify.as_jdict('abc'))
+
+
+    def test_as_jdict_does_not_mutate(self):
+        source = {'node': Node('a'), 'values': [Node('b')]}
+        JSONify.as_jdict(source)
+
+        self.assertIsInstance(source['node'], Node)
+        self.assertIsInstance(source['values'][0], Node)
+
+
+    def test_as_jdict_deep(self):
+        obj1 = Node('leaf')
+
+        for i in range(5000):  # well beyond the default recursion limit
+            obj1 = Node(str(i), obj1)
+
+        self.assertEqual('4999', JSONify.as_jdict(obj1)['label'])
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
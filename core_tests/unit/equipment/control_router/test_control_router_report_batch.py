@@ -0,0 +1,96 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/equipment/control_router/test_control_router_report_batch.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import unittest
+
+from mrcs_core.data.json import JSONify
+from mrcs_core.equipment.control_router.control_router_report import ControlRouterReport
+from mrcs_core.equipment.control_router.control_router_report_batch import ControlRouterReportBatch
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestControlRouterReportBatch(unittest.TestCase):
+    __REPORTS = [
+        ControlRouterReport(100, 0, 100, 18000, 16000, 30, 0x00, 0x00, 0xaa, None),
+        ControlRouterReport(400, 0, 300, 18000, 16000, 31, 0x00, 0x00, 0xaa, None),
+        ControlRouterReport(900, 0, 800, 17900, 15800, 33, 0x04, 0x00, 0xaa, None),
+        ControlRouterReport(200, 0, 500, 18000, 16000, 32, 0x02, 0x00, 0xaa, 0x55),
+    ]
+
+
+    def __batches(self):
+        samples = self.__REPORTS[:2] + [JSONify.as_jdict(report) for report in self.__REPORTS[2:]]
+        batches = [ControlRouterReportBatch.construct(samples, is_numpy=False)]
+
+        if ControlRouterReportBatch.is_numpy_available():
+            batches.append(ControlRouterReportBatch.construct(samples, is_numpy=True))
+
+        return batches
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_construct(self):
+        for batch in self.__batches():
+            self.assertEqual(4, len(batch))
+            self.assertEqual([100, 400, 900, 200], list(batch.column('main_current')))
+
+
+    def test_statistics(self):
+        for batch in self.__batches():
+            self.assertEqual(30, batch.min('temperature'))
+            self.assertEqual(800, batch.max('filtered_main_current'))
+            self.assertEqual(425.0, batch.mean('filtered_main_current'))
+
+
+    def test_rolling_mean(self):
+        for batch in self.__batches():
+            self.assertEqual([200.0, 550.0, 650.0], list(batch.rolling_mean('filtered_main_current', 2)))
+            self.assertEqual(0, len(batch.rolling_mean('filtered_main_current', 5)))
+
+
+    def test_thresholds(self):
+        for batch in self.__batches():
+            self.assertEqual([2, 3], list(batch.overcurrent(400)))
+            self.assertEqual([2], list(batch.short_circuits()))
+            self.assertEqual([2, 3], list(batch.flagged('central_state', 0x06)))
+
+
+    def test_tail_and_concatenate(self):
+        for batch in self.__batches():
+            tail = batch.tail(2)
+            self.assertEqual([800, 500], list(tail.column('filtered_main_current')))
+
+            joined = ControlRouterReportBatch.concatenate([batch, tail])
+            self.assertEqual(6, len(joined))
+            self.assertEqual(batch.is_numpy, joined.is_numpy)
+
+
+    def test_empty(self):
+        batch = ControlRouterReportBatch.construct([])
+
+        self.assertEqual(0, len(batch))
+
+        with self.assertRaises(ValueError):
+            batch.mean('temperature')
+
+
+    def test_unknown_field(self):
+        for batch in self.__batches():
+            with self.assertRaises(ValueError):
+                batch.max('reserved')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/equipment/test_equipment_report_stream.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import json
+import unittest
+
+from mrcs_core.equipment.equipment_report_stream import EquipmentReportStream
+from mrcs_core.equipment.track.track_enums import TrackMode
+from mrcs_core.equipment.track.track_report import TrackReport
+from mrcs_core.equipment.turnout.turnout_enums import TurnoutPosition
+from mrcs_core.equipment.turnout.turnout_report import TurnoutReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestEquipmentReportStream(unittest.TestCase):
+    __RECORDS = (
+        '{"type": "TurnoutReport", "addr": 3, "position": "P1"}',
+        '{"type": "TrackReport", "mode": "SHORT_CIRCUIT"}',
+        '{"type": "TurnoutReport", "addr": 4, "position": "P0"}',
+        '{"type": "TurnoutReport", "addr": 5, "position": "P9"}',
+        '{"type": "Unknown", "addr": 3}',
+        '{"addr": 3}',
+        '{"type": "TrackReport", "mo',
+        '',
+        '{"type": "TrackReport", "mode": "POWER_OFF"}',
+    )
+
+    __EXPECTED = [
+        TurnoutReport(3, TurnoutPosition.P1),
+        TrackReport(TrackMode.SHORT_CIRCUIT),
+        TurnoutReport(4, TurnoutPosition.P0),
+        TrackReport(TrackMode.POWER_OFF),
+    ]
+
+
+    def test_lines(self):
+        stream = EquipmentReportStream(batch_size=2)
+        reports = list(stream.decode(self.__RECORDS))
+
+        self.assertEqual(self.__EXPECTED, reports)
+        self.assertEqual({'TurnoutReport': 2, 'TrackReport': 2}, stream.decode_counts)
+        self.assertEqual({'TurnoutReport': 1, 'Unknown': 1, None: 2}, stream.error_counts)
+        self.assertEqual(4, stream.error_count)
+
+
+    def test_line_separators(self):
+        text = '{"type": "TrackReport", "mode": "POWER_ON", "note": "a\u2028b\x85c\u2029d"}\r\n{"type": "x"}\n'
+
+        str_lines = list(EquipmentReportStream.lines([text]))
+        bytes_lines = list(EquipmentReportStream.lines([text.encode()[:20], text.encode()[20:]]))
+
+        self.assertEqual(2, len(str_lines))
+        self.assertEqual([line.encode() for line in str_lines], bytes_lines)
+        self.assertEqual('a\u2028b\x85c\u2029d', json.loads(str_lines[0])['note'])
+
+
+    def test_chunks(self):
+        data = ('\n'.join(self.__RECORDS) + '\n').encode()
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+
+        stream = EquipmentReportStream()
+        reports = list(stream.decode(chunks))
+
+        self.assertEqual(self.__EXPECTED, reports)
+        self.assertEqual(4, stream.error_count)
+
+
+    def test_unterminated_chunk(self):
+        stream = EquipmentReportStream()
+        reports = list(stream.decode([b'{"type": "TrackReport", ', b'"mode": "POWER_OFF"}']))
+
+        self.assertEqual([TrackReport(TrackMode.POWER_OFF)], reports)
+
+
+    def test_multi_line_str(self):
+        stream = EquipmentReportStream()
+        reports = list(stream.decode(['\n'.join(self.__RECORDS)]))
+
+        self.assertEqual(self.__EXPECTED, reports)
+
+
+    def test_reset_counts(self):
+        stream = EquipmentReportStream()
+        list(stream.decode(self.__RECORDS))
+        stream.reset_counts()
+
+        self.assertEqual({}, stream.decode_counts)
+        self.assertEqual(0, stream.error_count)
+
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            EquipmentReportStream(batch_size=0)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/equipment/test_report_change_filter.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import unittest
+
+from mrcs_core.equipment.block.block_enums import BlockVoltage
+from mrcs_core.equipment.block.block_id import BlockID
+from mrcs_core.equipment.block.block_report import BlockVoltageReport
+from mrcs_core.equipment.motive_power_unit.mpu_decoder_report import MPUDecoderReport
+from mrcs_core.equipment.report_change_filter import ReportChangeFilter
+from mrcs_core.equipment.report_delta import ReportDelta
+from mrcs_core.messaging.message import Message
+from mrcs_core.messaging.routing_key import PublicationRoutingKey
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestReportChangeFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 0.0
+        self.routing_key = PublicationRoutingKey.construct_from_jdict('CRT.001.001.MLG.*.*')
+
+
+    def change_filter(self, is_delta=False):
+        return ReportChangeFilter(keyframe_interval=5.0, is_delta=is_delta, clock=lambda: self.now)
+
+
+    def mpu_message(self, address, speed):
+        return Message(self.routing_key, MPUDecoderReport(address, 456, 789, 0xab, speed, 5), origin='origin')
+
+
+    def block_message(self, channel, voltage):
+        return Message(self.routing_key, BlockVoltageReport(BlockID(5, channel, 0x1234), voltage))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_repeat(self):
+        change_filter = self.change_filter()
+
+        self.assertIsNotNone(change_filter.filter(self.mpu_message(3, 90)))
+        self.assertIsNone(change_filter.filter(self.mpu_message(3, 90)))
+        self.assertIsNone(change_filter.filter(self.mpu_message(3, 90)))
+
+        self.assertEqual({'keyframe': 1, 'repeat': 2}, change_filter.counts)
+
+
+    def test_identity(self):
+        change_filter = self.change_filter()
+        free = BlockVoltage.FREE_WITH_VOLTAGE
+        messages = [self.block_message(1, free), self.block_message(2, free), self.block_message(1, free),
+                    self.mpu_message(3, 90), self.mpu_message(4, 90)]
+
+        self.assertEqual(4, len(change_filter.filter_batch(messages)))
+        self.assertEqual(4, len(change_filter))
+
+
+    def test_change(self):
+        change_filter = self.change_filter()
+        change_filter.filter(self.mpu_message(3, 90))
+
+        message = change_filter.filter(self.mpu_message(3, 91))
+        self.assertEqual(91, message.body.speed)
+
+
+    def test_delta(self):
+        change_filter = self.change_filter(is_delta=True)
+        change_filter.filter(self.mpu_message(3, 90))
+
+        message = change_filter.filter(self.mpu_message(3, 91))
+        self.assertEqual(ReportDelta('MPUDecoderReport', 3, 1, {'speed': 91}, []), message.body)
+        self.assertEqual('origin', message.origin)
+
+        message = change_filter.filter(self.mpu_message(3, 92))
+        self.assertEqual(2, message.body.seq)
+
+
+    def test_keyframe(self):
+        change_filter = self.change_filter(is_delta=True)
+        change_filter.filter(self.mpu_message(3, 90))
+
+        self.now = 4.9
+        self.assertIsNone(change_filter.filter(self.mpu_message(3, 90)))
+
+        self.now = 5.0
+        message = change_filter.filter(self.mpu_message(3, 90))
+        self.assertIsInstance(message.body, MPUDecoderReport)
+
+        self.now = 6.0
+        message = change_filter.filter(self.mpu_message(3, 91))
+        self.assertEqual(1, message.body.seq)
+
+
+    def test_other(self):
+        change_filter = self.change_filter()
+        message = Message(self.routing_key, {'field': 'test'})
+
+        self.assertIs(message, change_filter.filter(message))
+        self.assertIs(message, change_filter.filter(message))
+        self.assertEqual({'other': 2}, change_filter.counts)
+
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            ReportChangeFilter(keyframe_interval=0)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/equipment/test_report_delta_decoder.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import unittest
+
+from mrcs_core.data.json import JSONify
+from mrcs_core.equipment.block.block_enums import BlockVoltage
+from mrcs_core.equipment.block.block_id import BlockID
+from mrcs_core.equipment.block.block_report import BlockVoltageReport
+from mrcs_core.equipment.control_router.control_router_report import ControlRouterReport
+from mrcs_core.equipment.equipment_report import EquipmentReport
+from mrcs_core.equipment.report_change_filter import ReportChangeFilter
+from mrcs_core.equipment.report_delta_decoder import ReportDeltaDecoder
+from mrcs_core.messaging.message import Message
+from mrcs_core.messaging.routing_key import PublicationRoutingKey
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestReportDeltaDecoder(unittest.TestCase):
+
+    def setUp(self):
+        self.routing_key = PublicationRoutingKey.construct_from_jdict('CRT.001.001.MLG.*.*')
+        self.change_filter = ReportChangeFilter(is_delta=True)
+
+
+    @staticmethod
+    def wire(message):
+        # as received by a subscriber
+        return Message.construct_from_callback(message.routing_key, message.payload.as_bytes())
+
+
+    def router_message(self, main_current, temperature):
+        report = ControlRouterReport(main_current, 0, main_current, 18000, 17500, temperature, 0, 0, 0x7f, None)
+        return Message(self.routing_key, report)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_round_trip(self):
+        decoder = ReportDeltaDecoder()
+        sent = [self.router_message(100 + i // 3, 30 + i // 5) for i in range(20)]
+
+        received = [decoder.decode(self.wire(message)) for message in self.change_filter.filter_batch(sent)]
+        reports = [EquipmentReport.construct_from_jdict(message.body) for message in received]
+
+        expected = [report for i, report in enumerate(message.body for message in sent)
+                    if i == 0 or JSONify.dumps(report) != JSONify.dumps(sent[i - 1].body)]
+
+        self.assertEqual([JSONify.dumps(report) for report in expected], [JSONify.dumps(report) for report in reports])
+        self.assertEqual({'keyframe': 1, 'delta': len(expected) - 1}, decoder.counts)
+
+
+    def test_block_identity(self):
+        decoder = ReportDeltaDecoder()
+        voltages = (BlockVoltage.FREE_WITH_VOLTAGE, BlockVoltage.OCCUPIED_WITH_VOLTAGE)
+        sent = [Message(self.routing_key, BlockVoltageReport(BlockID(5, channel, 0x1234), voltage))
+                for voltage in voltages for channel in (1, 2)]
+
+        received = [decoder.decode(self.wire(message)) for message in self.change_filter.filter_batch(sent)]
+
+        self.assertEqual(['FREE_WITH_VOLTAGE', 'FREE_WITH_VOLTAGE', 'OCCUPIED_WITH_VOLTAGE', 'OCCUPIED_WITH_VOLTAGE'],
+                         [message.body['voltage'] for message in received])
+        self.assertEqual([1, 2, 1, 2], [message.body['id']['channel'] for message in received])
+
+
+    def test_gap(self):
+        decoder = ReportDeltaDecoder()
+        filtered = self.change_filter.filter_batch([self.router_message(100 + i, 30) for i in range(4)])
+
+        decoder.decode(self.wire(filtered[0]))
+        decoder.decode(self.wire(filtered[1]))
+
+        self.assertIsNone(decoder.decode(self.wire(filtered[3])))  # filtered[2] was lost
+        self.assertIsNone(decoder.decode(self.wire(filtered[2])))  # the state was dropped
+        self.assertEqual(0, len(decoder))
+
+
+    def test_late_join(self):
+        decoder = ReportDeltaDecoder()
+        filtered = self.change_filter.filter_batch([self.router_message(100 + i, 30) for i in range(2)])
+
+        self.assertIsNone(decoder.decode(filtered[1]))
+        self.assertEqual({'gap': 1}, decoder.counts)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/messaging/test_binary_envelope.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import json
+import unittest
+from pathlib import Path
+
+from mrcs_core.equipment.block.block_enums import BlockVoltage
+from mrcs_core.equipment.block.block_id import BlockID
+from mrcs_core.equipment.block.block_report import BlockVoltageReport
+from mrcs_core.equipment.motive_power_unit.mpu_decoder_report import MPUDecoderReport
+from mrcs_core.equipment.track.track_enums import TrackMode
+from mrcs_core.equipment.track.track_report import TrackReport
+from mrcs_core.equipment.turnout.turnout_enums import TurnoutPosition
+from mrcs_core.equipment.turnout.turnout_report import TurnoutReport
+from mrcs_core.messaging.binary_envelope import BinaryEnvelope
+from mrcs_core.messaging.message import Message
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestBinaryEnvelope(unittest.TestCase):
+    __filename1 = Path(__file__).parent / 'data' / 'message.json'
+    with open(__filename1) as fp:
+        __jdict1 = json.load(fp)
+
+    __REPORTS = (
+        TurnoutReport(3, TurnoutPosition.P1),
+        BlockVoltageReport(BlockID(5, 6, 0x1234), BlockVoltage.OCCUPIED_WITH_VOLTAGE),
+        MPUDecoderReport(4660, 456, 789, 171, 90, 5),
+        TrackReport(TrackMode.POWER_ON),
+    )
+
+
+    def test_report_round_trip(self):
+        for report in self.__REPORTS:
+            raw = BinaryEnvelope.encode('fe6114f0-c054', report)
+            origin, body = BinaryEnvelope.decode(raw)
+
+            self.assertEqual('fe6114f0-c054', origin)
+            self.assertEqual(report.as_jdict(), body)
+            self.assertEqual(report, report.construct_from_jdict(body))
+
+
+    def test_report_compact(self):
+        report = TurnoutReport(3, TurnoutPosition.P1)
+        raw = BinaryEnvelope.encode('fe6114f0-c054', report)
+
+        self.assertEqual(3 + 13 + 3, len(raw))
+
+
+    def test_json_fallback(self):
+        bodies = ('hello', {'field': 'test'}, {'type': 'MPUDecoderReport', 'addr': 3, 'received': None}, None)
+
+        for body in bodies:
+            origin, decoded = BinaryEnvelope.decode(BinaryEnvelope.encode('abc', body))
+            self.assertEqual(body, decoded)
+
+
+    def test_inexact_fallback(self):
+        bodies = ({'type': 'TurnoutReport', 'addr': 3, 'position': 'P1', 'extra': 'kept'},
+                  {'type': 'TurnoutReport', 'addr': True, 'position': 'P1'},
+                  {'type': 'MPUDecoderReport', 'addr': 3, 'received': 1.0, 'errors': 0, 'opts': 0, 'speed': 0,
+                   'qos': 0},
+                  {'type': 'BlockVoltageReport', 'id': {'addr': 5, 'channel': 6, 'rid': 7, 'extra': 1},
+                   'voltage': 'OCCUPIED_WITH_VOLTAGE'})
+
+        for body in bodies:
+            raw = BinaryEnvelope.encode('abc', body)
+            origin, decoded = BinaryEnvelope.decode(raw)
+
+            self.assertEqual(0, raw[1])  # travelled as JSON
+            self.assertEqual(body, decoded)
+            self.assertEqual(json.dumps(body), json.dumps(decoded))  # types are kept
+
+
+    def test_decode_invalid(self):
+        for raw in (b'', b'\x01\x00', b'\x02\x00\x00', b'\x01\x7f\x00', b'\x01\x01\x00\x00'):
+            with self.assertRaises(ValueError):
+                BinaryEnvelope.decode(raw)
+
+
+    def test_message_callback(self):
+        obj1 = Message.construct_from_jdict(self.__jdict1)
+        raw = obj1.payload.as_bytes(BinaryEnvelope.CONTENT_TYPE)
+
+        obj2 = Message.construct_from_callback(obj1.routing_key, raw, content_type=BinaryEnvelope.CONTENT_TYPE)
+        self.assertEqual(obj1, obj2)
+
+
+    def test_message_callback_json(self):
+        obj1 = Message.construct_from_jdict(self.__jdict1)
+        raw = obj1.payload.as_bytes()
+
+        obj2 = Message.construct_from_callback(obj1.routing_key, raw)
+        self.assertEqual(obj1, obj2)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,7 +15,7 @@ from pathlib import Path
 
 from mrcs_core.data.json import JSONify
 from mrcs_core.messaging.message import Message
-from mrcs_core.messaging.routing_key import PublicationRoutingKey
+from mrcs_core.messaging.routing_key import PublicationRoutingKey, SubscriptionRoutingKey
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -61,6 +61,30 @@ class TestRoutingKey(unittest.TestCase):
         self.assertFalse(PublicationRoutingKey.is_valid('CRT.*.016.*.*'))
 
 
+    def test_routing_construct_invalid(self):
+        for routing in ('CRT.*.016.*.*', 'CRT.*.016.*.*.*.*', 'XXX.*.016.*.*.*', 'CRT.*.*.*.*.*', 'CRT.* .016.*.*.*'):
+            with self.assertRaises(ValueError):
+                PublicationRoutingKey.construct_from_jdict(routing)
+
+
+    def test_routing_construct_subscription(self):
+        obj1 = SubscriptionRoutingKey.construct_from_jdict('*.*.*.MPU.001.003')
+        self.assertEqual('*.*.*.MPU.001.003', obj1.as_json())
+
+
+    def test_routing_memoised(self):
+        obj1 = PublicationRoutingKey.construct_from_jdict('CRT.*.016.*.*.*')
+        obj2 = PublicationRoutingKey.construct_from_jdict('CRT.*.016.*.*.*')
+        self.assertIs(obj1, obj2)
+
+
+    def test_routing_hash(self):
+        obj1 = PublicationRoutingKey.construct_from_jdict('CRT.*.016.*.*.*')
+        obj2 = SubscriptionRoutingKey.construct_from_jdict('CRT.*.016.*.*.*')
+        self.assertEqual(obj1, obj2)
+        self.assertEqual(hash(obj1), hash(obj2))
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == "__main__":
@@ -0,0 +1,114 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/messaging/test_subscription_index.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import unittest
+
+from mrcs_core.messaging.routing_key import PublicationRoutingKey, SubscriptionRoutingKey
+from mrcs_core.messaging.subscription_index import SubscriptionIndex
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestSubscriptionIndex(unittest.TestCase):
+    __SUBSCRIPTIONS = (
+        ('*.*.*.*.*.*', 'logger'),
+        ('CRT.*.*.*.*.*', 'crt_all'),
+        ('CRT.*.016.*.*.*', 'crt_16'),
+        ('CRT.*.017.*.*.*', 'crt_17'),
+        ('*.*.*.MPU.001.*', 'mpu_sector_1'),
+        ('SCH.*.001.CRN.*.*', 'cron'),
+    )
+
+    __PUBLICATIONS = (
+        'CRT.*.016.*.*.*',
+        'CRT.*.017.MPU.001.003',
+        'SCH.*.001.CRN.*.*',
+        'VIS.001.001.MPU.001.*',
+        'VIS.001.001.MPU.002.*',
+    )
+
+
+    def test_subscribers(self):
+        index = self.__index()
+
+        subscribers = index.subscribers(PublicationRoutingKey.construct_from_jdict('CRT.*.016.*.*.*'))
+        self.assertEqual({'logger', 'crt_all', 'crt_16'}, subscribers)
+
+
+    def test_subscribers_target(self):
+        index = self.__index()
+
+        subscribers = index.subscribers(PublicationRoutingKey.construct_from_jdict('VIS.001.001.MPU.001.*'))
+        self.assertEqual({'logger', 'mpu_sector_1'}, subscribers)
+
+
+    def test_subscribers_match_routing_key(self):
+        index = self.__index()
+
+        for publication in self.__PUBLICATIONS:
+            routing_key = PublicationRoutingKey.construct_from_jdict(publication)
+            expected = {subscriber for subscription, subscriber in self.__SUBSCRIPTIONS
+                        if routing_key.matches(SubscriptionRoutingKey.construct_from_jdict(subscription))}
+
+            self.assertEqual(expected, index.subscribers(routing_key), publication)
+
+
+    def test_len(self):
+        index = self.__index()
+        self.assertEqual(len(self.__SUBSCRIPTIONS), len(index))
+
+        index.add(SubscriptionRoutingKey.construct_from_jdict('*.*.*.*.*.*'), 'logger')  # duplicate
+        self.assertEqual(len(self.__SUBSCRIPTIONS), len(index))
+
+
+    def test_remove(self):
+        index = self.__index()
+        routing_key = PublicationRoutingKey.construct_from_jdict('CRT.*.016.*.*.*')
+
+        self.assertTrue(index.remove(SubscriptionRoutingKey.construct_from_jdict('CRT.*.016.*.*.*'), 'crt_16'))
+        self.assertEqual({'logger', 'crt_all'}, index.subscribers(routing_key))
+        self.assertEqual(len(self.__SUBSCRIPTIONS) - 1, len(index))
+
+
+    def test_remove_missing(self):
+        index = self.__index()
+
+        self.assertFalse(index.remove(SubscriptionRoutingKey.construct_from_jdict('CRT.*.016.*.*.*'), 'crt_17'))
+        self.assertFalse(index.remove(SubscriptionRoutingKey.construct_from_jdict('TST.*.*.*.*.*'), 'logger'))
+        self.assertEqual(len(self.__SUBSCRIPTIONS), len(index))
+
+
+    def test_remove_all(self):
+        index = self.__index()
+
+        for subscription, subscriber in self.__SUBSCRIPTIONS:
+            index.remove(SubscriptionRoutingKey.construct_from_jdict(subscription), subscriber)
+
+        self.assertEqual(0, len(index))
+        self.assertEqual(set(), index.subscribers(PublicationRoutingKey.construct_from_jdict('CRT.*.016.*.*.*')))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __index(cls):
+        index = SubscriptionIndex()
+
+        for subscription, subscriber in cls.__SUBSCRIPTIONS:
+            index.add(SubscriptionRoutingKey.construct_from_jdict(subscription), subscriber)
+
+        return index
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
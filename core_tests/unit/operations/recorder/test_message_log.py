@@ -0,0 +1,187 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/operations/recorder/test_message_log.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta, timezone
+
+from mrcs_core.data.equipment_identity import EquipmentFilter, EquipmentType
+from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.messaging.message import Message
+from mrcs_core.messaging.routing_key import PublicationRoutingKey
+from mrcs_core.operations.recorder.message_log import MessageLog
+from mrcs_core.operations.recorder.message_partitions import MessagePartitions
+from mrcs_core.operations.recorder.message_recorder import MessageRecorder
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestMessageLog(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+
+        # one record per second from 2025-12-31 23:59:45, so fifteen in each of two partitions...
+        rec_ns = iter(range(1767225585_000_000_000, 1767225615_000_000_000, 1_000_000_000))
+        recorder = MessageRecorder(MessagePartitions(self.__dir.name), batch_size=10, capacity=100,
+                                   clock=lambda: next(rec_ns))
+
+        for i in range(30):
+            routing = f'MPU.001.{i % 3:03d}.TRN.{i % 2:03d}.*'
+            recorder.record(Message(PublicationRoutingKey.construct_from_jdict(routing), {'i': i}))
+
+        recorder.close()
+
+        self.__log = MessageLog(MessagePartitions(self.__dir.name))
+
+
+    def tearDown(self):
+        self.__log.close()
+        self.__dir.cleanup()
+
+
+    @staticmethod
+    def rec(second):
+        return ISODatetime(2025, 12, 31, 23, 59, 45, tzinfo=timezone.utc) + timedelta(seconds=second)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_find_all(self):
+        records = list(self.__log.find(page_size=7))
+
+        self.assertEqual(list(range(1, 31)), [record.uid for record in records])
+        self.assertEqual({'i': 0}, records[0].body)
+        self.assertEqual('MPU.001.000.TRN.000.*', records[0].routing_key.as_json())
+        self.assertEqual(self.rec(0), records[0].rec)
+
+
+    def test_rec_range(self):
+        records = list(self.__log.find(start=self.rec(10), end=self.rec(15)))
+
+        self.assertEqual([11, 12, 13, 14, 15], [record.uid for record in records])
+
+
+    def test_rec_range_paged(self):
+        records = list(self.__log.find(start=self.rec(10), end=self.rec(20), page_size=3))
+
+        self.assertEqual(list(range(11, 21)), [record.uid for record in records])
+
+
+    def test_rec_range_clock_step(self):
+        partitions = MessagePartitions(os.path.join(self.__dir.name, 'step'))
+
+        # the system clock steps back by seven seconds after the third message...
+        rec_ns = iter(1767312000_000_000_000 + second * 1_000_000_000 for second in (10, 11, 12, 5, 6, 7))
+        recorder = MessageRecorder(partitions, batch_size=10, capacity=100, clock=lambda: next(rec_ns))
+
+        for i in range(6):
+            recorder.record(Message(PublicationRoutingKey.construct_from_jdict('MPU.001.000.TRN.000.*'), {'i': i}))
+
+        recorder.close()
+
+        log = MessageLog(MessagePartitions(partitions.abs_dir))
+        start = ISODatetime(2026, 1, 2, 0, 0, 6, tzinfo=timezone.utc)
+        end = ISODatetime(2026, 1, 2, 0, 1, 0, tzinfo=timezone.utc)
+
+        for page_size in (1, 2, 500):
+            records = list(log.find(start=start, end=end, page_size=page_size))
+            self.assertEqual([1, 2, 3, 5, 6], [record.uid for record in records])
+
+        self.assertEqual([1, 2, 3, 5, 6], [record.uid for record in log.scan(start=start, end=end, chunk_size=2)])
+        self.assertEqual([2, 3, 5, 6], [record.uid for record in log.page(start=start, end=end, after_uid=1)])
+
+        log.close()
+
+
+    def test_rec_range_empty(self):
+        self.assertEqual([], list(self.__log.find(start=self.rec(50))))
+
+
+    def test_source(self):
+        source = EquipmentFilter(EquipmentType.MPU, 1, 2)
+        records = list(self.__log.find(source=source, page_size=4))
+
+        self.assertEqual(list(range(3, 31, 3)), [record.uid for record in records])
+        self.assertTrue(all(record.routing_key.source.matches(source) for record in records))
+
+
+    def test_target_wildcard(self):
+        target = EquipmentFilter(EquipmentType.TRN, 1, None)
+        records = list(self.__log.find(target=target))
+
+        self.assertEqual(list(range(2, 31, 2)), [record.uid for record in records])
+
+
+    def test_target_no_match(self):
+        self.assertEqual([], list(self.__log.find(target=EquipmentFilter(EquipmentType.SIG, None, None))))
+
+
+    def test_combined(self):
+        records = list(self.__log.find(start=self.rec(0), end=self.rec(12), source=EquipmentFilter.any(),
+                                       target=EquipmentFilter(None, 0, None)))
+
+        self.assertEqual([1, 3, 5, 7, 9, 11], [record.uid for record in records])
+
+
+    def test_keyset(self):
+        page1 = self.__log.page(limit=10)
+        page2 = self.__log.page(after_uid=page1[-1].uid, limit=10)
+
+        self.assertEqual(list(range(11, 21)), [record.uid for record in page2])
+
+
+    def test_plan(self):
+        partitions = MessagePartitions(self.__dir.name)
+
+        self.assertEqual([date(2025, 12, 31), date(2026, 1, 1)], partitions.plan())
+        self.assertEqual([date(2025, 12, 31)], partitions.plan(end=self.rec(15)))  # end is midnight, exclusive
+        self.assertEqual([date(2026, 1, 1)], partitions.plan(start=self.rec(15), end=self.rec(20)))
+        self.assertEqual([], partitions.plan(start=self.rec(86415)))
+
+
+    def test_cross_partition(self):
+        records = list(self.__log.find(start=self.rec(12), end=self.rec(18), page_size=4))
+
+        self.assertEqual([13, 14, 15, 16, 17, 18], [record.uid for record in records])
+
+
+    def test_max_uid(self):
+        partitions = MessagePartitions(self.__dir.name)
+
+        self.assertEqual(15, partitions.max_uid(date(2025, 12, 31)))
+        self.assertEqual(30, partitions.max_uid(date(2026, 1, 1)))
+        self.assertIsNone(partitions.max_uid(date(2026, 1, 2)))
+
+        partitions.close()
+
+
+    def test_keyset_skips_partitions(self):
+        self.assertEqual([21, 22], [record.uid for record in self.__log.page(after_uid=20, limit=2)])
+
+        self.__log.partitions.close()
+        self.__log.page(after_uid=20, limit=2)
+
+        self.assertIn('open:1', str(self.__log.partitions))  # the max uid of the earlier partition is held
+
+
+    def test_missing(self):
+        log = MessageLog(MessagePartitions(os.path.join(self.__dir.name, 'missing')))
+
+        self.assertEqual([], list(log.find()))
+        self.assertFalse(os.path.exists(log.partitions.abs_dir))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/operations/recorder/test_message_log_maintainer.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from mrcs_core.messaging.message import Message
+from mrcs_core.messaging.routing_key import PublicationRoutingKey
+from mrcs_core.operations.recorder.message_log import MessageLog
+from mrcs_core.operations.recorder.message_log_maintainer import MessageLogMaintainer
+from mrcs_core.operations.recorder.message_partitions import MessagePartitions
+from mrcs_core.operations.recorder.message_recorder import MessageRecorder
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestMessageLogMaintainer(unittest.TestCase):
+
+    __DAY = 86400  # seconds
+    __TODAY = 1767225600 + 4 * __DAY  # 2026-01-05 00:00:00
+
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+
+        # one hundred records on each of five days, 2026-01-01 to 2026-01-05...
+        rec_ns = iter((1767225600 + (i // 100) * self.__DAY + i % 100) * 1_000_000_000 for i in range(500))
+        recorder = MessageRecorder(MessagePartitions(self.__dir.name), batch_size=100, capacity=500,
+                                   clock=lambda: next(rec_ns))
+        routing_key = PublicationRoutingKey.construct_from_jdict('MPU.001.001.TRN.*.*')
+
+        for i in range(500):
+            recorder.record(Message(routing_key, {'i': i, 'padding': 'x' * 200}))
+
+        recorder.close()
+
+
+    def tearDown(self):
+        self.__dir.cleanup()
+
+
+    @staticmethod
+    def size(abs_filename):
+        return sum(os.path.getsize(abs_filename + suffix) for suffix in ('', '-wal') if
+                   os.path.exists(abs_filename + suffix))
+
+
+    def maintainer(self, retention_days):
+        return MessageLogMaintainer(MessagePartitions(self.__dir.name), retention_days=retention_days,
+                                    clock=lambda: self.__TODAY)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_retention(self):
+        maintainer = self.maintainer(3)
+        removed, compacted = maintainer.maintain()
+
+        self.assertEqual([date(2026, 1, 1), date(2026, 1, 2)], removed)
+        self.assertEqual([date(2026, 1, 3), date(2026, 1, 4)], compacted)  # not today
+        self.assertEqual([date(2026, 1, 3), date(2026, 1, 4), date(2026, 1, 5)], maintainer.partitions.days())
+
+        self.assertEqual([], [filename for filename in os.listdir(self.__dir.name) if '01-01' in filename])
+
+
+    def test_compaction_once(self):
+        maintainer = self.maintainer(None)
+
+        self.assertEqual(([], [date(2026, 1, d) for d in range(1, 5)]), maintainer.maintain())
+        self.assertEqual(([], []), maintainer.maintain())
+
+
+    def test_compaction_retains_records(self):
+        partitions = MessagePartitions(self.__dir.name)
+
+        with partitions.connection(date(2026, 1, 1)) as connection:
+            connection.execute('DELETE FROM message WHERE uid % 2 = 0')
+
+        size = self.size(partitions.abs_filename(date(2026, 1, 1)))
+
+        self.maintainer(None).maintain()
+
+        self.assertTrue(partitions.is_compacted(date(2026, 1, 1)))
+        self.assertLess(self.size(partitions.abs_filename(date(2026, 1, 1))), size)
+        self.assertEqual(50, len(MessageLog(partitions).page(limit=50)))
+        self.assertEqual(450, len(list(MessageLog(partitions).find())))
+
+
+    def test_removed_while_open(self):
+        log = MessageLog(MessagePartitions(self.__dir.name))
+        self.assertEqual(500, len(list(log.find())))
+
+        self.maintainer(3).maintain()
+        self.assertEqual(300, len(list(log.find())))
+
+
+    def test_uids_continue(self):
+        self.maintainer(1).maintain()
+
+        recorder = MessageRecorder(MessagePartitions(self.__dir.name), clock=lambda: self.__TODAY * 1_000_000_000)
+        recorder.record(Message(PublicationRoutingKey.construct_from_jdict('MPU.001.001.TRN.*.*'), None))
+        recorder.close()
+
+        self.assertEqual(501, list(MessageLog(MessagePartitions(self.__dir.name)).find())[-1].uid)
+
+
+    def test_thread(self):
+        with self.maintainer(1) as maintainer:
+            self.assertTrue(maintainer.is_running)
+
+        self.assertEqual([date(2026, 1, 5)], maintainer.partitions.days())
+
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.maintainer(0)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
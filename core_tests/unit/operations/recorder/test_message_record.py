@@ -57,6 +57,17 @@ class TestMessageRecord(unittest.TestCase):
         self.assertEqual(obj1, obj2)
 
 
+    def test_construct_from_db_row(self):
+        ISODatetime.set_local_zone(timezone.utc)
+        obj1 = MessageRecord.construct_from_db_row((1, '2025-12-31 06:00:00.000', '12345678', 'SCH.*.001.CRN.*.*',
+                                                    '{"field": "test"}'))
+
+        self.assertEqual(1, obj1.uid)
+        self.assertEqual('2025-12-31T06:00:00.000+00:00', obj1.rec.as_json())
+        self.assertEqual('SCH.*.001.CRN.*.*', obj1.routing_key.as_json())
+        self.assertEqual({'field': 'test'}, obj1.body)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == "__main__":
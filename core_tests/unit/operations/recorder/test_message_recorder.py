@@ -0,0 +1,256 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/operations/recorder/test_message_recorder.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import json
+import sqlite3
+import tempfile
+import time
+import unittest
+from datetime import date
+
+from mrcs_core.data.equipment_identity import EquipmentFilter, EquipmentIdentifier, EquipmentType
+from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.messaging.message import Message
+from mrcs_core.messaging.routing_key import PublicationRoutingKey
+from mrcs_core.operations.recorder.message_partitions import MessagePartitions
+from mrcs_core.operations.recorder.message_recorder import MessageRecorder
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class FailingPartitions(MessagePartitions):
+    def __init__(self, abs_dir, failing_day=None, failures=1):
+        super().__init__(abs_dir)
+        self.failing_day = failing_day
+        self.failures = failures
+
+
+    def connection(self, day, create=False):
+        if create and self.failures and (self.failing_day is None or day == self.failing_day):
+            self.failures -= 1
+            raise sqlite3.OperationalError('database is locked')
+
+        return super().connection(day, create=create)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestMessageRecorder(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+
+        source = EquipmentIdentifier(EquipmentType.SCH, None, 1)
+        target = EquipmentFilter(EquipmentType.CRN, None, None)
+        self.__routing_key = PublicationRoutingKey(source, target)
+
+
+    def tearDown(self):
+        self.__dir.cleanup()
+
+
+    def rows(self):
+        partitions = MessagePartitions(self.__dir.name)
+        rows = []
+
+        for day in partitions.days():
+            with sqlite3.connect(partitions.abs_filename(day)) as connection:
+                rows.extend(connection.execute('SELECT uid, rec, origin, routing, body FROM message ORDER BY uid'))
+
+        return rows
+
+
+    def recorder(self, **kwargs):
+        return MessageRecorder(MessagePartitions(self.__dir.name), batch_size=10, **kwargs)
+
+
+    def message(self, i):
+        return Message(self.__routing_key, {'i': i}, origin=f'{i:08d}')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_flush(self):
+        recorder = self.recorder(capacity=100)
+        start = time.time()
+
+        for i in range(25):
+            recorder.record(self.message(i))
+
+        self.assertEqual(25, len(recorder))
+        self.assertEqual(25, recorder.flush())
+        self.assertEqual(0, recorder.flush())
+        recorder.close()
+
+        rows = self.rows()
+        self.assertEqual(list(range(1, 26)), [row[0] for row in rows])
+        self.assertEqual([{'i': i} for i in range(25)], [json.loads(row[4]) for row in rows])
+        self.assertEqual(('00000000', 'SCH.*.001.CRN.*.*'), rows[0][2:4])
+
+        rec = ISODatetime.construct_from_db_field(rows[0][1])
+        self.assertLess(abs(rec.timestamp() - start), 1.0)
+
+
+    def test_uids_continue(self):
+        recorder = self.recorder(capacity=100)
+        recorder.record(self.message(0))
+        recorder.close()
+
+        recorder = self.recorder(capacity=100)
+        recorder.record(self.message(1))
+        recorder.close()
+
+        self.assertEqual([1, 2], [row[0] for row in self.rows()])
+
+
+    def test_capacity(self):
+        recorder = self.recorder(capacity=20)
+
+        for i in range(45):
+            recorder.record(self.message(i))  # the recording thread never writes
+
+        self.assertEqual(20, len(recorder))
+        self.assertEqual(25, recorder.dropped)  # the oldest
+        recorder.close()
+
+        self.assertEqual([{'i': i} for i in range(25, 45)], [json.loads(row[4]) for row in self.rows()])
+
+
+    def test_batch_size(self):
+        with self.recorder(max_latency=60, capacity=100) as recorder:
+            for i in range(10):
+                recorder.record(self.message(i))
+
+            for _ in range(100):
+                if not len(recorder):
+                    break
+                time.sleep(0.01)
+
+            self.assertEqual(0, len(recorder))
+
+        recorder.close()
+        self.assertEqual(10, len(self.rows()))
+
+
+    def test_max_latency(self):
+        with self.recorder(max_latency=0.05, capacity=100) as recorder:
+            recorder.record(self.message(0))
+
+            time.sleep(0.5)
+            self.assertEqual(0, len(recorder))
+
+        recorder.close()
+        self.assertEqual(1, len(self.rows()))
+
+
+    def test_partition_by_day(self):
+        rec_ns = iter(range(1767225599_998_000_000, 1767225600_004_000_000, 1_000_000))  # to 2026-01-01 00:00:00.003
+        recorder = self.recorder(capacity=100, clock=lambda: next(rec_ns))
+
+        for i in range(6):
+            recorder.record(self.message(i))
+
+        recorder.close()
+
+        self.assertEqual([date(2025, 12, 31), date(2026, 1, 1)], MessagePartitions(self.__dir.name).days())
+
+        rows = self.rows()
+        self.assertEqual(list(range(1, 7)), [row[0] for row in rows])
+        self.assertEqual(['2025-12-31 23:59:59.998', '2025-12-31 23:59:59.999', '2026-01-01 00:00:00.000'],
+                         [row[1] for row in rows[:3]])
+
+
+    def test_write_failure(self):
+        recorder = MessageRecorder(FailingPartitions(self.__dir.name), batch_size=10, capacity=100)
+
+        for i in range(5):
+            recorder.record(self.message(i))
+
+        with self.assertRaises(sqlite3.OperationalError):
+            recorder.flush()
+
+        self.assertEqual(5, len(recorder))  # retained, not lost
+
+        recorder.record(self.message(5))
+
+        self.assertEqual(6, recorder.flush())
+        recorder.close()
+
+        self.assertEqual([{'i': i} for i in range(6)], [json.loads(row[4]) for row in self.rows()])
+
+
+    def test_write_failure_partial(self):
+        rec_ns = iter(range(1767225599_998_000_000, 1767225600_004_000_000, 1_000_000))
+        partitions = FailingPartitions(self.__dir.name, failing_day=date(2026, 1, 1))
+        recorder = MessageRecorder(partitions, batch_size=10, capacity=100, clock=lambda: next(rec_ns))
+
+        for i in range(6):
+            recorder.record(self.message(i))
+
+        with self.assertRaises(sqlite3.OperationalError):
+            recorder.flush()
+
+        self.assertEqual(4, len(recorder))  # only those of the partition that was not written
+
+        self.assertEqual(4, recorder.flush())
+        recorder.close()
+
+        rows = self.rows()
+        self.assertEqual(list(range(1, 7)), [row[0] for row in rows])
+        self.assertEqual([{'i': i} for i in range(6)], [json.loads(row[4]) for row in rows])
+
+
+    def test_write_failure_at_capacity(self):
+        recorder = MessageRecorder(FailingPartitions(self.__dir.name), batch_size=10, capacity=10)
+
+        for i in range(10):
+            recorder.record(self.message(i))
+
+        with self.assertRaises(sqlite3.OperationalError):
+            recorder.flush()
+
+        for i in range(10, 15):
+            recorder.record(self.message(i))
+
+        self.assertEqual(10, len(recorder))  # restored within capacity
+        self.assertEqual(5, recorder.dropped)
+        recorder.close()
+
+        self.assertEqual([{'i': i} for i in range(5, 15)], [json.loads(row[4]) for row in self.rows()])
+
+
+    def test_write_failure_retry(self):
+        partitions = FailingPartitions(self.__dir.name, failures=2)
+
+        with MessageRecorder(partitions, batch_size=10, max_latency=0.02, capacity=100) as recorder:
+            recorder.record(self.message(0))
+
+            for _ in range(200):
+                if not len(recorder):
+                    break
+                time.sleep(0.01)
+
+            self.assertEqual(0, len(recorder))  # written by the recorder thread, after two failures
+
+        recorder.close()
+        self.assertEqual(0, partitions.failures)
+        self.assertEqual(1, len(self.rows()))
+
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.recorder(capacity=5)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
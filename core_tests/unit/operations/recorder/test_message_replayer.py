@@ -0,0 +1,108 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/operations/recorder/test_message_replayer.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import tempfile
+import time
+import unittest
+
+from mrcs_core.messaging.message import Message
+from mrcs_core.messaging.routing_key import PublicationRoutingKey
+from mrcs_core.operations.recorder.message_log import MessageLog
+from mrcs_core.operations.recorder.message_partitions import MessagePartitions
+from mrcs_core.operations.recorder.message_recorder import MessageRecorder
+from mrcs_core.operations.recorder.message_replayer import MessageReplayer
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestMessageReplayer(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+
+        # one record per second from 2025-12-31 06:00:00, with 250 ms jitter on odd uids...
+        rec_ns = iter((1767160800 + i) * 1_000_000_000 + (250_000_000 if i % 2 == 0 else 0) for i in range(20))
+        recorder = MessageRecorder(MessagePartitions(self.__dir.name), batch_size=10, capacity=100,
+                                   clock=lambda: next(rec_ns))
+        routing_key = PublicationRoutingKey.construct_from_jdict('MPU.001.001.TRN.*.*')
+
+        for i in range(20):
+            recorder.record(Message(routing_key, {'i': i}))
+
+        recorder.close()
+
+        self.__log = MessageLog(MessagePartitions(self.__dir.name))
+
+
+    def tearDown(self):
+        self.__log.close()
+        self.__dir.cleanup()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_scan(self):
+        records = list(self.__log.scan(chunk_size=6))
+
+        self.assertEqual(list(range(1, 21)), [record.uid for record in records])
+        self.assertEqual(1767160800250, records[0].rec_millis)
+        self.assertEqual(1767160801000, records[1].rec_millis)
+        self.assertEqual(b'{"i":0}', records[0].raw_body)
+
+
+    def test_unpaced(self):
+        published = []
+        replayer = MessageReplayer(self.__log, published.append, speed=None)
+
+        start = time.monotonic()
+        self.assertEqual(20, replayer.run())
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        self.assertEqual([{'i': i} for i in range(20)], [record.body for record in published])
+
+
+    def test_paced(self):
+        published = []
+        replayer = MessageReplayer(self.__log, lambda record: published.append(time.monotonic()), speed=20)
+
+        self.assertEqual(5, replayer.run(after_uid=10, end=self.__log.page(after_uid=15, limit=1)[0].rec))
+
+        periods = [published[i] - published[0] for i in range(5)]
+        for i, expected in enumerate((0.0, 0.0375, 0.1, 0.1375, 0.2)):  # recorded periods / 20
+            self.assertGreaterEqual(periods[i], expected - 0.001)
+            self.assertLess(periods[i], expected + 0.05)
+
+
+    def test_stop(self):
+        published = []
+        replayer = None
+
+        def publish(record):
+            published.append(record)
+
+            if record.uid == 3:
+                replayer.stop()
+
+        replayer = MessageReplayer(self.__log, publish, speed=None)
+
+        self.assertEqual(3, replayer.run())
+        self.assertEqual([1, 2, 3], [record.uid for record in published])
+
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            MessageReplayer(self.__log, print, speed=0)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/operations/recorder/test_replay_record.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import unittest
+from datetime import timezone
+
+from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.messaging.message import Message
+from mrcs_core.operations.recorder.replay_record import ReplayRecord
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestReplayRecord(unittest.TestCase):
+
+    def test_decode(self):
+        obj1 = ReplayRecord(1, 1767160800000, '12345678', 'SCH.*.001.CRN.*.*', b'{"field":"test"}')
+
+        self.assertEqual({'field': 'test'}, obj1.body)
+        self.assertEqual('SCH.*.001.CRN.*.*', obj1.routing_key.as_json())
+        self.assertEqual(ISODatetime(2025, 12, 31, 6, 0, tzinfo=timezone.utc), obj1.rec)
+
+
+    def test_as_bytes(self):
+        obj1 = ReplayRecord(1, 1767160800000, 'abc"def', 'SCH.*.001.CRN.*.*', b'{"field":"test"}')
+        message = Message.construct_from_callback(obj1.routing_key, obj1.as_bytes())
+
+        self.assertEqual('abc"def', message.origin)
+        self.assertEqual({'field': 'test'}, message.body)
+
+
+    def test_as_message_record(self):
+        obj1 = ReplayRecord(1, 1767160800000, '12345678', 'SCH.*.001.CRN.*.*', None)
+        record = obj1.as_message_record()
+
+        self.assertEqual(1, record.uid)
+        self.assertEqual(None, record.body)
+        self.assertEqual(b'{"origin":"12345678","body":null}', obj1.as_bytes())
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
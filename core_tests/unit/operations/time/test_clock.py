@@ -14,6 +14,7 @@ import json
 import time
 import unittest
 from datetime import timedelta
+from unittest import mock
 
 from mrcs_core.data.iso_datetime import ISODatetime
 from mrcs_core.data.json import JSONify
@@ -146,6 +147,27 @@ class TestClockConf(unittest.TestCase):
         self.assertLess(t2 - t1, timedelta(seconds=1.1))
 
 
+    def test_model_period_ns(self):
+        obj1 = Clock.set(True, 4, 2020, 2, 4, 6)
+
+        monotonic_ns = time.monotonic_ns()
+
+        with mock.patch('time.monotonic_ns', return_value=monotonic_ns):
+            p1 = obj1.model_period_ns()
+
+        with mock.patch('time.monotonic_ns', return_value=monotonic_ns + 100_000_000):
+            p2 = obj1.model_period_ns()
+            t2 = obj1.now()
+
+        self.assertEqual(p2 - p1, 400_000_000)
+        self.assertEqual(t2, obj1.model_start + timedelta(microseconds=p2 // 1000))
+
+
+    def test_model_period_ns_unset(self):
+        obj1 = Clock.construct_from_jdict(None)
+        self.assertIsNone(obj1.model_period_ns())
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/operations/time/test_cron_scheduler.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import threading
+import unittest
+from datetime import timedelta
+
+from mrcs_core.operations.time.clock import Clock
+from mrcs_core.operations.time.cron_scheduler import CronScheduler
+from mrcs_core.operations.time.cronjob import Cronjob
+from mrcs_core.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestCronScheduler(unittest.TestCase):
+
+    def test_pop_due(self):
+        clock = Clock.set(True, 1, 2020, 2, 4, 6)
+        scheduler = CronScheduler(clock, None)
+        now = clock.now()
+
+        scheduler.schedule(Cronjob(None, 'b', now - timedelta(seconds=1)))
+        scheduler.schedule(Cronjob(None, 'c', now + timedelta(hours=1)))
+        scheduler.schedule(Cronjob(None, 'a', now - timedelta(seconds=2)))
+
+        self.assertEqual(['a', 'b'], [job.event_id for job in scheduler.pop_due()])
+        self.assertEqual([], scheduler.pop_due())
+        self.assertEqual('c', scheduler.next_job().event_id)
+        self.assertEqual(1, len(scheduler))
+
+
+    def test_cancel(self):
+        clock = Clock.set(True, 1, 2020, 2, 4, 6)
+        scheduler = CronScheduler(clock, None)
+        now = clock.now()
+
+        scheduler.schedule(Cronjob(None, 'a', now - timedelta(seconds=1)))
+        scheduler.schedule(Cronjob(None, 'b', now - timedelta(seconds=1)))
+
+        self.assertTrue(scheduler.cancel(None, 'a'))
+        self.assertFalse(scheduler.cancel(None, 'a'))
+        self.assertEqual(['b'], [job.event_id for job in scheduler.pop_due()])
+
+
+    def test_compaction(self):
+        clock = Clock.set(True, 1, 2020, 2, 4, 6)
+        scheduler = CronScheduler(clock, None)
+        now = clock.now()
+
+        for i in range(1000):
+            scheduler.schedule(Cronjob(None, str(i), now + timedelta(minutes=i)))
+
+        for i in range(999):
+            scheduler.cancel(None, str(i))
+
+        self.assertEqual(1, len(scheduler))
+        self.assertEqual('999', scheduler.next_job().event_id)
+
+
+    def test_reschedule(self):
+        clock = Clock.set(True, 1, 2020, 2, 4, 6)
+        scheduler = CronScheduler(clock, None)
+        now = clock.now()
+
+        scheduler.schedule(Cronjob(None, 'a', now - timedelta(seconds=1)))
+        scheduler.schedule(Cronjob(None, 'a', now + timedelta(hours=1)))
+
+        self.assertEqual([], scheduler.pop_due())
+        self.assertEqual(1, len(scheduler))
+
+
+    def test_next_wake(self):
+        clock = Clock.set(True, 4, 2020, 2, 4, 6)
+        scheduler = CronScheduler(clock, None)
+        self.assertIsNone(scheduler.next_wake())
+
+        scheduler.schedule(Cronjob(None, 'a', clock.now() + timedelta(seconds=40)))
+
+        self.assertGreater(scheduler.next_wake(), 9.9)
+        self.assertLessEqual(scheduler.next_wake(), 10.0)
+
+
+    def test_next_wake_paused(self):
+        clock = Clock.set(True, 4, 2020, 2, 4, 6)
+        clock.save(Host)
+        scheduler = CronScheduler(clock, None)
+
+        scheduler.schedule(Cronjob(None, 'a', clock.now() + timedelta(seconds=40)))
+        clock.pause()
+
+        self.assertIsNone(scheduler.next_wake())
+
+
+    def test_dispatch(self):
+        clock = Clock.set(True, 10, 2020, 2, 4, 6)
+        dispatched = []
+        event = threading.Event()
+
+        def on_cronjob(job):
+            dispatched.append(job.event_id)
+            event.set()
+
+        with CronScheduler(clock, on_cronjob) as scheduler:
+            scheduler.schedule(Cronjob(None, 'b', clock.now() + timedelta(hours=1)))
+            scheduler.schedule(Cronjob(None, 'a', clock.now() + timedelta(seconds=2)))  # due in 0.2 true seconds
+
+            self.assertTrue(event.wait(2.0))
+
+        self.assertEqual(['a'], dispatched)
+        self.assertFalse(scheduler.is_running)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
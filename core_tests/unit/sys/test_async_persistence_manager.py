@@ -0,0 +1,130 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/sys/test_async_persistence_manager.py
+
+https://realpython.com/python-testing/
+https://docs.python.org/3/library/unittest.html#unittest.IsolatedAsyncioTestCase
+"""
+
+import tempfile
+import unittest
+from collections import OrderedDict
+
+from mrcs_core.data.json import MultiPersistentJSONable, PersistentJSONable
+from mrcs_core.sys.persistence_manager import ExecutorPersistenceManager, FilesystemPersistenceManager
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TmpHost(FilesystemPersistenceManager):
+    root = None
+
+    @classmethod
+    def mrcs_abs_dir(cls):
+        return cls.root
+
+
+class Sample(PersistentJSONable):
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), 'sample.json'
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        return None if jdict is None else cls(jdict.get('value'))
+
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('value', self.value)])
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Sample:{{value:{self.value}}}'
+
+
+class MultiSample(MultiPersistentJSONable):
+    @classmethod
+    def persistence_location(cls, name):
+        return cls.inventory_dir(), 'multi_sample.json' if name is None else f'{name}_multi_sample.json'
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, name=None):
+        return None if jdict is None else cls(name, jdict.get('value'))
+
+
+    def __init__(self, name, value):
+        super().__init__(name)
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('value', self.value)])
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestAsyncPersistenceManager(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+        TmpHost.root = self.__dir.name
+
+        self.manager = ExecutorPersistenceManager(TmpHost)
+
+
+    def tearDown(self):
+        self.__dir.cleanup()
+
+
+    async def test_round_trip(self):
+        self.assertFalse(await Sample.exists_async(self.manager))
+        self.assertIsNone(await Sample.load_async(self.manager))
+
+        await Sample(42).save_async(self.manager)
+
+        self.assertTrue(await Sample.exists_async(self.manager))
+
+        obj = await Sample.load_async(self.manager)
+        self.assertEqual(42, obj.value)
+        self.assertIsNotNone(obj.last_modified)
+        self.assertEqual(42, Sample.load(TmpHost).value)
+
+        await Sample.delete_async(self.manager)
+        self.assertFalse(Sample.exists(TmpHost))
+
+
+    async def test_on_save_complete(self):
+        saved = []
+        await Sample(1).save_async(self.manager, on_save_complete=saved.append)
+
+        self.assertEqual(1, len(saved))
+
+
+    async def test_multi(self):
+        await MultiSample('a', 1).save_async(self.manager)
+        await MultiSample('b', 2).save_async(self.manager)
+
+        self.assertEqual(('a', 'b'), await MultiSample.list_async(self.manager))
+        self.assertEqual(('a', 'b'), MultiSample.list(TmpHost))
+
+        obj = await MultiSample.load_async(self.manager, name='b')
+        self.assertEqual(('b', 2), (obj.name, obj.value))
+
+        await MultiSample.delete_async(self.manager, name='a')
+        self.assertEqual(('b',), await MultiSample.list_async(self.manager))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/sys/test_atomic_writer.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+
+from mrcs_core.sys.atomic_writer import AtomicWriter, SyncPolicy
+from mrcs_core.sys.persistence_manager import FilesystemPersistenceManager
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TmpHost(FilesystemPersistenceManager):
+    root = None
+
+    @classmethod
+    def mrcs_abs_dir(cls):
+        return cls.root
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestAtomicWriter(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+        self.root = self.__dir.name
+
+        TmpHost.root = self.root
+
+
+    def tearDown(self):
+        self.__dir.cleanup()
+
+
+    def __read(self, *path):
+        with open(os.path.join(self.root, *path)) as f:
+            return f.read()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_write(self):
+        for policy in SyncPolicy:
+            abs_filename = os.path.join(self.root, f'{policy}.json')
+
+            AtomicWriter.write(abs_filename, '{"a": 1}', policy=policy)
+            AtomicWriter.write(abs_filename, '{"a": 2}', policy=policy)
+
+            self.assertEqual('{"a": 2}', self.__read(f'{policy}.json'))
+
+        self.assertEqual(['DATA.json', 'FULL.json', 'NONE.json'], sorted(os.listdir(self.root)))
+
+
+    def test_concurrent(self):
+        abs_filename = os.path.join(self.root, 'burst.json')
+
+        def burst(value):
+            for _ in range(50):
+                AtomicWriter.write(abs_filename, str(value))
+
+        threads = [threading.Thread(target=burst, args=(i,)) for i in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertIn(self.__read('burst.json'), ('0', '1', '2', '3'))
+        self.assertEqual(['burst.json'], os.listdir(self.root))
+
+
+    def test_batch(self):
+        with AtomicWriter(SyncPolicy.DATA) as writer:
+            writer.stage(os.path.join(self.root, 'a.json'), 'a')
+            writer.stage(os.path.join(self.root, 'b.json'), 'b')
+
+            self.assertEqual(2, writer.staged_count)
+            self.assertFalse(os.path.exists(os.path.join(self.root, 'a.json')))
+
+        self.assertEqual(('a', 'b'), (self.__read('a.json'), self.__read('b.json')))
+        self.assertEqual(['a.json', 'b.json'], sorted(os.listdir(self.root)))
+
+
+    def test_abort(self):
+        with self.assertRaises(RuntimeError):
+            with AtomicWriter() as writer:
+                writer.stage(os.path.join(self.root, 'a.json'), 'a')
+                raise RuntimeError('abandoned')
+
+        self.assertEqual([], os.listdir(self.root))
+
+
+    def test_missing_directory(self):
+        with self.assertRaises(FileNotFoundError):
+            AtomicWriter.write(os.path.join(self.root, 'missing', 'a.json'), 'a')
+
+
+    def test_manager_save_all(self):
+        TmpHost.save_all((('{"n": 1}', 'conf', 'one.json'), ('{"n": 2}', 'inventory', 'two.json')),
+                         sync_policy=SyncPolicy.FULL)
+
+        self.assertEqual('{"n": 1}\n', self.__read('conf', 'one.json'))
+        self.assertEqual('{"n": 2}\n', self.__read('inventory', 'two.json'))
+        self.assertEqual(['one.json'], os.listdir(os.path.join(self.root, 'conf')))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
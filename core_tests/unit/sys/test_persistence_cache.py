@@ -0,0 +1,187 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/sys/test_persistence_cache.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import os
+import tempfile
+import unittest
+from collections import OrderedDict
+
+from mrcs_core.data.json import PersistentJSONable
+from mrcs_core.sys.persistence_cache import PersistenceCache
+from mrcs_core.sys.persistence_manager import FilesystemPersistenceManager
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CountingHost(FilesystemPersistenceManager):
+    root = None
+    loads = 0
+
+    @classmethod
+    def mrcs_abs_dir(cls):
+        return cls.root
+
+
+    @classmethod
+    def load(cls, dirname, filename, encryption_key=None):
+        cls.loads += 1
+        return super().load(dirname, filename, encryption_key=encryption_key)
+
+
+class Sample(PersistentJSONable):
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), 'sample.json'
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        return None if jdict is None else cls(jdict.get('value'))
+
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('value', self.value)])
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Sample:{{value:{self.value}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestPersistenceCache(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+
+        CountingHost.root = self.__dir.name
+        CountingHost.loads = 0
+
+        PersistenceCache.clear()
+
+
+    def tearDown(self):
+        PersistenceCache.clear()
+        self.__dir.cleanup()
+
+
+    def test_cached(self):
+        Sample(1).save(CountingHost)
+
+        obj1 = Sample.load(CountingHost)
+        obj2 = Sample.load(CountingHost)
+
+        self.assertEqual((1, 1), (obj1.value, obj2.value))
+        self.assertIsNot(obj1, obj2)
+        self.assertEqual(obj1.last_modified, obj2.last_modified)
+        self.assertEqual(1, CountingHost.loads)
+
+
+    def test_invalidated_on_save(self):
+        Sample(1).save(CountingHost)
+        Sample.load(CountingHost)
+
+        Sample(2).save(CountingHost)
+
+        self.assertEqual(2, Sample.load(CountingHost).value)
+        self.assertEqual(2, CountingHost.loads)
+
+
+    def test_invalidated_on_delete(self):
+        Sample(1).save(CountingHost)
+        Sample.load(CountingHost)
+
+        Sample.delete(CountingHost)
+
+        self.assertIsNone(Sample.load(CountingHost))
+        self.assertEqual(0, PersistenceCache.size())
+
+
+    def test_external_change(self):
+        Sample(1).save(CountingHost)
+        Sample.load(CountingHost)
+
+        abs_filename = CountingHost.abs_filename(*Sample.persistence_location())
+        with open(abs_filename, 'w') as f:
+            f.write('{"value": 22}\n')
+
+        self.assertEqual(22, Sample.load(CountingHost).value)
+        self.assertEqual(2, CountingHost.loads)
+
+
+    def test_external_touch(self):
+        Sample(1).save(CountingHost)
+        Sample.load(CountingHost)
+
+        abs_filename = CountingHost.abs_filename(*Sample.persistence_location())
+        stat = os.stat(abs_filename)
+        os.utime(abs_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        Sample.load(CountingHost)
+        self.assertEqual(2, CountingHost.loads)
+
+
+    def test_external_replace(self):
+        Sample(1).save(CountingHost)
+        Sample.load(CountingHost)
+
+        abs_filename = CountingHost.abs_filename(*Sample.persistence_location())
+        stat = os.stat(abs_filename)
+
+        # another process replaces the document, with one of the same size and mtime...
+        with open(abs_filename) as f:
+            text = f.read()
+
+        tmp_filename = abs_filename + '.tmp'
+        with open(tmp_filename, 'w') as f:
+            f.write(text.replace('1', '2'))
+
+        os.utime(tmp_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp_filename, abs_filename)
+
+        self.assertEqual(2, Sample.load(CountingHost).value)
+        self.assertEqual(2, CountingHost.loads)
+
+
+    def test_encryption_key(self):
+        signature = (1, 2)
+        PersistenceCache.put(CountingHost, 'conf', 'x.json', 'key1', signature, {'value': 1}, None)
+
+        self.assertEqual(({'value': 1}, None), PersistenceCache.get(CountingHost, 'conf', 'x.json', 'key1', signature))
+        self.assertIsNone(PersistenceCache.get(CountingHost, 'conf', 'x.json', 'key2', signature))
+        self.assertIsNone(PersistenceCache.get(CountingHost, 'conf', 'x.json', None, signature))
+
+        entries = PersistenceCache._PersistenceCache__entries
+        self.assertNotIn('key1', entries[CountingHost.abs_filename('conf', 'x.json')])  # only a digest is held
+
+
+    def test_disabled(self):
+        Sample(1).save(CountingHost)
+
+        PersistenceCache.set_enabled(False)
+        try:
+            Sample.load(CountingHost)
+            Sample.load(CountingHost)
+        finally:
+            PersistenceCache.set_enabled(True)
+
+        self.assertEqual(2, CountingHost.loads)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
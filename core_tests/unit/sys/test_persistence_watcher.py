@@ -0,0 +1,161 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/sys/test_persistence_watcher.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import queue
+import tempfile
+import unittest
+from collections import OrderedDict
+
+from mrcs_core.data.json import MultiPersistentJSONable, PersistentJSONable
+from mrcs_core.sys.persistence_manager import FilesystemPersistenceManager
+from mrcs_core.sys.persistence_watcher import InotifyPersistenceWatcher, PersistenceChange, \
+    PersistenceChangeKind, PollingPersistenceWatcher
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TmpHost(FilesystemPersistenceManager):
+    root = None
+
+    @classmethod
+    def mrcs_abs_dir(cls):
+        return cls.root
+
+
+class Sample(PersistentJSONable):
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), 'sample.json'
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        return None if jdict is None else cls(jdict.get('value'))
+
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('value', self.value)])
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Sample:{{value:{self.value}}}'
+
+
+class MultiSample(MultiPersistentJSONable):
+    @classmethod
+    def persistence_location(cls, name):
+        return cls.inventory_dir(), 'multi_sample.json' if name is None else f'{name}_multi_sample.json'
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, name=None):
+        return None if jdict is None else cls(name, jdict.get('value'))
+
+
+    def __init__(self, name, value):
+        super().__init__(name)
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('value', self.value)])
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestPersistenceWatcher(unittest.TestCase):
+    __TIMEOUT = 5.0
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+        TmpHost.root = self.__dir.name
+
+
+    def tearDown(self):
+        self.__dir.cleanup()
+
+
+    def __watchers(self):
+        watchers = [PollingPersistenceWatcher(TmpHost, poll_interval=0.02)]
+
+        if InotifyPersistenceWatcher.is_available():
+            watchers.append(InotifyPersistenceWatcher(TmpHost))
+
+        return watchers
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def test_single(self):
+        for watcher in self.__watchers():
+            changes = queue.Queue()
+
+            with watcher:
+                watcher.subscribe(Sample, changes.put)
+
+                Sample(1).save(TmpHost)
+                self.assertEqual(PersistenceChange(PersistenceChangeKind.UPDATED, Sample, 'conf', 'sample.json'),
+                                 changes.get(timeout=self.__TIMEOUT), str(watcher))
+
+                Sample.delete(TmpHost)
+                self.assertEqual(PersistenceChangeKind.DELETED, changes.get(timeout=self.__TIMEOUT).kind)
+
+            self.assertFalse(watcher.is_running)
+
+
+    def test_multi(self):
+        for watcher in self.__watchers():
+            all_changes = queue.Queue()
+            b_changes = queue.Queue()
+
+            with watcher:
+                watcher.subscribe(MultiSample, all_changes.put)
+                watcher.subscribe(MultiSample, b_changes.put, name='b')
+
+                MultiSample('a', 1).save(TmpHost)
+                self.assertEqual('a', all_changes.get(timeout=self.__TIMEOUT).name)
+
+                MultiSample('b', 2).save(TmpHost)
+                self.assertEqual('b', all_changes.get(timeout=self.__TIMEOUT).name)
+                self.assertEqual('b', b_changes.get(timeout=self.__TIMEOUT).name)
+
+                self.assertTrue(b_changes.empty())
+
+            MultiSample.delete(TmpHost, name='a')
+            MultiSample.delete(TmpHost, name='b')
+
+
+    def test_unsubscribe(self):
+        watcher = PollingPersistenceWatcher(TmpHost)
+        subscription = watcher.subscribe(Sample, print)
+
+        self.assertTrue(watcher.unsubscribe(subscription))
+        self.assertFalse(watcher.unsubscribe(subscription))
+
+
+    def test_construct(self):
+        watcher = TmpHost.watcher()
+
+        if InotifyPersistenceWatcher.is_available():
+            self.assertIsInstance(watcher, InotifyPersistenceWatcher)
+        else:
+            self.assertIsInstance(watcher, PollingPersistenceWatcher)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
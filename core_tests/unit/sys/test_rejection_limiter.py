@@ -0,0 +1,235 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/sys/test_rejection_limiter.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import asyncio
+import tempfile
+import time
+import unittest
+from collections import OrderedDict
+
+from mrcs_core.data.json import PersistentJSONable
+from mrcs_core.sys.persistence_cache import PersistenceCache
+from mrcs_core.sys.persistence_manager import ExecutorPersistenceManager, FilesystemPersistenceManager
+from mrcs_core.sys.rejection_limiter import RejectionLimiter, RetryAfterError
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+
+    def __call__(self):
+        return self.now
+
+
+class TempHost(FilesystemPersistenceManager):
+    root = None
+
+    @classmethod
+    def mrcs_abs_dir(cls):
+        return cls.root
+
+
+class Secret(PersistentJSONable):
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), 'secret.json'
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        return None if jdict is None else cls(jdict.get('value'))
+
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('value', self.value)])
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Secret:{{value:{self.value}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestRejectionLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.__clock = Clock()
+        self.__limiter = RejectionLimiter(base_delay=2.0, max_delay=10.0, decay_interval=60.0, clock=self.__clock)
+
+
+    def test_backoff(self):
+        self.__limiter.check('a')
+
+        self.assertEqual(2.0, self.__limiter.record_failure('a'))
+        self.assertEqual(4.0, self.__limiter.record_failure('a'))
+        self.assertEqual(8.0, self.__limiter.record_failure('a'))
+        self.assertEqual(10.0, self.__limiter.record_failure('a'))
+
+        with self.assertRaises(RetryAfterError) as context:
+            self.__limiter.check('a')
+
+        self.assertEqual(10.0, context.exception.retry_after)
+        self.assertIsInstance(context.exception, KeyError)
+
+
+    def test_subjects_independent(self):
+        self.__limiter.record_failure('a')
+
+        self.__limiter.check('b')
+        self.assertEqual(0.0, self.__limiter.retry_after('b'))
+
+
+    def test_expiry(self):
+        self.__limiter.record_failure('a')
+
+        self.__clock.now += 1.5
+        self.assertEqual(0.5, self.__limiter.retry_after('a'))
+
+        self.__clock.now += 0.5
+        self.__limiter.check('a')
+
+
+    def test_success_and_decay(self):
+        self.__limiter.record_failure('a')
+        self.__limiter.record_success('a')
+        self.assertEqual(2.0, self.__limiter.record_failure('a'))
+
+        self.__clock.now += 61.0
+        self.assertEqual(2.0, self.__limiter.record_failure('a'))
+
+
+    def test_allowance(self):
+        limiter = RejectionLimiter(base_delay=2.0, allowance=2, clock=self.__clock)
+
+        self.assertEqual(0.0, limiter.record_failure('a'))
+        self.assertEqual(0.0, limiter.record_failure('a'))
+        limiter.check('a')
+
+        self.assertEqual(2.0, limiter.record_failure('a'))
+        self.assertEqual(4.0, limiter.record_failure('a'))
+
+        with self.assertRaises(RetryAfterError):
+            limiter.check('a')
+
+
+    def test_max_subjects(self):
+        limiter = RejectionLimiter(max_subjects=2, clock=self.__clock)
+
+        for subject in ('a', 'b', 'c'):
+            limiter.record_failure(subject)
+
+        self.assertEqual(2, limiter.subject_count)
+        self.assertEqual(0.0, limiter.retry_after('a'))
+
+
+    def test_wait_async(self):
+        limiter = RejectionLimiter(base_delay=0.05)
+        limiter.record_failure('a')
+
+        asyncio.run(limiter.wait_async('a'))
+        limiter.check('a')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestRejectionOnLoad(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+        TempHost.root = self.__dir.name
+
+        PersistenceCache.clear()
+        PersistentJSONable._REJECTION_LIMITER.clear()
+        PersistentJSONable._DOCUMENT_REJECTION_LIMITER.clear()
+
+
+    def tearDown(self):
+        PersistentJSONable._REJECTION_LIMITER.clear()
+        PersistentJSONable._DOCUMENT_REJECTION_LIMITER.clear()
+        PersistenceCache.clear()
+        self.__dir.cleanup()
+
+
+    def test_wrong_key(self):
+        Secret(1).save(TempHost, encryption_key='right')
+
+        start = time.monotonic()
+
+        with self.assertRaises(KeyError) as context:
+            Secret.load(TempHost, encryption_key='wrong', caller='client1')
+
+        self.assertNotIsInstance(context.exception, RetryAfterError)
+
+        with self.assertRaises(RetryAfterError):
+            Secret.load(TempHost, encryption_key='right', caller='client1')
+
+        self.assertLess(time.monotonic() - start, 1.0)  # rejected, not stalled
+
+        self.assertEqual(1, Secret.load(TempHost, encryption_key='right', caller='client2').value)
+
+
+    def test_wrong_key_async(self):
+        Secret(1).save(TempHost, encryption_key='right')
+
+        with self.assertRaises(KeyError):
+            Secret.load(TempHost, encryption_key='wrong', caller='client1')
+
+        with self.assertRaises(RetryAfterError):
+            asyncio.run(Secret.load_async(ExecutorPersistenceManager(TempHost), encryption_key='right',
+                                          caller='client1'))
+
+
+    def test_wrong_key_anonymous(self):
+        Secret(1).save(TempHost, encryption_key='right')
+
+        with self.assertRaises(KeyError) as context:
+            Secret.load(TempHost, encryption_key='wrong')
+
+        self.assertNotIsInstance(context.exception, RetryAfterError)
+
+        for _ in range(3):
+            with self.assertRaises(RetryAfterError):
+                Secret.load(TempHost, encryption_key='wrong')
+
+        with self.assertRaises(RetryAfterError):
+            asyncio.run(Secret.load_async(ExecutorPersistenceManager(TempHost), encryption_key='wrong'))
+
+        self.assertEqual(1, Secret.load(TempHost, encryption_key='right', caller='client1').value)
+
+
+    def test_wrong_key_varied_callers(self):
+        Secret(1).save(TempHost, encryption_key='right')
+
+        for i in range(PersistentJSONable._DOCUMENT_ALLOWANCE):
+            with self.assertRaises(KeyError) as context:
+                Secret.load(TempHost, encryption_key='wrong', caller=f'client{i}')
+
+            self.assertNotIsInstance(context.exception, RetryAfterError)
+
+        with self.assertRaises(KeyError):
+            Secret.load(TempHost, encryption_key='wrong', caller='another')  # the document's budget is spent
+
+        with self.assertRaises(RetryAfterError):
+            Secret.load(TempHost, encryption_key='wrong', caller='yet_another')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
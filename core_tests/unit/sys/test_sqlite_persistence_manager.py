@@ -0,0 +1,189 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+python -m unittest -v unit/sys/test_sqlite_persistence_manager.py
+
+https://realpython.com/python-testing/
+https://www.jetbrains.com/help/pycharm/creating-tests.html
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from collections import OrderedDict
+
+from mrcs_core.data.json import MultiPersistentJSONable, PersistentJSONable
+from mrcs_core.sys.persistence_cache import PersistenceCache
+from mrcs_core.sys.sqlite_persistence_manager import SQLitePersistenceManager
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TmpHost(object):
+    root = None
+
+    @classmethod
+    def mrcs_db_abs_file(cls, db_mode, filename):
+        return os.path.join(cls.root, 'db', db_mode, filename)
+
+
+class Sample(PersistentJSONable):
+    @classmethod
+    def persistence_location(cls):
+        return cls.conf_dir(), 'sample.json'
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict):
+        return None if jdict is None else cls(jdict.get('value'))
+
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('value', self.value)])
+
+
+    def __str__(self, *args, **kwargs):
+        return f'Sample:{{value:{self.value}}}'
+
+
+class MultiSample(MultiPersistentJSONable):
+    @classmethod
+    def persistence_location(cls, name):
+        return cls.inventory_dir(), 'multi_sample.json' if name is None else f'{name}_multi_sample.json'
+
+
+    @classmethod
+    def construct_from_jdict(cls, jdict, name=None):
+        return None if jdict is None else cls(name, jdict.get('value'))
+
+
+    def __init__(self, name, value):
+        super().__init__(name)
+        self.value = value
+
+
+    def as_json(self, **kwargs):
+        return OrderedDict([('value', self.value)])
+
+
+    def __str__(self, *args, **kwargs):
+        return f'MultiSample:{{name:{self.name}, value:{self.value}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TestSQLitePersistenceManager(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.TemporaryDirectory()
+        TmpHost.root = self.__dir.name
+
+        self.__manager = SQLitePersistenceManager.construct('TEST', host=TmpHost)
+
+        PersistenceCache.clear()
+
+
+    def tearDown(self):
+        self.__manager.close()
+        PersistenceCache.clear()
+        self.__dir.cleanup()
+
+
+    def test_construct(self):
+        self.assertEqual(os.path.join(self.__dir.name, 'db', 'TEST', 'persistence.db'), self.__manager.abs_filename)
+
+
+    def test_save_load(self):
+        self.assertFalse(Sample.exists(self.__manager))
+        self.assertIsNone(Sample.load(self.__manager))
+
+        Sample(1).save(self.__manager)
+
+        self.assertTrue(Sample.exists(self.__manager))
+
+        obj = Sample.load(self.__manager)
+        self.assertEqual(1, obj.value)
+        self.assertIsNotNone(obj.last_modified)
+
+        Sample(2).save(self.__manager)
+        self.assertEqual(2, Sample.load(self.__manager).value)
+
+        Sample.delete(self.__manager)
+        self.assertFalse(Sample.exists(self.__manager))
+
+
+    def test_encrypted(self):
+        Sample(1).save(self.__manager, encryption_key='secret')
+
+        self.assertEqual(1, Sample.load(self.__manager, encryption_key='secret').value)
+
+
+    def test_list(self):
+        for name in ('b', 'a', 'c'):
+            MultiSample(name, 1).save(self.__manager)
+
+        Sample(1).save(self.__manager)
+
+        self.assertEqual(('a', 'b', 'c'), MultiSample.list(self.__manager))
+
+
+    def test_transaction(self):
+        with self.__manager.transaction():
+            MultiSample('a', 1).save(self.__manager)
+            MultiSample('b', 2).save(self.__manager)
+
+        self.assertEqual(('a', 'b'), MultiSample.list(self.__manager))
+
+        with self.assertRaises(RuntimeError):
+            with self.__manager.transaction():
+                MultiSample('c', 3).save(self.__manager)
+                MultiSample.delete(self.__manager, name='a')
+                raise RuntimeError('abandoned')
+
+        self.assertEqual(('a', 'b'), MultiSample.list(self.__manager))
+
+
+    def test_cache(self):
+        Sample(1).save(self.__manager)
+
+        Sample.load(self.__manager)
+        self.assertEqual(1, PersistenceCache.size())
+
+        Sample(2).save(self.__manager)
+        self.assertEqual(0, PersistenceCache.size())
+        self.assertEqual(2, Sample.load(self.__manager).value)
+
+
+    def test_threads(self):
+        errors = []
+
+        def save(name):
+            try:
+                MultiSample(name, 1).save(self.__manager)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=save, args=(str(i),)) for i in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertEqual(8, len(MultiSample.list(self.__manager)))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,15 +5,45 @@ Created on 16 Oct 2020
 
 requires pycryptodome
 
+A Crypt is a session over one key: the AES key is derived (by SHA-256) once per session, and sessions are cached
+per key. The static encrypt / decrypt API is retained, and uses the cached sessions.
+
+Two modes are offered:
+CBC - the IV, then the PKCS#7-padded cypher text. A wrong key is detected by a padding heuristic.
+GCM - the nonce, the cypher text, then the authentication tag. A wrong key, or any tampering, is always detected.
+
+Text is the base64 of the above - GCM text is prefixed 'gcm:', so decryption detects the mode. Streams carry the
+raw bytes, with the mode given explicitly, except that decrypt_text_stream(..) reads the text form, decoding it chunk
+by chunk. A streamed decryption writes plain text before the cypher text has been authenticated - on KeyError, the
+output must be discarded.
+
 https://stackoverflow.com/questions/42568262/how-to-encrypt-text-with-a-password-in-python
 https://github.com/openthread/openthread/issues/1137
+https://pycryptodome.readthedocs.io/en/latest/src/cipher/modern.html#gcm-mode
 """
 
 from base64 import b64decode, b64encode
+from binascii import a2b_base64
+from enum import StrEnum, unique
+from functools import lru_cache
 
-from Crypto import Random
 from Crypto.Cipher import AES
 from Crypto.Hash import SHA256
+from Crypto.Random import get_random_bytes
+
+from mrcs_core.data.meta_enum import MetaEnum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+@unique
+class CryptMode(StrEnum, metaclass=MetaEnum):
+    """
+    An enumeration of the encryption modes
+    """
+
+    CBC = 'CBC'
+    GCM = 'GCM'
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -23,37 +53,264 @@ class Crypt(object):
     classdocs
     """
 
+    DEFAULT_MODE = CryptMode.CBC  # readable by earlier releases
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+
+    _SESSION_CACHE_SIZE = 16
+
+    __GCM_PREFIX = 'gcm:'
+    __GCM_PREFIX_BYTES = b'gcm:'
+
+    __NONCE_SIZE = 12
+    __TAG_SIZE = 16
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def encrypt(cls, key, plain_text, mode: CryptMode | None = None):
+        return cls.session(key).encrypt_text(plain_text, mode=mode)
+
+
+    @classmethod
+    def decrypt(cls, key, cypher_text):
+        return cls.session(key).decrypt_text(cypher_text)
+
+
+    @classmethod
+    def session(cls, key):
+        return cls.__construct(key)
+
+
+    @classmethod
+    @lru_cache(maxsize=_SESSION_CACHE_SIZE)
+    def __construct(cls, key):
+        return cls(key)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, key):
+        self.__aes_key = SHA256.new(key.encode()).digest()  # use SHA-256 over our key to get a proper-sized AES key
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def encrypt_text(self, plain_text, mode: CryptMode | None = None):
+        mode = self.DEFAULT_MODE if mode is None else mode
+        text = b64encode(self.encrypt_bytes(plain_text.encode(), mode=mode)).decode()
+
+        return self.__GCM_PREFIX + text if mode == CryptMode.GCM else text
+
+
+    def decrypt_text(self, cypher_text):
+        if cypher_text.startswith(self.__GCM_PREFIX):
+            data = self.decrypt_bytes(b64decode(cypher_text[len(self.__GCM_PREFIX):]), mode=CryptMode.GCM)
+        else:
+            data = self.decrypt_bytes(b64decode(cypher_text), mode=CryptMode.CBC)
+
+        return str(data, 'utf-8')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def encrypt_bytes(self, source, mode: CryptMode | None = None) -> bytes:
+        mode = self.DEFAULT_MODE if mode is None else mode
+        source = memoryview(source)
+
+        if mode == CryptMode.GCM:
+            nonce = get_random_bytes(self.__NONCE_SIZE)
+            cypher_text, tag = self.__gcm(nonce).encrypt_and_digest(source)
+
+            return b''.join((nonce, cypher_text, tag))
+
+        iv = get_random_bytes(AES.block_size)
+
+        return iv + self.__cbc(iv).encrypt(self.__pad(source))
+
+
+    def decrypt_bytes(self, source, mode: CryptMode | None = None) -> memoryview:
+        mode = self.DEFAULT_MODE if mode is None else mode
+        source = memoryview(source)
+
+        if mode == CryptMode.GCM:
+            if len(source) < self.__NONCE_SIZE + self.__TAG_SIZE:
+                raise ValueError('truncated cypher text')
+
+            decrypter = self.__gcm(source[:self.__NONCE_SIZE])
+            data = decrypter.decrypt(source[self.__NONCE_SIZE:-self.__TAG_SIZE])
+            self.__verify(decrypter, source[-self.__TAG_SIZE:])
+
+            return memoryview(data)
+
+        if len(source) < 2 * AES.block_size:
+            raise ValueError('truncated cypher text')
+
+        data = self.__cbc(source[:AES.block_size]).decrypt(source[AES.block_size:])  # the IV is at the beginning
+
+        return memoryview(data)[:-self.__padding(data)]  # no copy of the unpadded text
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
+    def encrypt_stream(self, src, dst, mode: CryptMode | None = None, chunk_size=DEFAULT_CHUNK_SIZE):
+        mode = self.DEFAULT_MODE if mode is None else mode
+
+        if mode == CryptMode.GCM:
+            nonce = get_random_bytes(self.__NONCE_SIZE)
+            encryptor = self.__gcm(nonce)
+            dst.write(nonce)
+
+            while chunk := src.read(chunk_size):
+                dst.write(encryptor.encrypt(chunk))
+
+            dst.write(encryptor.digest())
+            return
+
+        iv = get_random_bytes(AES.block_size)
+        encryptor = self.__cbc(iv)
+        dst.write(iv)
+
+        remainder = b''
+
+        while chunk := src.read(chunk_size):
+            buffer = remainder + chunk
+            aligned = len(buffer) - len(buffer) % AES.block_size
+
+            dst.write(encryptor.encrypt(buffer[:aligned]))
+            remainder = buffer[aligned:]
+
+        dst.write(encryptor.encrypt(self.__pad(remainder)))
+
+
+    def decrypt_stream(self, src, dst, mode: CryptMode | None = None, chunk_size=DEFAULT_CHUNK_SIZE):
+        mode = self.DEFAULT_MODE if mode is None else mode
+
+        if mode == CryptMode.GCM:
+            decrypter = self.__gcm(self.__read_exactly(src, self.__NONCE_SIZE))
+            held = b''  # the final bytes may be the tag
+
+            while chunk := src.read(chunk_size):
+                buffer = held + chunk
+
+                dst.write(decrypter.decrypt(buffer[:-self.__TAG_SIZE]))
+                held = buffer[-self.__TAG_SIZE:]
+
+            if len(held) < self.__TAG_SIZE:
+                raise ValueError('truncated cypher text')
+
+            self.__verify(decrypter, held)
+            return
+
+        decrypter = self.__cbc(self.__read_exactly(src, AES.block_size))
+        held = b''  # the final block holds the padding
+
+        while chunk := src.read(chunk_size):
+            buffer = held + chunk
+            aligned = ((len(buffer) - 1) // AES.block_size) * AES.block_size
+
+            dst.write(decrypter.decrypt(buffer[:aligned]))
+            held = buffer[aligned:]
+
+        if len(held) != AES.block_size:
+            raise ValueError('truncated cypher text')
+
+        data = decrypter.decrypt(held)
+        dst.write(data[:-self.__padding(data)])
+
+
+    def decrypt_text_stream(self, src, dst, chunk_size=DEFAULT_CHUNK_SIZE):
+        # src carries the text form, as ASCII bytes
+        prefix = src.read(len(self.__GCM_PREFIX_BYTES))
+
+        if prefix == self.__GCM_PREFIX_BYTES:
+            self.decrypt_stream(Base64Reader(src), dst, mode=CryptMode.GCM, chunk_size=chunk_size)
+        else:
+            self.decrypt_stream(Base64Reader(src, head=prefix), dst, mode=CryptMode.CBC, chunk_size=chunk_size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __cbc(self, iv):
+        return AES.new(self.__aes_key, AES.MODE_CBC, iv)
+
+
+    def __gcm(self, nonce):
+        return AES.new(self.__aes_key, AES.MODE_GCM, nonce=nonce)
+
+
+    @staticmethod
+    def __pad(remainder):
+        padding = AES.block_size - len(remainder) % AES.block_size  # calculate required padding
+        return bytes(remainder) + bytes([padding]) * padding
+
+
     @staticmethod
-    def encrypt(key, plain_text):
-        key_bytes = key.encode()
-        source = plain_text.encode()
+    def __padding(data):
+        padding = data[-1] if data else 0  # extract the padding value from the end
 
-        long_key = SHA256.new(key_bytes).digest()           # use SHA-256 over our key to get a proper-sized AES key
-        iv = Random.new().read(AES.block_size)              # generate IV
-        encryptor = AES.new(long_key, AES.MODE_CBC, iv)
+        if padding < 1 or padding > AES.block_size or data[-padding:] != bytes([padding]) * padding:
+            raise KeyError('invalid padding')
 
-        padding = AES.block_size - len(source) % AES.block_size     # calculate required padding
-        source += bytes([padding]) * padding
-        data = iv + encryptor.encrypt(source)               # store the IV at the beginning and encrypt
+        return padding
 
-        return b64encode(data).decode()
+
+    @staticmethod
+    def __verify(decrypter, tag):
+        try:
+            decrypter.verify(tag)
+        except ValueError:
+            raise KeyError('authentication failed')
 
 
     @staticmethod
-    def decrypt(key, cypher_text):
-        key_bytes = key.encode()
-        source = b64decode(cypher_text.encode())
+    def __read_exactly(src, size):
+        data = src.read(size)
+
+        if len(data) != size:
+            raise ValueError('truncated cypher text')
+
+        return data
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class Base64Reader(object):
+    """
+    a binary reader of the bytes encoded by the base64 text of another binary reader (helper class)
+    """
+
+    __WHITESPACE = b' \t\r\n'
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, src, head=b''):
+        self.__src = src
+        self.__encoded = head.translate(None, self.__WHITESPACE)  # less than one quantum after each read
+        self.__decoded = b''
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def read(self, size):
+        # fewer than size bytes only at the end of the text - incomplete base64 raises binascii.Error, a ValueError
+        while len(self.__decoded) < size:
+            chunk = self.__src.read(size * 4 // 3 + 4)
+
+            if not chunk:
+                if self.__encoded:
+                    self.__decoded += a2b_base64(self.__encoded)
+                    self.__encoded = b''
+                break
 
-        long_key = SHA256.new(key_bytes).digest()           # use SHA-256 over our key to get a proper-sized AES key
-        iv = source[:AES.block_size]                        # extract the IV from the beginning
-        decrypter = AES.new(long_key, AES.MODE_CBC, iv)
+            text = self.__encoded + chunk.translate(None, self.__WHITESPACE)
+            aligned = len(text) - len(text) % 4
 
-        data = decrypter.decrypt(source[AES.block_size:])   # decrypt
-        padding = data[-1]                                  # extract the padding value from the end
+            self.__decoded += a2b_base64(text[:aligned])
+            self.__encoded = text[aligned:]
 
-        if data[-padding:] != bytes([padding]) * padding:
-            raise KeyError(key)
+        data = self.__decoded[:size]
+        self.__decoded = self.__decoded[size:]
 
-        return data[:-padding].decode()                     # remove the padding
+        return data
@@ -5,11 +5,16 @@ Created on 6 Nov 2025
 
 A structured record that uniquely identifies each piece of equipment
 
+Specifications are immutable and hashable. Those constructed from wire strings are interned, so that repeated
+routing strings such as MPU.001.003 return the same object without parsing.
+
 https://docs.python.org/3/howto/enum.html
+https://docs.python.org/3/library/functools.html#functools.lru_cache
 """
 
 from abc import ABC
 from enum import StrEnum, unique
+from functools import lru_cache
 from typing import Any
 
 from mrcs_core.data.json import JSONable
@@ -55,14 +60,27 @@ class EquipmentSpecification(JSONable, ABC):
     An abstract specification of a piece of equipment, with type, sector ID, and within-sector serial number
     """
 
+    __slots__ = ('__equipment_type', '__sector_number', '__serial_number', '__hash')
+
+    _INTERN_CACHE_SIZE = 4096  # distinct wire strings
+
 
     def __init__(self, equipment_type: EquipmentType | None, sector_number: int | None, serial_number: int | None):
         self.__equipment_type = equipment_type
         self.__sector_number = sector_number
         self.__serial_number = serial_number
 
+        self.__hash = hash((equipment_type, sector_number, serial_number))
+
+
+    def __hash__(self):
+        return self.__hash
+
 
     def __eq__(self, other: Any):
+        if self is other:
+            return True
+
         try:
             return (self.equipment_type == other.equipment_type and self.sector_number == other.sector_number and
                     self.serial_number == other.serial_number)
@@ -157,20 +175,28 @@ class EquipmentIdentifier(EquipmentSpecification, JSONable):
     A fully-specified equipment identifier, for use by publishers
     """
 
+    __slots__ = ()
+
 
     @classmethod
     def construct_from_jdict(cls, jdict):
         if not jdict:
             return None
 
-        pieces = str(jdict).split('.')
+        return cls.__construct_from_wire(str(jdict))
+
+
+    @classmethod
+    @lru_cache(maxsize=EquipmentSpecification._INTERN_CACHE_SIZE)
+    def __construct_from_wire(cls, wire: str):
+        pieces = wire.split('.')
 
         try:
             equipment_type = EquipmentType(pieces[0])
             sector_number = None if pieces[1] == '*' else int(pieces[1])
             serial_number = int(pieces[2])
         except ValueError:
-            raise ValueError(jdict)
+            raise ValueError(wire)
 
         return cls(equipment_type, sector_number, serial_number)
 
@@ -199,20 +225,28 @@ class EquipmentFilter(EquipmentSpecification):
     A partially-specified equipment identifier, for use by subscribers
     """
 
+    __slots__ = ()
+
 
     @classmethod
     def construct_from_jdict(cls, jdict):
         if not jdict:
             return None
 
-        pieces = str(jdict).split('.')
+        return cls.__construct_from_wire(str(jdict))
+
+
+    @classmethod
+    @lru_cache(maxsize=EquipmentSpecification._INTERN_CACHE_SIZE)
+    def __construct_from_wire(cls, wire: str):
+        pieces = wire.split('.')
 
         try:
             equipment_type = None if pieces[0] == '*' else EquipmentType(pieces[0])
             sector_number = None if pieces[1] == '*' else int(pieces[1])
             serial_number = None if pieces[2] == '*' else int(pieces[2])
         except (IndexError, ValueError):
-            raise ValueError(jdict)
+            raise ValueError(wire)
 
         return cls(equipment_type, sector_number, serial_number)
 
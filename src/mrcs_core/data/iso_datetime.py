@@ -5,13 +5,20 @@ Created on 11 Nov 2025
 
 A datetime that guarantees localisation
 
+Equality and hashing are by the millisecond-truncated epoch together with the UTC offset - as with the isoformat
+comparison that they replace, equal instants at different offsets are not equal. DB fields are parsed by the C
+ISO-format parser. The UTC offsets of the local zone are cached per quarter-hour, both of UTC and of wall time: zone
+transitions fall on quarter-hour boundaries, so the offset and fold are constant within each quarter-hour.
+
 https://stackoverflow.com/questions/70198931/how-to-use-milliseconds-instead-of-microsenconds-in-datetime-python
 https://stackoverflow.com/questions/24966806/subclassing-datetime-datetime
 https://stackoverflow.com/questions/4770297/convert-utc-datetime-string-to-local-datetime
 https://labex.io/tutorials/python-how-to-create-datetime-objects-from-iso-8601-date-strings-417942
+https://docs.python.org/3/library/datetime.html#datetime.datetime.fromisoformat
+https://peps.python.org/pep-0495/
 """
 
-from datetime import datetime, tzinfo
+from datetime import date, datetime, timedelta, tzinfo
 from typing import Any
 
 import dateutil.tz
@@ -26,15 +33,23 @@ class ISODatetime(JSONable, datetime):
     A datetime that guarantees localisation
     """
 
-    __UTC_ZONE = dateutil.tz.tzutc()
     __LOCAL_ZONE: tzinfo = dateutil.tz.tzlocal()
 
-    __DB_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+    __EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+    __MILLISECOND = timedelta(milliseconds=1)
+    __OFFSET_PERIOD = 900  # seconds
+
+    # tzlocal is not hashable, so lru_cache cannot serve...
+    __utc_offsets = {}  # UTC period: (offset, fold) in __LOCAL_ZONE
+    __wall_offsets = {}  # (wall period, fold): offset in __LOCAL_ZONE
+    __MAX_OFFSETS = 4096
 
 
     @classmethod
     def set_local_zone(cls, tz: tzinfo):  # should only be used to standardise unit tests across timezones
         cls.__LOCAL_ZONE = tz
+        cls.__utc_offsets = {}
+        cls.__wall_offsets = {}
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -54,10 +69,19 @@ class ISODatetime(JSONable, datetime):
         if field is None:
             return None
 
-        db_naive = cls.strptime(field, cls.__DB_FORMAT)
-        db_utc = db_naive.replace(tzinfo=cls.__UTC_ZONE)
+        db_utc = datetime.fromisoformat(field)  # raises TypeError, ValueError
+
+        if db_utc.tzinfo is not None:
+            raise ValueError(field)
 
-        return db_utc.astimezone(cls.__LOCAL_ZONE)
+        seconds = ((db_utc.toordinal() - cls.__EPOCH_ORDINAL) * 86400 +
+                   db_utc.hour * 3600 + db_utc.minute * 60 + db_utc.second)
+
+        offset, fold = cls.__utc_offset(seconds // cls.__OFFSET_PERIOD)
+        local = db_utc + offset
+
+        return datetime.__new__(cls, local.year, local.month, local.day, local.hour, local.minute, local.second,
+                                local.microsecond, cls.__LOCAL_ZONE, fold=fold)
 
 
     @classmethod
@@ -75,10 +99,64 @@ class ISODatetime(JSONable, datetime):
         return super().now().replace(tzinfo=zone)  # cls.now(..) would recurse - super() is required here
 
 
+    @classmethod
+    def __utc_offset(cls, period):
+        try:
+            return cls.__utc_offsets[period]
+        except KeyError:
+            pass
+
+        local = datetime.fromtimestamp(period * cls.__OFFSET_PERIOD, cls.__LOCAL_ZONE)
+
+        if len(cls.__utc_offsets) >= cls.__MAX_OFFSETS:
+            cls.__utc_offsets.clear()
+
+        offset = cls.__utc_offsets[period] = (local.utcoffset(), local.fold)
+
+        return offset
+
+
+    @classmethod
+    def __wall_offset(cls, dt, wall_millis):
+        if dt.tzinfo is not cls.__LOCAL_ZONE:
+            return dt.utcoffset()
+
+        key = (wall_millis // (cls.__OFFSET_PERIOD * 1000), dt.fold)
+
+        try:
+            return cls.__wall_offsets[key]
+        except KeyError:
+            pass
+
+        if len(cls.__wall_offsets) >= cls.__MAX_OFFSETS:
+            cls.__wall_offsets.clear()
+
+        offset = cls.__wall_offsets[key] = dt.utcoffset()
+
+        return offset
+
+
+    @classmethod
+    def __epoch_key(cls, dt):
+        wall_millis = cls.__wall_millis(dt)
+        offset = cls.__wall_offset(dt, wall_millis)
+
+        return (wall_millis, None) if offset is None else (wall_millis - offset // cls.__MILLISECOND, offset)
+
+
+    @classmethod
+    def __wall_millis(cls, dt):
+        return (((dt.toordinal() - cls.__EPOCH_ORDINAL) * 86400 +
+                 dt.hour * 3600 + dt.minute * 60 + dt.second) * 1000 + dt.microsecond // 1000)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     # noinspection PyTypeChecker
     def __new__(cls, *args, **kwargs):
+        if len(args) > 7:  # tzinfo is in args - as when derived by astimezone(..), replace(..) or arithmetic
+            return datetime.__new__(cls, *args, **kwargs)
+
         try:
             localised_kwargs = kwargs if 'tzinfo' in kwargs else dict(kwargs, tzinfo=cls.__LOCAL_ZONE)
             return datetime.__new__(cls, *args, **localised_kwargs)
@@ -89,18 +167,31 @@ class ISODatetime(JSONable, datetime):
 
     def __eq__(self, other: Any):
         try:
-            return self.isoformat() == other.isoformat()  # strip any existing microseconds
+            if other.tzinfo is self.tzinfo and other.fold == self.fold:  # the same wall time has the same offset
+                return self.__wall_millis(self) == self.__wall_millis(other)
+
+            return self.__epoch_key(self) == self.__epoch_key(other)  # strip any existing microseconds
+
         except (AttributeError, TypeError):
             return False
 
 
+    def __hash__(self):
+        return hash(self.__epoch_key(self))
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def dbformat(self):
-        db_utc = self.astimezone(self.__UTC_ZONE)
-        db_utc_millis = db_utc.strftime(self.__DB_FORMAT)[:-3]
+        offset = self.__wall_offset(self, self.__wall_millis(self))
+
+        db_utc = datetime(self.year, self.month, self.day, self.hour, self.minute, self.second, self.microsecond)
 
-        return db_utc_millis
+        if offset is not None:
+            db_utc -= offset
+
+        return (f'{db_utc.year:04d}-{db_utc.month:02d}-{db_utc.day:02d} '
+                f'{db_utc.hour:02d}:{db_utc.minute:02d}:{db_utc.second:02d}.{db_utc.microsecond // 1000:03d}')
 
 
     def isoformat(self, sep='T', timespec='milliseconds'):
@@ -111,6 +202,13 @@ class ISODatetime(JSONable, datetime):
         return self.isoformat()
 
 
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def epoch_millis(self):
+        return self.__epoch_key(self)[0]
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __str__(self, *args, **kwargs):
@@ -5,18 +5,29 @@ Created on 13 Aug 2016
 
 JSONify must handle **kw because the standard JSONEncoder does not.
 
+Compact output (separators (',', ':'), no indent) is rendered by the default JSONCodec - orjson where it is installed,
+otherwise the standard library. Both backends produce byte-identical compact output.
+
 https://stackoverflow.com/questions/42568262/how-to-encrypt-text-with-a-password-in-python
 https://stackoverflow.com/questions/9575409/calling-parent-class-init-with-multiple-inheritance-whats-the-right-way
+https://github.com/ijl/orjson
 """
 
+import importlib
 import json
+import math
 import os
-import time
+import re
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from typing import Any, Callable
 
 from mrcs_core.data.datum import Datum
+from mrcs_core.sys.atomic_writer import AtomicWriter, SyncPolicy
+from mrcs_core.sys.persistence_cache import PersistenceCache
+from mrcs_core.sys.rejection_limiter import RejectionLimiter
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -26,19 +37,69 @@ class JSONify(json.JSONEncoder):
     convert any compliant object to a JSON-compatible entity
     """
 
+    COMPACT_SEPARATORS = (',', ':')
+
+    __SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+    __SEQUENCE_TYPES = (list, tuple, set, frozenset)
+    __SEQUENCE_MARKER = object()
+
 
     @classmethod
     def as_jdict(cls, obj, **kwargs):
-        if isinstance(obj, JSONable):
-            return cls.as_jdict(obj.as_json(**kwargs))
+        return cls._as_jdict(obj, None, kwargs)
+
+
+    @classmethod
+    def _as_jdict(cls, obj, scalar: Callable[[Any], Any] | None, kwargs, sequence_types: tuple | None = None):
+        # iterative, with an explicit stack of (container, key, value, is_fresh) - a sequence is collected as a list,
+        # then converted to a tuple by its marker entry, which is popped after all of its descendants...
+        holder = [None]
+        stack = [(holder, 0, obj, False)]
+
+        scalar_types = cls.__SCALAR_TYPES
+        sequence_types = cls.__SEQUENCE_TYPES if sequence_types is None else sequence_types
+        sequence_marker = cls.__SEQUENCE_MARKER
+
+        while stack:
+            container, key, value, is_fresh = stack.pop()
+
+            if is_fresh is sequence_marker:
+                container[key] = tuple(value)
+                continue
+
+            while isinstance(value, JSONable):
+                value = value.as_json(**kwargs)
+                is_fresh = True                                     # as_json() builds a new container
 
-        if isinstance(obj, dict):
-            return {key: cls.as_jdict(value, **kwargs) for key, value in obj.items()}
+            if isinstance(value, dict):
+                jdict = value if is_fresh and type(value) is dict else dict(value)     # may reuse in place
+                container[key] = jdict
 
-        if isinstance(obj, list):
-            return tuple(cls.as_jdict(value, **kwargs) for value in obj)
+                for item_key, item in jdict.items():
+                    if type(item) in scalar_types:
+                        if scalar is not None:
+                            jdict[item_key] = scalar(item)
+                    else:
+                        stack.append((jdict, item_key, item, False))
 
-        return obj
+                continue
+
+            if isinstance(value, sequence_types):
+                jlist = list(value)
+                stack.append((container, key, jlist, sequence_marker))
+
+                for index, item in enumerate(jlist):
+                    if type(item) in scalar_types:
+                        if scalar is not None:
+                            jlist[index] = scalar(item)
+                    else:
+                        stack.append((jlist, index, item, False))
+
+                continue
+
+            container[key] = value if scalar is None else scalar(value)
+
+        return holder[0]
 
 
     @staticmethod
@@ -46,6 +107,10 @@ class JSONify(json.JSONEncoder):
               allow_nan=True, cls=None, indent=None, separators=None,
               default=None, sort_keys=False, **kwargs):
 
+        if (indent is None and separators == JSONify.COMPACT_SEPARATORS and cls is None and default is None and
+                not skipkeys and not ensure_ascii and allow_nan and not sort_keys):
+            return JSONCodec.default().dumps(obj, **kwargs)
+
         handler = JSONify if cls is None else cls
 
         return json.dumps(obj, skipkeys=skipkeys, ensure_ascii=ensure_ascii, check_circular=check_circular,
@@ -84,6 +149,173 @@ class JSONify(json.JSONEncoder):
         return f'JSONify:{{kwargs:{self.__kwargs}}}'
 
 
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONCodec(ABC):
+    """
+    a JSON serialisation backend, rendering the compact form
+    """
+
+    __DEFAULT = None
+
+
+    @classmethod
+    def default(cls):
+        if cls.__DEFAULT is None:
+            cls.__DEFAULT = OrjsonCodec() if OrjsonCodec.is_available() else StdlibJSONCodec()
+
+        return cls.__DEFAULT
+
+
+    @classmethod
+    def set_default(cls, codec):  # None restores automatic selection
+        cls.__DEFAULT = codec
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_native(self, obj, **kwargs):
+        return JSONify._as_jdict(obj, self._scalar, kwargs)
+
+
+    def _scalar(self, value):
+        if isinstance(value, Decimal):
+            return float(value) if Datum.is_float(str(value)) else int(value)
+
+        return value
+
+
+    def dumpb(self, obj, **kwargs) -> bytes:
+        return self.dumps(obj, **kwargs).encode()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def dumps(self, obj, **kwargs) -> str:
+        pass
+
+
+    @abstractmethod
+    def loads(self, jstr: str | bytes):
+        pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'{self.__class__.__name__}:{{}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class StdlibJSONCodec(JSONCodec):
+    """
+    the standard library JSON backend
+    """
+
+
+    def dumps(self, obj, **kwargs) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=JSONify.COMPACT_SEPARATORS, cls=JSONify, **kwargs)
+
+
+    def loads(self, jstr: str | bytes):
+        return json.loads(jstr)
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class OrjsonCodec(JSONCodec):
+    """
+    the orjson backend - the as_json() tree is converted to native containers, then serialised in C
+
+    Values that orjson would render differently from the standard library - non-finite or exponent-form floats,
+    integers beyond 64 bits or non-string keys - are delegated to the standard library, so output is byte-identical.
+    So are values that the standard library does not accept - sets, datetimes, enums or any other type that orjson
+    serialises natively - so that both backends accept, and reject, the same objects.
+    orjson decodes integers beyond 64 bits as floats, so documents that may hold one are also decoded by the standard
+    library, which keeps them exact.
+    """
+
+    __SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+    __SEQUENCE_TYPES = (list, tuple)  # as the standard library
+
+    __EXPONENT_ABOVE = 1e16  # float.__repr__ uses exponent form at or above this magnitude...
+    __EXPONENT_BELOW = 1e-4  # ...and below this magnitude
+
+    # any integer beyond 64 bits has at least 19 digits - other runs of 19 digits only cost the fallback...
+    __WIDE_DIGITS = re.compile(r'\d{19}')
+    __WIDE_DIGITS_BYTES = re.compile(rb'\d{19}')
+
+
+    @staticmethod
+    def is_available():
+        try:
+            importlib.import_module('orjson')  # optional dependency
+        except ImportError:
+            return False
+
+        return True
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        self.__orjson = importlib.import_module('orjson')  # may raise ImportError
+        self.__fallback = StdlibJSONCodec()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _scalar(self, value):
+        value = super()._scalar(value)
+
+        if isinstance(value, float):
+            magnitude = abs(value)
+
+            if not math.isfinite(value):
+                raise ValueError(value)
+
+            if magnitude and not self.__EXPONENT_BELOW <= magnitude < self.__EXPONENT_ABOVE:
+                raise ValueError(value)
+
+        return value
+
+
+    def dumps(self, obj, **kwargs) -> str:
+        return self.dumpb(obj, **kwargs).decode()
+
+
+    def dumpb(self, obj, **kwargs) -> bytes:
+        try:
+            native = JSONify._as_jdict(obj, self.__encodable, kwargs, sequence_types=self.__SEQUENCE_TYPES)
+            return self.__orjson.dumps(native)
+        except (TypeError, ValueError):  # orjson.JSONEncodeError is a TypeError
+            return self.__fallback.dumpb(obj, **kwargs)
+
+
+    def __encodable(self, value):
+        # a value of any type other than the JSON scalars is delegated to the standard library
+        value = self._scalar(value)
+
+        if type(value) not in self.__SCALAR_TYPES:
+            raise TypeError(value)
+
+        return value
+
+
+    def loads(self, jstr: str | bytes):
+        wide_digits = self.__WIDE_DIGITS if isinstance(jstr, str) else self.__WIDE_DIGITS_BYTES
+
+        if wide_digits.search(jstr):
+            return self.__fallback.loads(jstr)
+
+        try:
+            return self.__orjson.loads(jstr)
+        except self.__orjson.JSONDecodeError:  # may be NaN, Infinity, or genuinely malformed
+            return self.__fallback.loads(jstr)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 class JSONable(ABC):
@@ -91,6 +323,8 @@ class JSONable(ABC):
     a JSONify-compatible class
     """
 
+    __slots__ = ()  # permits fully-slotted subclasses
+
     _INDENT = 4
 
 
@@ -107,7 +341,7 @@ class JSONable(ABC):
             return None
 
         try:
-            return json.loads(jstr)
+            return JSONCodec.default().loads(jstr)
         except json.decoder.JSONDecodeError:
             raise ValueError(jstr.strip())
 
@@ -181,7 +415,7 @@ class JSONReport(JSONable, ABC):
 
     # ----------------------------------------------------------------------------------------------------------------
 
-    def save(self, filename):
+    def save(self, filename, sync_policy: SyncPolicy | None = None):
         if filename is None:
             return None
 
@@ -189,18 +423,12 @@ class JSONReport(JSONable, ABC):
         jstr = JSONify.dumps(self, indent=self._INDENT)
 
         # file...
-        tmp_filename = '.'.join((filename, str(int(time.time()))))
-
         try:
-            with open(tmp_filename, 'w') as f:
-                f.write(jstr + '\n')
+            AtomicWriter.write(filename, jstr + '\n', policy=sync_policy)
 
         except FileNotFoundError:  # the containing directory does not exist (yet)
             return False
 
-        # atomic operation...
-        os.rename(tmp_filename, filename)
-
         return True
 
 
@@ -214,15 +442,18 @@ class JSONCatalogueEntry(JSONReport, ABC):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    __indexes = {}  # catalogue_location: (signature, names, name_set)
+    __indexes_lock = threading.Lock()
+
+
     @classmethod
     def list(cls):
-        return tuple(cls.__filename_to_name(item) for item in sorted(os.listdir(cls.catalogue_location()))
-                     if item.endswith('.json'))
+        return cls.__index()[0]
 
 
     @classmethod
     def exists(cls, name):
-        return name in cls.list()
+        return name in cls.__index()[1]
 
 
     @classmethod
@@ -230,6 +461,23 @@ class JSONCatalogueEntry(JSONReport, ABC):
         return cls.load(cls.__catalogue_entry_location(name))
 
 
+    @classmethod
+    def retrieve_many(cls, names, max_workers=None):
+        names = tuple(names)
+
+        if len(names) < 2:
+            return tuple(cls.retrieve(name) for name in names)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return tuple(executor.map(cls.retrieve, names))
+
+
+    @classmethod
+    def invalidate_index(cls):
+        with cls.__indexes_lock:
+            cls.__indexes.pop(cls.catalogue_location(), None)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -240,6 +488,29 @@ class JSONCatalogueEntry(JSONReport, ABC):
 
     # ----------------------------------------------------------------------------------------------------------------
 
+    @classmethod
+    def __index(cls):
+        location = cls.catalogue_location()
+
+        stat = os.stat(location)  # taken before listing, so that a concurrent change is seen on the next call
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with cls.__indexes_lock:
+            index = cls.__indexes.get(location)
+
+        if index is not None and index[0] == signature:
+            return index[1], index[2]
+
+        names = tuple(cls.__filename_to_name(item) for item in sorted(os.listdir(location))
+                      if item.endswith('.json'))
+        name_set = frozenset(names)
+
+        with cls.__indexes_lock:
+            cls.__indexes[location] = (signature, names, name_set)
+
+        return names, name_set
+
+
     @classmethod
     def __catalogue_entry_location(cls, name):
         return os.path.join(cls.catalogue_location(), cls.__name_to_filename(name))
@@ -266,6 +537,7 @@ class JSONCatalogueEntry(JSONReport, ABC):
 
     def store(self):
         self.save(self.filename)
+        self.invalidate_index()  # the directory mtime may be too coarse to show the change
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -283,7 +555,12 @@ class AbstractPersistentJSONable(JSONable, ABC):
     a JSONify-compatible class that can be stored in a filesystem (helper class)
     """
 
-    _SECURITY_DELAY = 3.0  # seconds
+    _SECURITY_DELAY = 3.0  # seconds - the initial lockout after a failed decryption
+    _DOCUMENT_ALLOWANCE = 3  # consecutive failures against a document, by any clients, before it is locked
+
+    # anonymous loads share a subject per document - the document's budget also limits clients that vary their id...
+    _REJECTION_LIMITER = RejectionLimiter(base_delay=_SECURITY_DELAY)
+    _DOCUMENT_REJECTION_LIMITER = RejectionLimiter(base_delay=_SECURITY_DELAY, allowance=_DOCUMENT_ALLOWANCE)
 
     __CONF_DIR = 'conf'  # hard-coded rel path
     __INVENTORY_DIR = 'inventory'  # hard-coded rel path
@@ -299,6 +576,31 @@ class AbstractPersistentJSONable(JSONable, ABC):
         return cls.__INVENTORY_DIR
 
 
+    @classmethod
+    def _rejection_subject(cls, manager, dirname, filename, caller):
+        # the caller - None for an anonymous load - and the document
+        return caller, os.path.join(manager.mrcs_abs_dir(), dirname, filename)
+
+
+    @classmethod
+    def _check_rejection(cls, subject):
+        # raises RetryAfterError at once, while either the caller or the document is locked out
+        cls._REJECTION_LIMITER.check(subject)
+        cls._DOCUMENT_REJECTION_LIMITER.check(subject[1])
+
+
+    @classmethod
+    def _record_rejection(cls, subject):
+        cls._REJECTION_LIMITER.record_failure(subject)
+        cls._DOCUMENT_REJECTION_LIMITER.record_failure(subject[1])
+
+
+    @classmethod
+    def _record_admission(cls, subject):
+        # the document's budget is not restored, so that a guesser gains nothing from another client's success
+        cls._REJECTION_LIMITER.record_success(subject)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, *args, last_modified=None, **kwargs):
@@ -341,29 +643,44 @@ class PersistentJSONable(AbstractPersistentJSONable, ABC):
 
 
     @classmethod
-    def load(cls, manager, encryption_key=None):
-        if not cls.exists(manager):
-            return cls.construct_from_jdict(None)
-
+    def load(cls, manager, encryption_key=None, caller=None):
         try:
             dirname, filename = cls.persistence_location()
         except NotImplementedError:
-            return None
+            return cls.construct_from_jdict(None)
+
+        # cached...
+        signature = manager.signature(dirname, filename)  # taken before any read
+        cached = PersistenceCache.get(manager, dirname, filename, encryption_key, signature)
+
+        if cached is not None:
+            return cls.__construct_from_loaded(*cached)
+
+        # stored...
+        if not manager.exists(dirname, filename):
+            return cls.construct_from_jdict(None)
+
+        subject = cls._rejection_subject(manager, dirname, filename, caller)
+        cls._check_rejection(subject)
 
         try:
             jstr, last_modified = manager.load(dirname, filename, encryption_key=encryption_key)
-        except (KeyError, ValueError) as exc:  # caused by incorrect encryption_key
-            time.sleep(cls._SECURITY_DELAY)
-            raise exc
+        except (KeyError, ValueError):  # caused by incorrect encryption_key
+            cls._record_rejection(subject)
+            raise
 
-        try:
-            obj = cls.construct_from_jdict(cls.loads(jstr))
-            obj._last_modified = last_modified
-            return obj
+        if encryption_key is not None:
+            cls._record_admission(subject)
 
+        try:
+            jdict = cls.loads(jstr)
         except (AttributeError, TypeError):
             return None
 
+        PersistenceCache.put(manager, dirname, filename, encryption_key, signature, jdict, last_modified)
+
+        return cls.__construct_from_loaded(jdict, last_modified)
+
 
     @classmethod
     def delete(cls, manager):
@@ -375,6 +692,79 @@ class PersistentJSONable(AbstractPersistentJSONable, ABC):
             pass
 
 
+    @classmethod
+    def __construct_from_loaded(cls, jdict, last_modified):
+        try:
+            obj = cls.construct_from_jdict(jdict)
+            obj._last_modified = last_modified
+            return obj
+
+        except (AttributeError, TypeError):
+            return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    async def exists_async(cls, manager):
+        try:
+            dirname, filename = cls.persistence_location()
+        except NotImplementedError:
+            return False
+
+        return await manager.exists(dirname, filename)
+
+
+    @classmethod
+    async def load_async(cls, manager, encryption_key=None, caller=None):
+        try:
+            dirname, filename = cls.persistence_location()
+        except NotImplementedError:
+            return cls.construct_from_jdict(None)
+
+        # cached...
+        signature = await manager.signature(dirname, filename)  # taken before any read
+        cached = PersistenceCache.get(manager, dirname, filename, encryption_key, signature)
+
+        if cached is not None:
+            return cls.__construct_from_loaded(*cached)
+
+        # stored...
+        if not await manager.exists(dirname, filename):
+            return cls.construct_from_jdict(None)
+
+        subject = cls._rejection_subject(manager, dirname, filename, caller)
+        cls._check_rejection(subject)
+
+        try:
+            jstr, last_modified = await manager.load(dirname, filename, encryption_key=encryption_key)
+        except (KeyError, ValueError):  # caused by incorrect encryption_key
+            cls._record_rejection(subject)
+            raise
+
+        if encryption_key is not None:
+            cls._record_admission(subject)
+
+        try:
+            jdict = cls.loads(jstr)
+        except (AttributeError, TypeError):
+            return None
+
+        PersistenceCache.put(manager, dirname, filename, encryption_key, signature, jdict, last_modified)
+
+        return cls.__construct_from_loaded(jdict, last_modified)
+
+
+    @classmethod
+    async def delete_async(cls, manager):
+        try:
+            dirname, filename = cls.persistence_location()
+        except NotImplementedError:
+            return
+
+        await manager.remove(dirname, filename)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -403,6 +793,18 @@ class PersistentJSONable(AbstractPersistentJSONable, ABC):
             on_save_complete(self)
 
 
+    async def save_async(self, manager, on_save_complete: Callable[[Any], None] | None = None, encryption_key=None):
+        self._last_modified = None  # last_modified field shall be restored by load_async(..)
+
+        dirname, filename = self.persistence_location()
+        jstr = JSONify.dumps(self, indent=self._INDENT)
+
+        await manager.save(jstr, dirname, filename, encryption_key=encryption_key)
+
+        if on_save_complete:
+            on_save_complete(self)
+
+
 # --------------------------------------------------------------------------------------------------------------------
 
 class MultiPersistentJSONable(AbstractPersistentJSONable, ABC):
@@ -420,10 +822,9 @@ class MultiPersistentJSONable(AbstractPersistentJSONable, ABC):
         except NotImplementedError:
             return None
 
-        suffix_len = len(filename) + 1
-        items = manager.list(manager.scs_path(), dirname)
+        items = manager.list(manager.mrcs_abs_dir(), dirname)
 
-        return tuple(item[:-suffix_len] for item in items if item.endswith(filename))
+        return cls.__names(items, filename)
 
 
     @classmethod
@@ -437,30 +838,44 @@ class MultiPersistentJSONable(AbstractPersistentJSONable, ABC):
 
 
     @classmethod
-    def load(cls, manager, name=None, encryption_key=None):
-        if not cls.exists(manager, name=name):
-            return cls.construct_from_jdict(None, name=name)
-
+    def load(cls, manager, name=None, encryption_key=None, caller=None):
         try:
             dirname, filename = cls.persistence_location(name)
         except NotImplementedError:
-            return None
+            return cls.construct_from_jdict(None, name=name)
+
+        # cached...
+        signature = manager.signature(dirname, filename)  # taken before any read
+        cached = PersistenceCache.get(manager, dirname, filename, encryption_key, signature)
+
+        if cached is not None:
+            return cls.__construct_from_loaded(*cached, name)
+
+        # stored...
+        if not manager.exists(dirname, filename):
+            return cls.construct_from_jdict(None, name=name)
+
+        subject = cls._rejection_subject(manager, dirname, filename, caller)
+        cls._check_rejection(subject)
 
         try:
             jstr, last_modified = manager.load(dirname, filename, encryption_key=encryption_key)
+        except (KeyError, ValueError):  # caused by incorrect encryption_key
+            cls._record_rejection(subject)
+            raise
 
-        except (KeyError, ValueError) as exc:  # caused by incorrect encryption_key
-            time.sleep(cls._SECURITY_DELAY)
-            raise exc
+        if encryption_key is not None:
+            cls._record_admission(subject)
 
         try:
-            obj = cls.construct_from_jdict(cls.loads(jstr), name=name)
-            obj._last_modified = last_modified
-            return obj
-
+            jdict = cls.loads(jstr)
         except (AttributeError, TypeError):
             return None
 
+        PersistenceCache.put(manager, dirname, filename, encryption_key, signature, jdict, last_modified)
+
+        return cls.__construct_from_loaded(jdict, last_modified, name)
+
 
     @classmethod
     def delete(cls, manager, name=None):
@@ -472,6 +887,98 @@ class MultiPersistentJSONable(AbstractPersistentJSONable, ABC):
             pass
 
 
+    @staticmethod
+    def __names(items, filename):
+        suffix_len = len(filename) + 1
+
+        return tuple(item[:-suffix_len] for item in items if item.endswith(filename))
+
+
+    @classmethod
+    def __construct_from_loaded(cls, jdict, last_modified, name):
+        try:
+            obj = cls.construct_from_jdict(jdict, name=name)
+            obj._last_modified = last_modified
+            return obj
+
+        except (AttributeError, TypeError):
+            return None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    async def list_async(cls, manager):
+        try:
+            dirname, filename = cls.persistence_location(None)
+        except NotImplementedError:
+            return None
+
+        items = await manager.list(manager.mrcs_abs_dir(), dirname)
+
+        return cls.__names(items, filename)
+
+
+    @classmethod
+    async def exists_async(cls, manager, name=None):
+        try:
+            dirname, filename = cls.persistence_location(name)
+        except NotImplementedError:
+            return False
+
+        return await manager.exists(dirname, filename)
+
+
+    @classmethod
+    async def load_async(cls, manager, name=None, encryption_key=None, caller=None):
+        try:
+            dirname, filename = cls.persistence_location(name)
+        except NotImplementedError:
+            return cls.construct_from_jdict(None, name=name)
+
+        # cached...
+        signature = await manager.signature(dirname, filename)  # taken before any read
+        cached = PersistenceCache.get(manager, dirname, filename, encryption_key, signature)
+
+        if cached is not None:
+            return cls.__construct_from_loaded(*cached, name)
+
+        # stored...
+        if not await manager.exists(dirname, filename):
+            return cls.construct_from_jdict(None, name=name)
+
+        subject = cls._rejection_subject(manager, dirname, filename, caller)
+        cls._check_rejection(subject)
+
+        try:
+            jstr, last_modified = await manager.load(dirname, filename, encryption_key=encryption_key)
+        except (KeyError, ValueError):  # caused by incorrect encryption_key
+            cls._record_rejection(subject)
+            raise
+
+        if encryption_key is not None:
+            cls._record_admission(subject)
+
+        try:
+            jdict = cls.loads(jstr)
+        except (AttributeError, TypeError):
+            return None
+
+        PersistenceCache.put(manager, dirname, filename, encryption_key, signature, jdict, last_modified)
+
+        return cls.__construct_from_loaded(jdict, last_modified, name)
+
+
+    @classmethod
+    async def delete_async(cls, manager, name=None):
+        try:
+            dirname, filename = cls.persistence_location(name)
+        except NotImplementedError:
+            return
+
+        await manager.remove(dirname, filename)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -508,6 +1015,18 @@ class MultiPersistentJSONable(AbstractPersistentJSONable, ABC):
             on_save_complete(self)
 
 
+    async def save_async(self, manager, on_save_complete: Callable[[Any], None] | None = None, encryption_key=None):
+        self._last_modified = None  # last_modified field shall be restored by load_async(..)
+
+        dirname, filename = self.persistence_location(self.name)
+        jstr = JSONify.dumps(self, indent=self._INDENT)
+
+        await manager.save(jstr, dirname, filename, encryption_key=encryption_key)
+
+        if on_save_complete:
+            on_save_complete(self)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -0,0 +1,237 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A declarative field specification for JSONable classes
+
+The json_fields class decorator generates construct_from_jdict, as_json and __eq__ from the field specifications, as
+straight-line code compiled once at class creation - no field metadata is consulted while marshalling. Any of these
+methods that is defined in the class body itself is left in place. The fields are listed in __init__ argument order.
+
+@json_fields(
+    JSONField('addr', 'turnout_address'),
+    JSONEnumField('position', 'position', TurnoutPosition)
+)
+class TurnoutReport(JSONable):
+    ...
+
+https://docs.python.org/3/library/abc.html#abc.update_abstractmethods
+"""
+
+from abc import update_abstractmethods
+from collections import OrderedDict
+from enum import Enum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONField(object):
+    """
+    a field whose jdict value is used as-is
+    """
+
+
+    def __init__(self, key: str, attr: str):
+        self.__key = key  # the jdict key
+        self.__attr = attr  # the property name, also the __init__ argument position
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decoder(self, value: str, binding: str) -> str:
+        return value
+
+
+    def encoder(self, value: str, binding: str) -> str:
+        return value
+
+
+    @property
+    def bound(self):
+        return None  # the object made available to generated code under the field's binding name
+
+
+    @property
+    def is_required(self):
+        return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def key(self):
+        return self.__key
+
+
+    @property
+    def attr(self):
+        return self.__attr
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'{self.__class__.__name__}:{{key:{self.key}, attr:{self.attr}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONEnumField(JSONField):
+    """
+    a field whose jdict value is the name of an enum member
+    """
+
+
+    def __init__(self, key: str, attr: str, enum_class: type[Enum], is_optional: bool = False):
+        super().__init__(key, attr)
+
+        self.__enum_class = enum_class
+        self.__is_optional = is_optional
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decoder(self, value: str, binding: str) -> str:
+        if self.__is_optional:
+            return f'(None if {value} is None else {binding}[{value}])'
+
+        return f'{binding}[{value}]'  # may raise KeyError
+
+
+    def encoder(self, value: str, binding: str) -> str:
+        if self.__is_optional:
+            return f'(None if {value} is None else {value}.name)'
+
+        return f'{value}.name'
+
+
+    @property
+    def bound(self):
+        return self.__enum_class
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONNestedField(JSONField):
+    """
+    a field whose jdict value is the jdict of a JSONable
+    """
+
+
+    def __init__(self, key: str, attr: str, jsonable_class: type, is_required: bool = False):
+        super().__init__(key, attr)
+
+        self.__jsonable_class = jsonable_class
+        self.__is_required = is_required
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decoder(self, value: str, binding: str) -> str:
+        return f'{binding}.construct_from_jdict({value})'
+
+
+    @property
+    def bound(self):
+        return self.__jsonable_class
+
+
+    @property
+    def is_required(self):
+        return self.__is_required
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class JSONNestedListField(JSONNestedField):
+    """
+    a field whose jdict value is a list of JSONable jdicts
+    """
+
+
+    def decoder(self, value: str, binding: str) -> str:
+        return f'[{binding}.construct_from_jdict(item) for item in ({value} or [])]'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+def json_fields(*fields: JSONField, is_typed: bool = True):
+    """
+    generate construct_from_jdict, as_json and __eq__ - if is_typed, the jdict carries and is checked for the type name
+    """
+
+    def decorate(cls):
+        namespace = {'OrderedDict': OrderedDict}
+        source = []
+
+        for i, field in enumerate(fields):
+            namespace[f'_b{i}'] = field.bound
+
+        # construct_from_jdict...
+        if 'construct_from_jdict' not in cls.__dict__:
+            source.append('def construct_from_jdict(cls, jdict):')
+
+            if is_typed:
+                source.append("    type_name = jdict.get('type')")
+                source.append('    if type_name != cls.__name__:')
+                source.append("        raise TypeError(f'required type:{cls.__name__} got:{type_name}')")
+
+            for i, field in enumerate(fields):
+                source.append(f'    v{i} = {field.decoder(f"jdict.get({field.key!r})", f"_b{i}")}')
+
+                if field.is_required:
+                    source.append(f'    if v{i} is None:')
+                    source.append(f"        raise ValueError(f'missing {field.bound.__name__} in:{{jdict}}')")
+
+            source.append(f'    return cls({", ".join(f"v{i}" for i in range(len(fields)))})')
+
+        # as_json...
+        if 'as_json' not in cls.__dict__:
+            source.append('def as_json(self, **kwargs):')
+            source.append('    jdict = OrderedDict()')
+
+            if is_typed:
+                source.append("    jdict['type'] = self.type_name()")
+
+            for i, field in enumerate(fields):
+                source.append(f'    jdict[{field.key!r}] = {field.encoder(f"self.{field.attr}", f"_b{i}")}')
+
+            source.append('    return jdict')
+
+        # __eq__...
+        if '__eq__' not in cls.__dict__:
+            terms = ' and '.join(f'self.{field.attr} == other.{field.attr}' for field in fields)
+
+            source.append('def __eq__(self, other):')
+            source.append('    try:')
+            source.append(f'        return {terms or "True"}')
+            source.append('    except (AttributeError, TypeError):')
+            source.append('        return False')
+
+        exec(compile('\n'.join(source), f'<json_fields {cls.__qualname__}>', 'exec'), namespace)
+
+        if 'construct_from_jdict' in namespace:
+            cls.construct_from_jdict = classmethod(_qualified(namespace['construct_from_jdict'], cls))
+
+        if 'as_json' in namespace:
+            cls.as_json = _qualified(namespace['as_json'], cls)
+
+        if '__eq__' in namespace:
+            cls.__eq__ = _qualified(namespace['__eq__'], cls)
+
+            if '__hash__' not in cls.__dict__:
+                cls.__hash__ = None  # as if __eq__ were defined in the class body
+
+        cls._json_fields = fields
+
+        return update_abstractmethods(cls)
+
+    return decorate
+
+
+def _qualified(func, cls):
+    func.__module__ = cls.__module__
+    func.__qualname__ = f'{cls.__qualname__}.{func.__name__}'
+
+    return func
@@ -14,10 +14,10 @@ https://github.com/botmonster/z21aio/tree/main
 """
 
 from abc import ABC
-from collections import OrderedDict
 from typing import Any
 
 from mrcs_core.data.json import JSONable
+from mrcs_core.data.json_fields import JSONEnumField, JSONField, JSONNestedField, JSONNestedListField, json_fields
 from mrcs_core.equipment.block.block_enums import BlockVoltage
 from mrcs_core.equipment.block.block_id import BlockID
 from mrcs_core.equipment.block.block_occupant import BlockOccupant
@@ -70,57 +70,21 @@ class BlockReport(JSONable, ABC):
 
 # --------------------------------------------------------------------------------------------------------------------
 
+@json_fields(
+    JSONNestedField('id', 'block_id', BlockID, is_required=True),
+    JSONEnumField('voltage', 'voltage', BlockVoltage)
+)
 class BlockVoltageReport(BlockReport):
     """
     A block report, including voltage
     """
 
 
-    @classmethod
-    def construct_from_jdict(cls, jdict) -> BlockVoltageReport:
-        type_name = jdict.get('type')
-
-        if type_name != cls.__name__:
-            raise TypeError(f'required type:{cls.__name__} got:{type_name}')
-
-        block_id = BlockID.construct_from_jdict(jdict.get('id'))
-
-        if block_id is None:
-            raise ValueError(f'missing BlockID in:{jdict}')
-
-        # may raise KeyError
-        voltage = BlockVoltage[jdict.get('voltage')]
-
-        return cls(block_id, voltage)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
     def __init__(self, block_id: BlockID, voltage: BlockVoltage):
         super().__init__(block_id)
         self._voltage = voltage
 
 
-    def __eq__(self, other: Any):
-        try:
-            return self.block_id == other.block_id and self.voltage == other.voltage
-        except (AttributeError, TypeError):
-            return False
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def as_json(self, **kwargs):
-        jdict = OrderedDict()
-
-        jdict['type'] = self.type_name()
-
-        jdict['id'] = self.block_id
-        jdict['voltage'] = self.voltage.name
-
-        return jdict
-
-
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -137,32 +101,17 @@ class BlockVoltageReport(BlockReport):
 
 # --------------------------------------------------------------------------------------------------------------------
 
+@json_fields(
+    JSONNestedField('id', 'block_id', BlockID, is_required=True),
+    JSONField('group', 'occupant_group'),
+    JSONNestedListField('occupants', 'occupants', BlockOccupant)
+)
 class BlockOccupancyReport(BlockReport):
     """
     A block report, including occupancy
     """
 
 
-    @classmethod
-    def construct_from_jdict(cls, jdict) -> BlockOccupancyReport:
-        type_name = jdict.get('type')
-
-        if type_name != cls.__name__:
-            raise TypeError(f'required type:{cls.__name__} got:{type_name}')
-
-        block_id = BlockID.construct_from_jdict(jdict.get('id'))
-
-        if block_id is None:
-            raise ValueError(f'missing BlockID in:{jdict}')
-
-        occupant_group = jdict.get('group')
-        occupants = [BlockOccupant.construct_from_jdict(occupant) for occupant in jdict.get('occupants', [])]
-
-        return cls(block_id, occupant_group, occupants)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
     def __init__(self, block_id: BlockID, occupant_group: int | None, occupants: list[BlockOccupant]):
         super().__init__(block_id)
 
@@ -170,28 +119,6 @@ class BlockOccupancyReport(BlockReport):
         self._occupants = occupants
 
 
-    def __eq__(self, other: Any):
-        try:
-            return (self.block_id == other.block_id and
-                    self.occupant_group == other.occupant_group and self.occupants == other.occupants)
-        except (AttributeError, TypeError):
-            return False
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def as_json(self, **kwargs):
-        jdict = OrderedDict()
-
-        jdict['type'] = self.type_name()
-
-        jdict['id'] = self.block_id
-        jdict['group'] = self.occupant_group
-        jdict['occupants'] = self.occupants
-
-        return jdict
-
-
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -12,48 +12,30 @@ Based on code:
 https://github.com/botmonster/z21aio/tree/main
 """
 
-from collections import OrderedDict
-
-from mypy.types import Any
-
 from mrcs_core.data.json import JSONable
+from mrcs_core.data.json_fields import JSONField, json_fields
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
+@json_fields(
+    JSONField('main_current', 'main_current'),
+    JSONField('prog_current', 'prog_current'),
+    JSONField('filtered_main_current', 'filtered_main_current'),
+    JSONField('supply_voltage', 'supply_voltage'),
+    JSONField('track_voltage', 'track_voltage'),
+    JSONField('temperature', 'temperature'),
+    JSONField('central_state', 'central_state'),
+    JSONField('central_state_ext', 'central_state_ext'),
+    JSONField('capabilities', 'capabilities'),
+    JSONField('reserved', 'reserved')
+)
 class ControlRouterReport(JSONable):
     """
     The state of a command station
     """
 
 
-    @classmethod
-    def construct_from_jdict(cls, jdict) -> ControlRouterReport:
-        type_name = jdict.get('type')
-
-        if type_name != cls.type_name():
-            raise TypeError(f'required type:{cls.type_name()} got:{type_name}')
-
-        main_current = jdict.get('main_current')
-        prog_current = jdict.get('prog_current')
-        filtered_main_current = jdict.get('filtered_main_current')
-        supply_voltage = jdict.get('supply_voltage')
-        track_voltage = jdict.get('track_voltage')
-
-        temperature = jdict.get('temperature')
-
-        central_state = jdict.get('central_state')
-        central_state_ext = jdict.get('central_state_ext')
-        capabilities = jdict.get('capabilities')
-        reserved = jdict.get('reserved')
-
-        return cls(main_current, prog_current, filtered_main_current,
-                   supply_voltage, track_voltage, temperature,
-                   central_state, central_state_ext, capabilities, reserved)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
     def __init__(self, main_current: int, prog_current: int, filtered_main_current: int,
                  supply_voltage: int, track_voltage: int, temperature: int,
                  central_state: int, central_state_ext: int, capabilities: int, reserved: int | None):
@@ -71,41 +53,6 @@ class ControlRouterReport(JSONable):
         self.__reserved = reserved
 
 
-    def __eq__(self, other: Any):
-        try:
-            return (self.main_current == other.main_current and self.prog_current == other.prog_current and
-                    self.filtered_main_current == other.filtered_main_current and
-                    self.supply_voltage == other.supply_voltage and self.track_voltage == other.track_voltage and
-                    self.temperature == other.temperature and
-                    self.central_state == other.central_state and self.central_state_ext == other.central_state_ext and
-                    self.capabilities == other.capabilities and self.reserved == other.reserved)
-        except (AttributeError, TypeError):
-            return False
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def as_json(self, **kwargs):
-        jdict = OrderedDict()
-
-        jdict['type'] = self.type_name()
-
-        jdict['main_current'] = self.main_current
-        jdict['prog_current'] = self.prog_current
-        jdict['filtered_main_current'] = self.filtered_main_current
-        jdict['supply_voltage'] = self.supply_voltage
-        jdict['track_voltage'] = self.track_voltage
-
-        jdict['temperature'] = self.temperature
-
-        jdict['central_state'] = self.central_state
-        jdict['central_state_ext'] = self.central_state_ext
-        jdict['capabilities'] = self.capabilities
-        jdict['reserved'] = self.reserved
-
-        return jdict
-
-
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
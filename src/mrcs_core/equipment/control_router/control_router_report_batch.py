@@ -0,0 +1,219 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A columnar batch of command station telemetry samples
+
+Each field of ControlRouterReport (except reserved) is held as one contiguous integer column - a NumPy array where
+NumPy is installed, otherwise a standard library array. Statistics and threshold detection run over whole columns,
+so no per-sample objects are held. Samples may be constructed from reports or from their jdicts, in any mix.
+
+Column indices returned by threshold detection are sample positions within the batch.
+
+https://numpy.org/doc/stable/user/basics.rec.html
+https://docs.python.org/3/library/array.html
+"""
+
+import importlib
+from array import array
+from typing import Iterable
+
+from mrcs_core.equipment.control_router.control_router_report import ControlRouterReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ControlRouterReportBatch(object):
+    """
+    A columnar batch of command station telemetry samples
+    """
+
+    FIELDS = ('main_current', 'prog_current', 'filtered_main_current', 'supply_voltage', 'track_voltage',
+              'temperature', 'central_state', 'central_state_ext', 'capabilities')
+
+    __NUMPY_DTYPE = 'i4'
+    __ARRAY_TYPECODE = 'l'
+
+    __SHORT_CIRCUIT = 0x04
+
+
+    @staticmethod
+    def is_numpy_available():
+        try:
+            importlib.import_module('numpy')  # optional dependency
+        except ImportError:
+            return False
+
+        return True
+
+
+    @classmethod
+    def construct(cls, samples: Iterable[ControlRouterReport | dict], is_numpy: bool | None = None):
+        if is_numpy is None:
+            is_numpy = cls.is_numpy_available()
+
+        if is_numpy:
+            numpy = importlib.import_module('numpy')
+            dtype = numpy.dtype([(field, cls.__NUMPY_DTYPE) for field in cls.FIELDS])
+
+            rows = numpy.fromiter(map(cls.__row, samples), dtype=dtype)  # may raise KeyError
+
+            return cls({field: numpy.ascontiguousarray(rows[field]) for field in cls.FIELDS}, numpy)
+
+        columns = {field: array(cls.__ARRAY_TYPECODE) for field in cls.FIELDS}
+
+        for row in map(cls.__row, samples):
+            for column, value in zip(columns.values(), row):
+                column.append(value)
+
+        return cls(columns, None)
+
+
+    @classmethod
+    def concatenate(cls, batches: Iterable[ControlRouterReportBatch]):
+        batches = list(batches)
+
+        if not batches:
+            return cls.construct(())
+
+        numpy = batches[0].__numpy
+
+        if numpy is not None:
+            return cls({field: numpy.concatenate([batch.column(field) for batch in batches])
+                        for field in cls.FIELDS}, numpy)
+
+        columns = {field: array(cls.__ARRAY_TYPECODE) for field in cls.FIELDS}
+
+        for batch in batches:
+            for field, column in columns.items():
+                column.extend(batch.column(field))
+
+        return cls(columns, None)
+
+
+    @classmethod
+    def __row(cls, sample):
+        if isinstance(sample, ControlRouterReport):
+            return tuple(getattr(sample, field) for field in cls.FIELDS)
+
+        return tuple(sample[field] for field in cls.FIELDS)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, columns: dict, numpy):
+        self.__columns = columns  # dict of field: column
+        self.__numpy = numpy  # module or None
+
+
+    def __len__(self):
+        return len(self.__columns[self.FIELDS[0]])
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def column(self, field: str):
+        try:
+            return self.__columns[field]
+        except KeyError:
+            raise ValueError(f'unknown field:{field}')
+
+
+    def tail(self, count: int) -> ControlRouterReportBatch:
+        start = max(len(self) - count, 0)
+        return ControlRouterReportBatch({field: column[start:] for field, column in self.__columns.items()},
+                                        self.__numpy)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def min(self, field: str) -> int:
+        column = self.__populated_column(field)
+        return min(column) if self.__numpy is None else int(column.min())
+
+
+    def max(self, field: str) -> int:
+        column = self.__populated_column(field)
+        return max(column) if self.__numpy is None else int(column.max())
+
+
+    def mean(self, field: str) -> float:
+        column = self.__populated_column(field)
+        return sum(column) / len(column) if self.__numpy is None else float(column.mean())
+
+
+    def rolling_mean(self, field: str, window: int):
+        if window < 1:
+            raise ValueError(f'invalid window:{window}')
+
+        column = self.column(field)
+
+        if len(column) < window:
+            return [] if self.__numpy is None else self.__numpy.empty(0)
+
+        if self.__numpy is not None:
+            sums = self.__numpy.cumsum(column, dtype='f8')
+            sums[window:] = sums[window:] - sums[:-window]
+            return sums[window - 1:] / window
+
+        total = sum(column[:window])
+        means = [total / window]
+
+        for i in range(window, len(column)):
+            total += column[i] - column[i - window]
+            means.append(total / window)
+
+        return means
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def exceeding(self, field: str, threshold: int):
+        column = self.column(field)
+
+        if self.__numpy is not None:
+            return self.__numpy.flatnonzero(column > threshold)
+
+        return array(self.__ARRAY_TYPECODE, (i for i, value in enumerate(column) if value > threshold))
+
+
+    def flagged(self, field: str, mask: int):
+        column = self.column(field)
+
+        if self.__numpy is not None:
+            return self.__numpy.flatnonzero(column & mask)
+
+        return array(self.__ARRAY_TYPECODE, (i for i, value in enumerate(column) if value & mask))
+
+
+    def overcurrent(self, threshold: int):
+        return self.exceeding('filtered_main_current', threshold)  # mA
+
+
+    def short_circuits(self):
+        return self.flagged('central_state', self.__SHORT_CIRCUIT)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __populated_column(self, field):
+        column = self.column(field)
+
+        if not len(column):
+            raise ValueError('empty batch')
+
+        return column
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def is_numpy(self):
+        return self.__numpy is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'ControlRouterReportBatch:{{len:{len(self)}, is_numpy:{self.is_numpy}}}'
@@ -37,7 +37,7 @@ class EquipmentReport(object):
 
 
     @classmethod
-    def __class_for_type_name(cls, type_name):
+    def class_for_type_name(cls, type_name):
         # may raise KeyError
         return cls.__TYPE_MAPPING[type_name]
 
@@ -49,7 +49,7 @@ class EquipmentReport(object):
         type_name = jdict.get('type')
 
         try:
-            equipment_cls = cls.__class_for_type_name(type_name)
+            equipment_cls = cls.class_for_type_name(type_name)
         except KeyError:
             raise TypeError(f'unsupported type:{type_name}')
 
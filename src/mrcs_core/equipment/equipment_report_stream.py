@@ -0,0 +1,166 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A streaming decoder for mixed equipment reports, in newline-delimited JSON
+
+The source is an iterable of str lines (as from a text file, each line possibly holding several newline-separated
+records) or of bytes chunks (as from a socket or binary file, split anywhere - a record may span chunks).
+
+Records are taken in batches: each batch is parsed, grouped by type, and each group is decoded by its class in a
+single tight loop. Reports are yielded in source order. Bad records - unparseable, untyped, of an unknown type or
+rejected by their class - are counted by type name and skipped, rather than raising. Records that cannot be
+parsed, or that carry no type, are counted under None.
+
+{"type": "TurnoutReport", "addr": 3, "position": "P1"}
+{"type": "TrackReport", "mode": "SHORT_CIRCUIT"}
+"""
+
+from collections import Counter
+from typing import Iterable, Iterator
+
+from mrcs_core.data.json import JSONable, JSONCodec
+from mrcs_core.equipment.equipment_report import EquipmentReport
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class EquipmentReportStream(object):
+    """
+    A streaming decoder for mixed equipment reports, in newline-delimited JSON
+    """
+
+    DEFAULT_BATCH_SIZE = 1024
+
+    __DECODE_ERRORS = (AttributeError, KeyError, TypeError, ValueError)
+
+
+    @staticmethod
+    def lines(source: Iterable[str | bytes]) -> Iterator[str | bytes]:
+        # records are separated by newline only - not str.splitlines() separators, which may occur within JSON strings
+        remainder = b''
+
+        for item in source:
+            if isinstance(item, str):
+                pieces = item.split('\n')
+
+                if not pieces[-1]:
+                    pieces.pop()
+
+                yield from (piece[:-1] if piece.endswith('\r') else piece for piece in pieces)
+                continue
+
+            pieces = (remainder + item).split(b'\n')
+            remainder = pieces.pop()
+
+            yield from (piece[:-1] if piece.endswith(b'\r') else piece for piece in pieces)
+
+        if remainder:
+            yield remainder[:-1] if remainder.endswith(b'\r') else remainder
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE, codec: JSONCodec | None = None):
+        if batch_size < 1:
+            raise ValueError(f'invalid batch_size:{batch_size}')
+
+        self.__batch_size = batch_size
+        self.__codec = JSONCodec.default() if codec is None else codec
+
+        self.__decode_counts = Counter()
+        self.__error_counts = Counter()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decode(self, source: Iterable[str | bytes]) -> Iterator[JSONable]:
+        batch = []
+
+        for line in self.lines(source):
+            if not line.strip():
+                continue
+
+            batch.append(line)
+
+            if len(batch) == self.__batch_size:
+                yield from self.decode_batch(batch)
+                batch = []
+
+        if batch:
+            yield from self.decode_batch(batch)
+
+
+    def decode_batch(self, batch: list[str | bytes]) -> list[JSONable]:
+        loads = self.__codec.loads
+        groups = {}
+
+        # parse and group...
+        for index, line in enumerate(batch):
+            try:
+                jdict = loads(line)
+                type_name = jdict.get('type')
+                groups.setdefault(type_name, []).append((index, jdict))
+
+            except self.__DECODE_ERRORS:
+                self.__error_counts[None] += 1
+
+        # decode per type...
+        reports = [None] * len(batch)
+
+        for type_name, group in groups.items():
+            try:
+                construct = EquipmentReport.class_for_type_name(type_name).construct_from_jdict
+            except KeyError:
+                self.__error_counts[type_name] += len(group)
+                continue
+
+            errors = 0
+
+            for index, jdict in group:
+                try:
+                    reports[index] = construct(jdict)
+                except self.__DECODE_ERRORS:
+                    errors += 1
+
+            self.__decode_counts[type_name] += len(group) - errors
+
+            if errors:
+                self.__error_counts[type_name] += errors
+
+        return [report for report in reports if report is not None]
+
+
+    def reset_counts(self):
+        self.__decode_counts.clear()
+        self.__error_counts.clear()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def batch_size(self):
+        return self.__batch_size
+
+
+    @property
+    def decode_counts(self) -> dict[str, int]:
+        return dict(self.__decode_counts)
+
+
+    @property
+    def error_counts(self) -> dict[str | None, int]:
+        return dict(self.__error_counts)
+
+
+    @property
+    def error_count(self) -> int:
+        return self.__error_counts.total()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'EquipmentReportStream:{{batch_size:{self.batch_size}, decode_counts:{self.decode_counts}, '
+                f'error_counts:{self.error_counts}}}')
@@ -18,43 +18,32 @@ A motive power unit (MPU) configuration
 }
 """
 
-from collections import OrderedDict
 from typing import Any
 
 from mrcs_core.data.json import JSONable
+from mrcs_core.data.json_fields import JSONEnumField, JSONField, JSONNestedField, json_fields
 from mrcs_core.equipment.motive_power_unit.mpu_enums import ThrottleSteps
 from mrcs_core.equipment.motive_power_unit.mpu_functions import MPUFunctions
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
+@json_fields(
+    JSONField('addr', 'mpu_address'),
+    JSONNestedField('functions', 'functions', MPUFunctions),
+    JSONField('busy', 'is_busy'),
+    JSONEnumField('stepping', 'stepping', ThrottleSteps, is_optional=True),
+    JSONField('speed', 'speed_setting'),
+    JSONField('reverse', 'reverse'),
+    JSONField('consist', 'double_traction'),
+    JSONField('smart_search', 'smart_search')
+)
 class MPUConfigurationReport(JSONable):
     """
     A motive power unit (MPU) configuration
     """
 
 
-    @classmethod
-    def construct_from_jdict(cls, jdict) -> MPUConfigurationReport:
-        type_name = jdict.get('type')
-
-        if type_name != cls.__name__:
-            raise TypeError(f'required type:{cls.__name__} got:{type_name}')
-
-        mpu_address = jdict.get('addr')
-        functions = MPUFunctions.construct_from_jdict(jdict.get('functions'))
-        is_busy = jdict.get('busy')
-        stepping = ThrottleSteps[jdict.get('stepping')]
-        speed_setting = jdict.get('speed')
-        reverse = jdict.get('reverse')
-        double_traction = jdict.get('consist')
-        smart_search = jdict.get('smart_search')
-
-        return cls(mpu_address, functions, is_busy, stepping, speed_setting, reverse, double_traction, smart_search)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
     def __init__(self, mpu_address: int, functions: MPUFunctions, is_busy: bool, stepping: ThrottleSteps,
                  speed_setting: int, reverse: bool, double_traction: bool, smart_search: bool):
         self._mpu_address = mpu_address
@@ -67,40 +56,10 @@ class MPUConfigurationReport(JSONable):
         self._smart_search = smart_search
 
 
-    def __eq__(self, other: Any):
-        try:
-            return (self.mpu_address == other.mpu_address and self.functions == other.functions and
-                    self.is_busy == other.is_busy and self.stepping == other.stepping and
-                    self.speed_setting == other.speed_setting and self.reverse == other.reverse and
-                    self.double_traction == other.double_traction and self.smart_search == other.smart_search)
-        except (AttributeError, TypeError):
-            return False
-
-
     def __lt__(self, other: Any):
         return self.mpu_address < other.mpu_address
 
 
-    # ----------------------------------------------------------------------------------------------------------------
-
-    # noinspection PyUnresolvedReferences
-    def as_json(self, **kwargs):
-        jdict = OrderedDict()
-
-        jdict['type'] = self.type_name()
-
-        jdict['addr'] = self.mpu_address
-        jdict['functions'] = self.functions
-        jdict['busy'] = self.is_busy
-        jdict['stepping'] = None if self.stepping is None else self.stepping.name
-        jdict['speed'] = self.speed_setting
-        jdict['reverse'] = self.reverse
-        jdict['consist'] = self.double_traction
-        jdict['smart_search'] = self.smart_search
-
-        return jdict
-
-
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
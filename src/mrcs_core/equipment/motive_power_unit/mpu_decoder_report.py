@@ -20,39 +20,28 @@ Class 60    0x004   0000 0011   0000 1110      0000 0000    0001 1000        4
 }
 """
 
-from collections import OrderedDict
 from typing import Any
 
 from mrcs_core.data.json import JSONable
+from mrcs_core.data.json_fields import JSONField, json_fields
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
+@json_fields(
+    JSONField('addr', 'mpu_address'),
+    JSONField('received', 'receive_count'),
+    JSONField('errors', 'error_count'),
+    JSONField('opts', 'opts'),
+    JSONField('speed', 'speed'),
+    JSONField('qos', 'qos')
+)
 class MPUDecoderReport(JSONable):
     """
     A DCC motive power unit (MPU) decoder state
     """
 
 
-    @classmethod
-    def construct_from_jdict(cls, jdict) -> MPUDecoderReport:
-        type_name = jdict.get('type')
-
-        if type_name != cls.__name__:
-            raise TypeError(f'required type:{cls.__name__} got:{type_name}')
-
-        mpu_address = jdict.get('addr')
-        receive_count = jdict.get('received')
-        error_count = jdict.get('errors')
-        opts = jdict.get('opts')
-        speed = jdict.get('speed')
-        qos = jdict.get('qos')
-
-        return cls(mpu_address, receive_count, error_count, opts, speed, qos)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
     def __init__(self, mpu_address: int, receive_count: int, error_count: int, opts: int, speed: int, qos: int):
         self._mpu_address = mpu_address
         self._receive_count = receive_count
@@ -62,37 +51,10 @@ class MPUDecoderReport(JSONable):
         self._qos = qos
 
 
-    def __eq__(self, other: Any):
-        try:
-            return (self.mpu_address == other.mpu_address and self.receive_count == other.receive_count and
-                    self.error_count == other.error_count and self.opts == other.opts and
-                    self.speed == other.speed and self.qos == other.qos)
-        except (AttributeError, TypeError):
-            return False
-
-
     def __lt__(self, other: Any):
         return self.mpu_address < other.mpu_address
 
 
-    # ----------------------------------------------------------------------------------------------------------------
-
-    # noinspection PyUnresolvedReferences
-    def as_json(self, **kwargs):
-        jdict = OrderedDict()
-
-        jdict['type'] = self.type_name()
-
-        jdict['addr'] = self.mpu_address
-        jdict['received'] = self.receive_count
-        jdict['errors'] = self.error_count
-        jdict['opts'] = self.opts
-        jdict['speed'] = self.speed
-        jdict['qos'] = self.qos
-
-        return jdict
-
-
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
@@ -0,0 +1,177 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A change-detection stage for equipment report messages, to be applied before they are published or recorded
+
+Control routers resend unchanged reports many times a second. Each report message is keyed on its routing key, its
+report type and the identity of its equipment - the block ID, turnout or MPU address. A report that is identical to
+the previous report under its key is suppressed. A changed report is passed on whole or, if is_delta, as a
+ReportDelta against the previous report. In either case, the first report under a key, and the first after each
+keyframe_interval, is passed on whole as a keyframe, so that a consumer that joins late, or has lost a delta,
+recovers within that interval.
+
+Reports are compared as native jdicts, so a repeat costs one as_native(..) and one dict comparison. Messages whose
+body is not an equipment report are passed on unchanged. Deltas are applied by a ReportDeltaDecoder.
+
+change_filter = ReportChangeFilter(is_delta=True)
+
+for message in change_filter.filter_batch(messages):
+    recorder.record(message)
+"""
+
+import time
+from collections import Counter
+from typing import Callable, Iterable
+
+from mrcs_core.data.json import JSONable, JSONCodec
+from mrcs_core.equipment.report_delta import ReportDelta
+from mrcs_core.messaging.message import Message
+from mrcs_core.messaging.routing_key import RoutingKey
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ReportChangeFilter(object):
+    """
+    A change-detection stage for equipment report messages
+    """
+
+    DEFAULT_KEYFRAME_INTERVAL = 5.0  # seconds
+
+    # report type: jdict key of the equipment identity, or None where the equipment reports once per control router
+    __IDENTITY_KEYS = {
+        'BlockOccupancyReport': 'id',
+        'BlockVoltageReport': 'id',
+        'ControlRouterReport': None,
+        'MPUConfigurationReport': 'addr',
+        'MPUDecoderReport': 'addr',
+        'TrackReport': None,
+        'TurnoutReport': 'addr'
+    }
+
+
+    @classmethod
+    def identity_key(cls, report_type):
+        # may raise KeyError
+        return cls.__IDENTITY_KEYS[report_type]
+
+
+    @classmethod
+    def report_key(cls, routing_key: RoutingKey, report_type: str, identity):
+        return routing_key, report_type, cls.__hashable(identity)
+
+
+    @classmethod
+    def __hashable(cls, value):
+        if isinstance(value, dict):
+            return tuple((key, cls.__hashable(item)) for key, item in sorted(value.items()))
+
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.__hashable(item) for item in value)
+
+        return value
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, keyframe_interval: float = DEFAULT_KEYFRAME_INTERVAL, is_delta: bool = False,
+                 codec: JSONCodec | None = None, clock: Callable[[], float] = time.monotonic):
+        if keyframe_interval <= 0:
+            raise ValueError(f'invalid keyframe_interval:{keyframe_interval}')
+
+        self.__keyframe_interval = float(keyframe_interval)
+        self.__is_delta = bool(is_delta)
+        self.__codec = JSONCodec.default() if codec is None else codec
+        self.__clock = clock
+
+        self.__states = {}  # report key: [native jdict, keyframe time, seq]
+        self.__counts = Counter()
+
+
+    def __len__(self):
+        return len(self.__states)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def filter(self, message: Message) -> Message | None:
+        body = message.body
+        native = self.__codec.as_native(body) if isinstance(body, JSONable) else body
+
+        try:
+            report_type = native.get('type')
+            identity_key = self.identity_key(report_type)
+        except (AttributeError, KeyError):
+            self.__counts['other'] += 1
+            return message
+
+        identity = None if identity_key is None else native.get(identity_key)
+        key = self.report_key(message.routing_key, report_type, identity)
+
+        now = self.__clock()
+        state = self.__states.get(key)
+
+        if state is None or now - state[1] >= self.__keyframe_interval:
+            self.__states[key] = [native, now, 0]
+            self.__counts['keyframe'] += 1
+            return message
+
+        previous = state[0]
+
+        if native == previous:
+            self.__counts['repeat'] += 1
+            return None
+
+        state[0] = native
+
+        if not self.__is_delta:
+            self.__counts['change'] += 1
+            return message
+
+        state[2] += 1
+        self.__counts['delta'] += 1
+
+        delta = ReportDelta.between(report_type, identity, state[2], previous, native)
+
+        return Message(message.routing_key, delta, origin=message.origin)
+
+
+    def filter_batch(self, messages: Iterable[Message]) -> list[Message]:
+        filtered = (self.filter(message) for message in messages)
+
+        return [message for message in filtered if message is not None]
+
+
+    def reset(self):
+        # the next report under every key is a keyframe
+        self.__states = {}
+
+
+    def reset_counts(self):
+        self.__counts.clear()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def keyframe_interval(self):
+        return self.__keyframe_interval
+
+
+    @property
+    def is_delta(self):
+        return self.__is_delta
+
+
+    @property
+    def counts(self) -> dict[str, int]:
+        return dict(self.__counts)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'ReportChangeFilter:{{keyframe_interval:{self.keyframe_interval}, is_delta:{self.is_delta}, '
+                f'keys:{len(self)}, counts:{self.counts}}}')
@@ -0,0 +1,100 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+The changes to an equipment report, relative to the previous report of the same equipment
+
+A ReportDelta is sent by a ReportChangeFilter in place of a changed report, and applied by a ReportDeltaDecoder.
+seq counts the deltas since the last full report (the keyframe) of the equipment, so that a lost delta is detected.
+id is the identity field of the report - the block ID, turnout or MPU address - or None for equipment that reports
+once per control router.
+
+{
+  "type": "ReportDelta",
+  "report": "MPUDecoderReport",
+  "id": 4660,
+  "seq": 3,
+  "set": {"speed": 92, "qos": 4},
+  "unset": []
+}
+"""
+
+from mrcs_core.data.json import JSONable
+from mrcs_core.data.json_fields import JSONField, json_fields
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+@json_fields(
+    JSONField('report', 'report_type'),
+    JSONField('id', 'identity'),
+    JSONField('seq', 'seq'),
+    JSONField('set', 'changes'),
+    JSONField('unset', 'removals')
+)
+class ReportDelta(JSONable):
+    """
+    The changes to an equipment report, relative to the previous report of the same equipment
+    """
+
+    @classmethod
+    def between(cls, report_type: str, identity, seq: int, previous: dict, current: dict):
+        # previous and current are native jdicts
+        changes = {key: value for key, value in current.items() if key not in previous or previous[key] != value}
+        removals = [key for key in previous if key not in current]
+
+        return cls(report_type, identity, seq, changes, removals)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, report_type: str, identity, seq: int, changes: dict, removals: list):
+        self.__report_type = report_type
+        self.__identity = identity
+        self.__seq = seq
+        self.__changes = changes
+        self.__removals = removals
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def apply(self, previous: dict) -> dict:
+        current = {key: value for key, value in previous.items() if key not in self.removals}
+        current.update(self.changes)
+
+        return current
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def report_type(self):
+        return self.__report_type
+
+
+    @property
+    def identity(self):
+        return self.__identity
+
+
+    @property
+    def seq(self):
+        return self.__seq
+
+
+    @property
+    def changes(self):
+        return self.__changes
+
+
+    @property
+    def removals(self):
+        return self.__removals
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'{self.__class__.__name__}:{{report_type:{self.report_type}, identity:{self.identity}, '
+                f'seq:{self.seq}, changes:{self.changes}, removals:{self.removals}}}')
@@ -0,0 +1,98 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+The consumer side of a ReportChangeFilter - restores whole equipment reports from keyframes and ReportDeltas
+
+Each whole report is held as the state of its equipment, and passed on. Each delta is applied to that state, and the
+resulting report is passed on in its place, as a jdict body. A delta that does not follow on from the state - the
+first delta after joining, or one after a lost delta - is dropped, with the state, until the next keyframe.
+
+Messages whose body is neither an equipment report nor a delta are passed on unchanged.
+"""
+
+from collections import Counter
+
+from mrcs_core.data.json import JSONable, JSONCodec
+from mrcs_core.equipment.report_change_filter import ReportChangeFilter
+from mrcs_core.equipment.report_delta import ReportDelta
+from mrcs_core.messaging.message import Message
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ReportDeltaDecoder(object):
+    """
+    Restores whole equipment reports from keyframes and ReportDeltas
+    """
+
+    def __init__(self, codec: JSONCodec | None = None):
+        self.__codec = JSONCodec.default() if codec is None else codec
+
+        self.__states = {}  # report key: [native jdict, seq]
+        self.__counts = Counter()
+
+
+    def __len__(self):
+        return len(self.__states)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def decode(self, message: Message) -> Message | None:
+        body = message.body
+
+        if isinstance(body, ReportDelta):
+            return self.__apply(message, body)
+
+        native = self.__codec.as_native(body) if isinstance(body, JSONable) else body
+
+        try:
+            report_type = native.get('type')
+
+            if report_type == ReportDelta.type_name():
+                return self.__apply(message, ReportDelta.construct_from_jdict(native))
+
+            identity_key = ReportChangeFilter.identity_key(report_type)
+
+        except (AttributeError, KeyError, TypeError):
+            self.__counts['other'] += 1
+            return message
+
+        identity = None if identity_key is None else native.get(identity_key)
+        key = ReportChangeFilter.report_key(message.routing_key, report_type, identity)
+
+        self.__states[key] = [native, 0]
+        self.__counts['keyframe'] += 1
+
+        return message
+
+
+    def __apply(self, message: Message, delta: ReportDelta):
+        key = ReportChangeFilter.report_key(message.routing_key, delta.report_type, delta.identity)
+        state = self.__states.get(key)
+
+        if state is None or delta.seq != state[1] + 1:
+            self.__states.pop(key, None)
+            self.__counts['gap'] += 1
+            return None
+
+        state[0] = delta.apply(state[0])
+        state[1] = delta.seq
+        self.__counts['delta'] += 1
+
+        return Message(message.routing_key, dict(state[0]), origin=message.origin)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def counts(self) -> dict[str, int]:
+        return dict(self.__counts)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'ReportDeltaDecoder:{{keys:{len(self)}, counts:{self.counts}}}'
@@ -9,15 +9,18 @@ Based on code:
 https://github.com/botmonster/z21aio/tree/main
 """
 
-from collections import OrderedDict
-from typing import Any, Self
+from typing import Self
 
 from mrcs_core.data.json import JSONable
+from mrcs_core.data.json_fields import JSONEnumField, json_fields
 from mrcs_core.equipment.track.track_enums import TrackMode
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
+@json_fields(
+    JSONEnumField('mode', 'mode', TrackMode)
+)
 class TrackReport(JSONable):
     """
     the track state
@@ -43,24 +46,6 @@ class TrackReport(JSONable):
         self.__mode = mode
 
 
-    def __eq__(self, other: Any):
-        try:
-            return self.mode == other.mode
-        except (AttributeError, TypeError):
-            return False
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def as_json(self, **kwargs):
-        jdict = OrderedDict()
-
-        jdict['type'] = self.type_name()
-        jdict['mode'] = self.mode.name
-
-        return jdict
-
-
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
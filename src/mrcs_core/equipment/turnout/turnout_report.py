@@ -12,67 +12,34 @@ A reported turnout state
 }
 """
 
-from collections import OrderedDict
 from typing import Any
 
 from mrcs_core.data.json import JSONable
+from mrcs_core.data.json_fields import JSONEnumField, JSONField, json_fields
 from mrcs_core.equipment.turnout.turnout_enums import TurnoutPosition
 
 
 # --------------------------------------------------------------------------------------------------------------------
 
+@json_fields(
+    JSONField('addr', 'turnout_address'),
+    JSONEnumField('position', 'position', TurnoutPosition)
+)
 class TurnoutReport(JSONable):
     """
     A reported turnout state
     """
 
 
-    @classmethod
-    def construct_from_jdict(cls, jdict) -> TurnoutReport:
-        type_name = jdict.get('type')
-
-        if type_name != cls.__name__:
-            raise TypeError(f'required type:{cls.__name__} got:{type_name}')
-
-        turnout_address = jdict.get('addr')
-
-        # may raise KeyError
-        position = TurnoutPosition[jdict.get('position')]
-
-        return cls(turnout_address, position)
-
-
-    # ----------------------------------------------------------------------------------------------------------------
-
     def __init__(self, turnout_address: int, position: TurnoutPosition):
         self.__turnout_address = turnout_address
         self.__position = position
 
 
-    def __eq__(self, other: Any):
-        try:
-            return self.turnout_address == other.turnout_address and self.position == other.position
-        except (AttributeError, TypeError):
-            return False
-
-
     def __lt__(self, other: Any):
         return self.turnout_address < other.turnout_address
 
 
-    # ----------------------------------------------------------------------------------------------------------------
-
-    def as_json(self, **kwargs):
-        jdict = OrderedDict()
-
-        jdict['type'] = self.type_name()
-
-        jdict['addr'] = self.turnout_address
-        jdict['position'] = self.position.name
-
-        return jdict
-
-
     # ----------------------------------------------------------------------------------------------------------------
 
     @property
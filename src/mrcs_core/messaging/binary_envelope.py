@@ -0,0 +1,278 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+An opt-in compact binary envelope for message payloads, negotiated by content type
+
+Layout (network byte order):
+    version         B
+    body_code       B       0 for a compact JSON body, otherwise the code of a fixed-field report layout
+    origin_length   B
+    origin          origin_length bytes, UTF-8
+    body            the remainder
+
+Equipment reports with a registered layout travel as packed fixed fields - any body that does not fit its layout
+travels as compact JSON. A body fits only if the layout restores it exactly - the same keys, and values of the same
+types - so that no key is lost, and no bool becomes an int. Decoded bodies are jdicts, as with text JSON payloads.
+
+https://docs.python.org/3/library/struct.html
+https://www.rabbitmq.com/docs/publishers#message-properties
+"""
+
+import struct
+from abc import ABC, abstractmethod
+
+from mrcs_core.data.json import JSONCodec, JSONify
+from mrcs_core.equipment.block.block_enums import BlockVoltage
+from mrcs_core.equipment.track.track_enums import TrackMode
+from mrcs_core.equipment.turnout.turnout_enums import TurnoutPosition
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryLayout(ABC):
+    """
+    a fixed-field binary layout for the jdict of one report type
+    """
+
+
+    def __init__(self, type_name: str, code: int, fmt: str):
+        self.__type_name = type_name
+        self.__code = code
+        self.__struct = struct.Struct(fmt)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def pack(self, jdict) -> bytes:
+        packed = self.__struct.pack(*self.fields(jdict))  # may raise KeyError, TypeError, ValueError, struct.error
+
+        if not self.__is_identical(self.unpack(packed), jdict):
+            raise ValueError(f'jdict is not restored by {self.type_name} layout: {jdict}')
+
+        return packed
+
+
+    def unpack(self, buffer, offset=0):
+        return self.jdict(self.__struct.unpack_from(buffer, offset))  # may raise struct.error
+
+
+    @abstractmethod
+    def fields(self, jdict) -> tuple:
+        pass
+
+
+    @abstractmethod
+    def jdict(self, fields: tuple) -> dict:
+        pass
+
+
+    @classmethod
+    def __is_identical(cls, restored, original):
+        if isinstance(restored, dict):
+            return (isinstance(original, dict) and restored.keys() == original.keys() and
+                    all(cls.__is_identical(value, original[key]) for key, value in restored.items()))
+
+        return type(restored) is type(original) and restored == original
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def type_name(self):
+        return self.__type_name
+
+
+    @property
+    def code(self):
+        return self.__code
+
+
+    @property
+    def size(self):
+        return self.__struct.size
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'{self.__class__.__name__}:{{type_name:{self.type_name}, code:{self.code}, '
+                f'format:{self.__struct.format}}}')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TurnoutReportLayout(BinaryLayout):
+    """
+    addr, position
+    """
+
+
+    def __init__(self):
+        super().__init__('TurnoutReport', 1, '>HB')
+
+
+    def fields(self, jdict) -> tuple:
+        return jdict['addr'], TurnoutPosition[jdict['position']].value
+
+
+    def jdict(self, fields: tuple) -> dict:
+        addr, position = fields
+        return {'type': self.type_name, 'addr': addr, 'position': TurnoutPosition(position).name}
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BlockVoltageReportLayout(BinaryLayout):
+    """
+    id (addr, channel, rid), voltage
+    """
+
+
+    def __init__(self):
+        super().__init__('BlockVoltageReport', 2, '>HBHH')
+
+
+    def fields(self, jdict) -> tuple:
+        block_id = jdict['id']
+        return block_id['addr'], block_id['channel'], block_id['rid'], BlockVoltage[jdict['voltage']].value
+
+
+    def jdict(self, fields: tuple) -> dict:
+        addr, channel, rid, voltage = fields
+        return {'type': self.type_name, 'id': {'addr': addr, 'channel': channel, 'rid': rid},
+                'voltage': BlockVoltage(voltage).name}
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MPUDecoderReportLayout(BinaryLayout):
+    """
+    addr, received, errors, opts, speed, qos
+    """
+
+
+    def __init__(self):
+        super().__init__('MPUDecoderReport', 3, '>HIIBBB')
+
+
+    def fields(self, jdict) -> tuple:
+        return jdict['addr'], jdict['received'], jdict['errors'], jdict['opts'], jdict['speed'], jdict['qos']
+
+
+    def jdict(self, fields: tuple) -> dict:
+        addr, received, errors, opts, speed, qos = fields
+        return {'type': self.type_name, 'addr': addr, 'received': received, 'errors': errors, 'opts': opts,
+                'speed': speed, 'qos': qos}
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class TrackReportLayout(BinaryLayout):
+    """
+    mode
+    """
+
+
+    def __init__(self):
+        super().__init__('TrackReport', 4, '>B')
+
+
+    def fields(self, jdict) -> tuple:
+        return (TrackMode[jdict['mode']].value,)
+
+
+    def jdict(self, fields: tuple) -> dict:
+        return {'type': self.type_name, 'mode': TrackMode(fields[0]).name}
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class BinaryEnvelope(object):
+    """
+    an opt-in compact binary envelope for message payloads
+    """
+
+    CONTENT_TYPE = 'application/x-mrcs-envelope'
+    JSON_CONTENT_TYPE = 'application/json'
+
+    __VERSION = 1
+    __JSON_BODY = 0
+
+    __HEADER = struct.Struct('>BBB')
+
+    __LAYOUTS = (TurnoutReportLayout(), BlockVoltageReportLayout(), MPUDecoderReportLayout(), TrackReportLayout())
+
+    __LAYOUTS_BY_TYPE = {layout.type_name: layout for layout in __LAYOUTS}
+    __LAYOUTS_BY_CODE = {layout.code: layout for layout in __LAYOUTS}
+
+
+    @classmethod
+    def register(cls, layout: BinaryLayout):
+        if layout.code == cls.__JSON_BODY or layout.code in cls.__LAYOUTS_BY_CODE:
+            raise ValueError(f'code {layout.code} is reserved or already registered')
+
+        cls.__LAYOUTS_BY_TYPE[layout.type_name] = layout
+        cls.__LAYOUTS_BY_CODE[layout.code] = layout
+
+
+    @classmethod
+    def layouts(cls):
+        return tuple(cls.__LAYOUTS_BY_CODE.values())
+
+
+    @classmethod
+    def is_binary(cls, content_type: str | None):
+        return content_type == cls.CONTENT_TYPE
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def encode(cls, origin: str, body) -> bytes:
+        origin_bytes = origin.encode()
+
+        if len(origin_bytes) > 255:
+            raise ValueError(f'origin too long: {origin}')
+
+        jdict = JSONify.as_jdict(body)
+        layout = cls.__LAYOUTS_BY_TYPE.get(jdict.get('type')) if isinstance(jdict, dict) else None
+
+        if layout is not None:
+            try:
+                body_bytes = layout.pack(jdict)
+                return cls.__HEADER.pack(cls.__VERSION, layout.code, len(origin_bytes)) + origin_bytes + body_bytes
+            except (KeyError, TypeError, ValueError, struct.error):
+                pass  # does not fit the layout - travel as JSON
+
+        return (cls.__HEADER.pack(cls.__VERSION, cls.__JSON_BODY, len(origin_bytes)) + origin_bytes +
+                JSONCodec.default().dumpb(jdict))
+
+
+    @classmethod
+    def decode(cls, raw: bytes):
+        try:
+            version, body_code, origin_length = cls.__HEADER.unpack_from(raw)
+        except struct.error:
+            raise ValueError(f'truncated envelope: {raw!r}')
+
+        if version != cls.__VERSION:
+            raise ValueError(f'unsupported envelope version: {version}')
+
+        offset = cls.__HEADER.size
+        origin = bytes(raw[offset:offset + origin_length]).decode()
+        offset += origin_length
+
+        if body_code == cls.__JSON_BODY:
+            return origin, JSONCodec.default().loads(bytes(raw[offset:]))
+
+        try:
+            layout = cls.__LAYOUTS_BY_CODE[body_code]
+        except KeyError:
+            raise ValueError(f'unsupported body code: {body_code}')
+
+        if len(raw) - offset != layout.size:
+            raise ValueError(f'body size mismatch for {layout.type_name}: {len(raw) - offset}')
+
+        return origin, layout.unpack(raw, offset)
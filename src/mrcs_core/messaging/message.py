@@ -14,12 +14,12 @@ A structured representation of a message
 https://stackoverflow.com/questions/13484726/safe-enough-8-character-short-unique-random-string
 """
 
-import json
 import uuid
 from collections import OrderedDict
 from typing import Any
 
-from mrcs_core.data.json import JSONable, JSONify
+from mrcs_core.data.json import JSONable, JSONCodec, JSONify
+from mrcs_core.messaging.binary_envelope import BinaryEnvelope
 from mrcs_core.messaging.routing_key import PublicationRoutingKey, RoutingKey
 
 
@@ -73,6 +73,13 @@ class Message(JSONable):
 
         # ------------------------------------------------------------------------------------------------------------
 
+        def as_bytes(self, content_type: str | None = None) -> bytes:
+            if BinaryEnvelope.is_binary(content_type):
+                return BinaryEnvelope.encode(self.origin, self.body)
+
+            return JSONCodec.default().dumpb(self)  # compact
+
+
         def as_json(self, **kwargs):
             jdict = OrderedDict()
 
@@ -96,8 +103,12 @@ class Message(JSONable):
 
 
     @classmethod
-    def construct_from_callback(cls, routing_key: RoutingKey, raw_payload: bytes):
-        payload = Message.Payload.construct_from_jdict(json.loads(raw_payload.decode()))
+    def construct_from_callback(cls, routing_key: RoutingKey, raw_payload: bytes, content_type: str | None = None):
+        if BinaryEnvelope.is_binary(content_type):
+            origin, body = BinaryEnvelope.decode(raw_payload)  # may raise ValueError
+            return cls(routing_key, body, origin=origin)
+
+        payload = Message.Payload.construct_from_jdict(cls.loads(raw_payload))
 
         if not payload:
             raise RuntimeError(f'Invalid payload: {raw_payload.decode()}')
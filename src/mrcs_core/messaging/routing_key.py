@@ -6,13 +6,18 @@ Created on 1 Nov 2025
 A structured representation of a message routing key, with source and target
 
 VIS.001.001.MPU.001.*
+
+Routing keys are parsed in a single pass, without regular expressions, and parsed keys are memoised - routing keys
+are immutable, so a repeated routing string returns the same object.
 """
 
 import re
 from abc import ABC
+from functools import lru_cache
 from typing import Any
 
-from mrcs_core.data.equipment_identity import EquipmentFilter, EquipmentIdentifier, EquipmentSpecification
+from mrcs_core.data.equipment_identity import EquipmentFilter, EquipmentIdentifier, EquipmentSpecification, \
+    EquipmentType
 from mrcs_core.data.json import JSONable
 
 
@@ -23,10 +28,63 @@ class RoutingKey(JSONable, ABC):
     An abstract routing key
     """
 
+    __slots__ = ('__source', '__target')
+
+    _PARSE_CACHE_SIZE = 4096  # distinct routing strings
+
+    __PATTERN = re.compile(r'[A-Z*]+\.[0-9*-]+\.[0-9*]+\.[A-Z*]+\.[0-9*-]+\.[0-9*]+')
+    __EQUIPMENT_TYPES = {equipment_type.value: equipment_type for equipment_type in EquipmentType}
+
+
+    @classmethod
+    def is_valid(cls, routing: str) -> bool:
+        return bool(cls.__PATTERN.fullmatch(routing))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def _parse(cls, routing: str, source_class: type[EquipmentSpecification]):
+        pieces = routing.split('.')
+
+        if len(pieces) != 6:
+            raise ValueError(routing)
+
+        is_identifier = source_class is EquipmentIdentifier
+
+        try:
+            source = source_class(cls.__parse_equipment_type(pieces[0], not is_identifier),
+                                  cls.__parse_number(pieces[1], True, True),
+                                  cls.__parse_number(pieces[2], not is_identifier, False))
+
+            target = EquipmentFilter(cls.__parse_equipment_type(pieces[3], True),
+                                     cls.__parse_number(pieces[4], True, True),
+                                     cls.__parse_number(pieces[5], True, False))
+        except (KeyError, ValueError):
+            raise ValueError(routing)
+
+        return source, target
+
+
+    @classmethod
+    def __parse_equipment_type(cls, piece: str, is_wildcard_permitted: bool):
+        if piece == '*' and is_wildcard_permitted:
+            return None
+
+        return cls.__EQUIPMENT_TYPES[piece]  # may raise KeyError
+
 
     @staticmethod
-    def is_valid(routing: str) -> bool:
-        return bool(re.fullmatch(r'[A-Z*]+\.[0-9*-]+\.[0-9*]+\.[A-Z*]+\.[0-9*-]+\.[0-9*]+', routing))
+    def __parse_number(piece: str, is_wildcard_permitted: bool, is_signed: bool):
+        if piece == '*' and is_wildcard_permitted:
+            return None
+
+        digits = piece[1:] if is_signed and piece.startswith('-') else piece
+
+        if not (digits.isascii() and digits.isdigit()):
+            raise ValueError(piece)
+
+        return int(piece)
 
 
     # ----------------------------------------------------------------------------------------------------------------
@@ -38,7 +96,14 @@ class RoutingKey(JSONable, ABC):
         self.__target = target
 
 
+    def __hash__(self):
+        return hash((self.__source, self.__target))
+
+
     def __eq__(self, other: Any):
+        if self is other:
+            return True
+
         try:
             return self.source == other.source and self.target == other.target
         except (AttributeError, TypeError):
@@ -95,21 +160,21 @@ class PublicationRoutingKey(RoutingKey):
     A routing key for a publisher, with a fully-specified source
     """
 
+    __slots__ = ()
+
 
     @classmethod
     def construct_from_jdict(cls, jdict):
         if not jdict:
             return None
 
-        if not cls.is_valid(jdict):
-            raise ValueError(jdict)
-
-        pieces = jdict.split('.')
+        return cls.__construct_from_wire(str(jdict))
 
-        source = EquipmentIdentifier.construct_from_jdict('.'.join(pieces[:3]))
-        target = EquipmentFilter.construct_from_jdict('.'.join(pieces[3:]))
 
-        return cls(source, target)
+    @classmethod
+    @lru_cache(maxsize=RoutingKey._PARSE_CACHE_SIZE)
+    def __construct_from_wire(cls, routing: str):
+        return cls(*cls._parse(routing, EquipmentIdentifier))
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -119,18 +184,18 @@ class SubscriptionRoutingKey(RoutingKey):
     A routing key for a subscriber, with a partially-specified source
     """
 
+    __slots__ = ()
+
 
     @classmethod
     def construct_from_jdict(cls, jdict):
         if not jdict:
             return None
 
-        if not cls.is_valid(jdict):
-            raise ValueError(jdict)
+        return cls.__construct_from_wire(str(jdict))
 
-        pieces = jdict.split('.')
 
-        source = EquipmentFilter.construct_from_jdict('.'.join(pieces[:3]))
-        target = EquipmentFilter.construct_from_jdict('.'.join(pieces[3:]))
-
-        return cls(source, target)
+    @classmethod
+    @lru_cache(maxsize=RoutingKey._PARSE_CACHE_SIZE)
+    def __construct_from_wire(cls, routing: str):
+        return cls(*cls._parse(routing, EquipmentFilter))
@@ -0,0 +1,135 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+An index of subscriptions, for fan-out of published messages
+
+The index is a trie of depth six, keyed on the source (type, sector, serial) then the target (type, sector, serial)
+fields of each SubscriptionRoutingKey - a wildcard field is held under the key None. A lookup follows at most two
+branches per level (the exact value and the wildcard), so its cost depends only on the key depth, not on the number
+of subscriptions.
+
+https://en.wikipedia.org/wiki/Trie
+"""
+
+from typing import Any, Hashable
+
+from mrcs_core.messaging.routing_key import RoutingKey
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SubscriptionIndex(object):
+    """
+    An index of subscriptions, for fan-out of published messages
+    """
+
+
+    @staticmethod
+    def __path(routing_key: RoutingKey):
+        source = routing_key.source
+        target = routing_key.target
+
+        return (source.equipment_type, source.sector_number, source.serial_number,
+                target.equipment_type, target.sector_number, target.serial_number)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self):
+        self.__root = {}
+        self.__count = 0
+
+
+    def __len__(self):
+        return self.__count
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def add(self, routing_key: RoutingKey, subscriber: Hashable):
+        node = self.__root
+        path = self.__path(routing_key)
+
+        for field in path[:-1]:
+            node = node.setdefault(field, {})
+
+        subscribers = node.setdefault(path[-1], set())
+
+        if subscriber not in subscribers:
+            subscribers.add(subscriber)
+            self.__count += 1
+
+
+    def remove(self, routing_key: RoutingKey, subscriber: Hashable):
+        nodes = [self.__root]
+        path = self.__path(routing_key)
+
+        for field in path[:-1]:
+            try:
+                nodes.append(nodes[-1][field])
+            except KeyError:
+                return False
+
+        subscribers = nodes[-1].get(path[-1])
+
+        if subscribers is None or subscriber not in subscribers:
+            return False
+
+        subscribers.remove(subscriber)
+        self.__count -= 1
+
+        # prune empty branches...
+        if not subscribers:
+            del nodes[-1][path[-1]]
+
+            for depth in range(len(nodes) - 1, 0, -1):
+                if nodes[depth]:
+                    break
+
+                del nodes[depth - 1][path[depth - 1]]
+
+        return True
+
+
+    def clear(self):
+        self.__root = {}
+        self.__count = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def subscribers(self, routing_key: RoutingKey) -> set[Any]:
+        matches = set()
+        path = self.__path(routing_key)
+        nodes = [self.__root]
+
+        for field in path:
+            children = []
+
+            for node in nodes:
+                child = node.get(field)
+                if child is not None:
+                    children.append(child)
+
+                if field is not None:
+                    wildcard = node.get(None)
+                    if wildcard is not None:
+                        children.append(wildcard)
+
+            if not children:
+                return matches
+
+            nodes = children
+
+        for subscribers in nodes:
+            matches.update(subscribers)
+
+        return matches
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'SubscriptionIndex:{{len:{len(self)}}}'
@@ -0,0 +1,242 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A reader of the MessageRecords written by a MessageRecorder
+Note that recorder components follow system time, not model time.
+
+Records are filtered in the database, and returned in uid order. Only the partitions that overlap a rec range, and
+hold uids after the cursor, are opened, in day order, and each is read until the page is full. A source or target
+EquipmentSpecification selects on the decomposed routing columns, where a None field is a wildcard - as
+EquipmentSpecification.matches(..). A rec range is start inclusive, end exclusive, and is first resolved to the
+least and greatest uids within it, in each partition, by one walk of the rec index, so that the range is scanned on
+the primary key, in uid order, without a sort. rec follows the system clock, which may step backwards, so the uid
+range is not inferred from the order of rec. The uid ranges are resolved once for each find(..) or scan(..), and
+held for its later pages.
+
+Pagination is by keyset: each page resumes after the uid of the last record of the previous page, so every page
+starts with a seek on the primary key, not a walk of the records before it, however deep. Each record of the page is
+then read from the table. find(..) streams the pages as a generator - each page is read by its own statement, so that
+a slow consumer does not hold a read transaction open against the recorder.
+
+scan(..) streams ReplayRecords in the same way, in larger chunks, with the rec field reduced to epoch milliseconds
+by the database, and the body left as the stored bytes. Partitions are read through a memory map, so a log of any
+size is scanned in constant memory.
+
+log = MessageLog.construct('TEST')
+
+for record in log.find(start=start, target=EquipmentFilter(EquipmentType.MPU, 1, None)):
+    ...
+
+https://www.sqlite.org/queryplanner.html#searching
+https://use-the-index-luke.com/no-offset
+"""
+
+import threading
+from typing import Iterator
+
+from mrcs_core.data.equipment_identity import EquipmentSpecification
+from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.operations.recorder.message_partitions import MessagePartitions
+from mrcs_core.operations.recorder.message_record import MessageRecord
+from mrcs_core.operations.recorder.replay_record import ReplayRecord
+from mrcs_core.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MessageLog(object):
+    """
+    A reader of the MessageRecords written by a MessageRecorder
+    """
+
+    DEFAULT_PAGE_SIZE = 500
+    DEFAULT_CHUNK_SIZE = 5000
+
+    __SELECT = 'SELECT uid, rec, origin, routing, body FROM message'
+
+    # rec as integer epoch milliseconds, and body as the stored UTF-8 bytes...
+    __SELECT_RAW = ("SELECT uid, CAST(strftime('%s', rec) AS INTEGER) * 1000 + CAST(substr(rec, 21, 3) AS INTEGER), "
+                    "origin, routing, CAST(body AS BLOB) FROM message")
+
+
+    @classmethod
+    def construct(cls, db_mode, host=Host):
+        return cls(MessagePartitions.construct(db_mode, host=host))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, partitions: MessagePartitions):
+        self.__partitions = partitions
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def find(self, start: ISODatetime | None = None, end: ISODatetime | None = None,
+             source: EquipmentSpecification | None = None, target: EquipmentSpecification | None = None,
+             after_uid: int | None = None, page_size: int = DEFAULT_PAGE_SIZE) -> Iterator[MessageRecord]:
+        uid_ranges = {}  # day: uid range of the rec range, resolved once for all pages
+
+        while True:
+            rows = self.__rows(self.__SELECT, start, end, source, target, after_uid, page_size, uid_ranges)
+
+            for row in rows:
+                yield MessageRecord.construct_from_db_row(row)
+
+            if len(rows) < page_size:
+                return
+
+            after_uid = rows[-1][0]
+
+
+    def page(self, start: ISODatetime | None = None, end: ISODatetime | None = None,
+             source: EquipmentSpecification | None = None, target: EquipmentSpecification | None = None,
+             after_uid: int | None = None, limit: int = DEFAULT_PAGE_SIZE) -> list[MessageRecord]:
+        rows = self.__rows(self.__SELECT, start, end, source, target, after_uid, limit, {})
+
+        return [MessageRecord.construct_from_db_row(row) for row in rows]
+
+
+    def scan(self, start: ISODatetime | None = None, end: ISODatetime | None = None,
+             source: EquipmentSpecification | None = None, target: EquipmentSpecification | None = None,
+             after_uid: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[ReplayRecord]:
+        # undecoded records, in uid order, read chunk_size rows at a time
+        uid_ranges = {}  # day: uid range of the rec range, resolved once for all chunks
+
+        while True:
+            rows = self.__rows(self.__SELECT_RAW, start, end, source, target, after_uid, chunk_size, uid_ranges)
+
+            for row in rows:
+                yield ReplayRecord(*row)
+
+            if len(rows) < chunk_size:
+                return
+
+            after_uid = rows[-1][0]
+
+
+    def close(self):
+        with self.__lock:
+            self.__partitions.close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __rows(self, select, start, end, source, target, after_uid, limit, uid_ranges):
+        if limit < 1:
+            raise ValueError(f'limit:{limit}')
+
+        rows = []
+
+        with self.__lock:
+            for day in self.__partitions.plan(start, end):
+                if after_uid is not None:
+                    max_uid = self.__partitions.max_uid(day)
+
+                    if max_uid is None or max_uid <= after_uid:  # wholly before the cursor, or empty
+                        continue
+
+                connection = self.__partitions.connection(day)
+
+                if connection is None:  # removed since planning
+                    continue
+
+                if start is None and end is None:
+                    uid_range = ()
+                else:
+                    if day not in uid_ranges:
+                        uid_ranges[day] = self.__uid_range(connection, start, end)
+
+                    uid_range = uid_ranges[day]
+
+                    if uid_range is None:  # nothing of the partition is in the rec range
+                        continue
+
+                rows.extend(self.__partition_rows(connection, select, start, end, uid_range, source, target,
+                                                  after_uid, limit - len(rows)))
+
+                if len(rows) == limit:
+                    break
+
+        return rows
+
+
+    def __partition_rows(self, connection, select, start, end, uid_range, source, target, after_uid, limit):
+        clauses = ['uid > ?']
+        params = [0 if after_uid is None else after_uid]
+
+        if uid_range:
+            rec_clauses, rec_params = self.__rec_clauses(start, end)
+
+            params[0] = max(params[0], uid_range[0] - 1)
+
+            clauses.extend(('uid <= ?', rec_clauses))
+            params.extend((uid_range[1], *rec_params))
+
+        for prefix, spec in (('source', source), ('target', target)):
+            if spec is not None:
+                spec_clauses, spec_params = self.__spec_clauses(prefix, spec)
+                clauses.extend(spec_clauses)
+                params.extend(spec_params)
+
+        params.append(limit)
+
+        return connection.execute(f'{select} WHERE {" AND ".join(clauses)} ORDER BY uid LIMIT ?', params).fetchall()
+
+
+    @classmethod
+    def __uid_range(cls, connection, start, end):
+        # the least and greatest uids in the rec range, by one walk of the rec index, or None if it is empty
+        rec_clauses, rec_params = cls.__rec_clauses(start, end)
+        min_uid, max_uid = connection.execute(f'SELECT min(uid), max(uid) FROM message WHERE {rec_clauses}',
+                                              rec_params).fetchone()
+
+        return None if min_uid is None else (min_uid, max_uid)
+
+
+    @staticmethod
+    def __rec_clauses(start, end):
+        clauses = []
+        params = []
+
+        if start is not None:
+            clauses.append('rec >= ?')
+            params.append(start.dbformat())
+
+        if end is not None:
+            clauses.append('rec < ?')
+            params.append(end.dbformat())
+
+        return ' AND '.join(clauses), params
+
+
+    @staticmethod
+    def __spec_clauses(prefix, spec: EquipmentSpecification):
+        clauses = []
+        params = []
+
+        equipment_type = None if spec.equipment_type is None else spec.equipment_type.value
+
+        for column, value in (('type', equipment_type), ('sector', spec.sector_number),
+                              ('serial', spec.serial_number)):
+            if value is not None:
+                clauses.append(f'{prefix}_{column} = ?')
+                params.append(value)
+
+        return clauses, params
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def partitions(self):
+        return self.__partitions
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'MessageLog:{{partitions:{self.partitions}}}'
@@ -0,0 +1,143 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+The retention and compaction of the partitions of the message log
+Note that recorder components follow system time, not model time.
+
+Every interval seconds, the maintainer thread removes the partitions that are older than retention_days, counting
+today as the first, then compacts each past partition that has not yet been compacted. Today's partition is still
+being written, so is never compacted. A retention_days of None retains every partition.
+
+The maintainer should have its own MessagePartitions, so that it does not contend with the recorder or a log for
+connections. Removal is safe while they run - they discard a connection to a partition that has been removed.
+
+with MessageLogMaintainer(MessagePartitions.construct('TEST'), retention_days=90):
+    ...
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from mrcs_core.operations.recorder.message_partitions import MessagePartitions
+from mrcs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MessageLogMaintainer(object):
+    """
+    The retention and compaction of the partitions of the message log
+    """
+
+    DEFAULT_INTERVAL = 3600.0  # seconds
+
+    def __init__(self, partitions: MessagePartitions, retention_days: int | None = None,
+                 interval: float = DEFAULT_INTERVAL, clock: Callable[[], float] = time.time):
+        if retention_days is not None and retention_days < 1:
+            raise ValueError(f'retention_days:{retention_days}')
+
+        self.__partitions = partitions
+        self.__retention_days = retention_days
+        self.__interval = float(interval)
+        self.__clock = clock  # epoch seconds
+
+        self.__thread = None
+        self.__stopping = threading.Event()
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def maintain(self):
+        # returns the days removed, and the days compacted
+        today = datetime.fromtimestamp(self.__clock(), timezone.utc).date()
+
+        removed = []
+        compacted = []
+
+        for day in self.__partitions.days():
+            if self.__retention_days is not None and day <= today - timedelta(days=self.__retention_days):
+                self.__partitions.remove(day)
+                removed.append(day)
+                continue
+
+            if day < today and not self.__partitions.is_compacted(day):
+                self.__partitions.compact(day)
+                compacted.append(day)
+
+        return removed, compacted
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.is_running:
+            return
+
+        self.__stopping.clear()
+
+        self.__thread = threading.Thread(target=self.__run, name=self.__class__.__name__, daemon=True)
+        self.__thread.start()
+
+
+    def stop(self):
+        if not self.is_running:
+            return
+
+        self.__stopping.set()
+
+        self.__thread.join()
+        self.__thread = None
+
+        self.__partitions.close()
+
+
+    def __run(self):
+        while not self.__stopping.is_set():
+            try:
+                self.maintain()
+            except Exception as ex:
+                Logging.getLogger().error(f'{self.__class__.__name__}: maintain failed: {ex!r}')
+
+            self.__stopping.wait(self.__interval)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def partitions(self):
+        return self.__partitions
+
+
+    @property
+    def retention_days(self):
+        return self.__retention_days
+
+
+    @property
+    def interval(self):
+        return self.__interval
+
+
+    @property
+    def is_running(self):
+        return self.__thread is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'MessageLogMaintainer:{{partitions:{self.partitions}, retention_days:{self.retention_days}, '
+                f'interval:{self.interval}, is_running:{self.is_running}}}')
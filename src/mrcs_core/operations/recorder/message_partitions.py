@@ -0,0 +1,297 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+The storage of recorded messages, partitioned by day
+Note that recorder components follow system time, not model time.
+
+Each UTC day of rec has its own SQLite database, messages-YYYY-MM-DD.db, in the recorder directory under
+Host.mrcs_db_abs_dir(..). The partition being written is therefore never larger than one day of traffic, and a day
+that has passed is not written again, so it can be compacted once, and removed whole when it falls out of retention.
+uids run on across partitions, so a later partition holds later uids.
+
+plan(..) returns only those days that overlap a rec range, so a query opens only the partitions that it needs.
+max_uid(..) lets a query resume after a uid without opening the partitions before it - the max uid of a partition
+that has a later partition is no longer written, so is held once found. Open connections are held for reuse, up to
+MAX_OPEN_PARTITIONS, the least recently used being closed first. An instance should be used by one component - the
+recorder, a log or the maintainer - whose own lock serialises its use.
+
+A new partition is built with its schema under a temporary name, then linked into place, so an existing partition
+is opened without any DDL, and is never seen without its schema.
+
+compact(..) checkpoints and truncates the WAL, then VACUUMs and optimises the partition, and marks it as compacted
+in its user_version.
+
+https://www.sqlite.org/lang_vacuum.html
+https://www.sqlite.org/pragma.html#pragma_user_version
+https://www.sqlite.org/pragma.html#pragma_optimize
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+
+from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.sys.host import Host
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MessagePartitions(object):
+    """
+    The storage of recorded messages, partitioned by day
+    """
+
+    DIRNAME = 'recorder'
+
+    MAX_OPEN_PARTITIONS = 4
+
+    __FILENAME_PATTERN = re.compile(r'messages-(\d{4}-\d{2}-\d{2})\.db')
+
+    __BUSY_TIMEOUT = 5.0  # seconds
+    __MMAP_SIZE = 256 * 1024 * 1024  # bytes of each partition read through a memory map
+
+    __COMPACTED = 1  # user_version
+
+    # the routing key is also held decomposed, so that MessageLog queries can use the source and target indexes -
+    # each index ends with the implicit uid, so the matching entries of a fully specified source or target are in uid
+    # order, though each matching record is then read from the table...
+    __SCHEMA = ('CREATE TABLE IF NOT EXISTS message ('
+                'uid INTEGER PRIMARY KEY, '
+                'rec TEXT NOT NULL, '
+                'origin TEXT NOT NULL, '
+                'routing TEXT NOT NULL, '
+                'source_type TEXT, '
+                'source_sector INTEGER, '
+                'source_serial INTEGER, '
+                'target_type TEXT, '
+                'target_sector INTEGER, '
+                'target_serial INTEGER, '
+                'body TEXT'
+                ')',
+                'CREATE INDEX IF NOT EXISTS message_rec ON message (rec)',
+                'CREATE INDEX IF NOT EXISTS message_source ON message (source_type, source_sector, source_serial)',
+                'CREATE INDEX IF NOT EXISTS message_target ON message (target_type, target_sector, target_serial)')
+
+
+    @classmethod
+    def construct(cls, db_mode, host=Host):
+        return cls(os.path.join(host.mrcs_db_abs_dir(db_mode), cls.DIRNAME))
+
+
+    @staticmethod
+    def day_of_rec(rec_field: str) -> date:
+        return date.fromisoformat(rec_field[:10])  # rec fields are in ISODatetime DB format, in UTC
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, abs_dir):
+        self.__abs_dir = str(abs_dir)
+
+        self.__connections = OrderedDict()  # day: connection, least recently used first
+        self.__max_uids = {}  # day: max uid, or None if empty - held only for partitions that are no longer written
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def days(self) -> list[date]:
+        try:
+            filenames = os.listdir(self.__abs_dir)
+        except FileNotFoundError:
+            return []
+
+        matches = (self.__FILENAME_PATTERN.fullmatch(filename) for filename in filenames)
+
+        return sorted(date.fromisoformat(match.group(1)) for match in matches if match)
+
+
+    def plan(self, start: ISODatetime | None = None, end: ISODatetime | None = None) -> list[date]:
+        # the days that overlap the rec range, start inclusive, end exclusive
+        days = self.days()
+
+        if start is not None:
+            first = self.day_of_rec(start.dbformat())
+            days = [day for day in days if day >= first]
+
+        if end is not None:
+            end_field = end.dbformat()
+            last = self.day_of_rec(end_field)
+
+            if end_field[11:] == '00:00:00.000':  # nothing of the end day is in range
+                last -= timedelta(days=1)
+
+            days = [day for day in days if day <= last]
+
+        return days
+
+
+    def last_uid(self) -> int:
+        for day in reversed(self.days()):
+            connection = self.connection(day)
+
+            if connection is None:
+                continue
+
+            uid = connection.execute('SELECT max(uid) FROM message').fetchone()[0]
+
+            if uid is not None:
+                return uid
+
+        return 0
+
+
+    def max_uid(self, day: date) -> int | None:
+        # None if the partition is empty, or does not exist
+        with self.__lock:
+            if day in self.__max_uids:
+                return self.__max_uids[day]
+
+        connection = self.connection(day)
+
+        if connection is None:
+            return None
+
+        max_uid = connection.execute('SELECT max(uid) FROM message').fetchone()[0]
+        days = self.days()
+
+        if days and day < days[-1]:  # a later partition exists, so this one is no longer written
+            with self.__lock:
+                self.__max_uids[day] = max_uid
+
+        return max_uid
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def connection(self, day: date, create=False):
+        # None if the partition does not exist, and create is False
+        abs_filename = self.abs_filename(day)
+
+        with self.__lock:
+            connection = self.__connections.pop(day, None)
+
+            if connection is not None and not os.path.exists(abs_filename):  # removed by another instance
+                connection.close()
+                connection = None
+
+            if connection is None:
+                if not os.path.exists(abs_filename):
+                    self.__max_uids.pop(day, None)
+
+                    if not create:
+                        return None
+
+                    self.__create(abs_filename)
+
+                connection = self.__open(abs_filename)
+
+            self.__connections[day] = connection
+
+            while len(self.__connections) > self.MAX_OPEN_PARTITIONS:
+                _, evicted = self.__connections.popitem(last=False)
+                evicted.close()
+
+            return connection
+
+
+    def compact(self, day: date) -> bool:
+        connection = self.connection(day)
+
+        if connection is None:
+            return False
+
+        connection.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        connection.execute('VACUUM')
+        connection.execute('PRAGMA optimize')
+        connection.execute(f'PRAGMA user_version={self.__COMPACTED}')
+
+        return True
+
+
+    def is_compacted(self, day: date) -> bool:
+        connection = self.connection(day)
+
+        return connection is not None and connection.execute('PRAGMA user_version').fetchone()[0] == self.__COMPACTED
+
+
+    def remove(self, day: date):
+        with self.__lock:
+            connection = self.__connections.pop(day, None)
+            self.__max_uids.pop(day, None)
+
+            if connection is not None:
+                connection.close()
+
+        abs_filename = self.abs_filename(day)
+
+        for suffix in ('', '-wal', '-shm'):
+            try:
+                os.remove(abs_filename + suffix)
+            except FileNotFoundError:
+                pass
+
+
+    def close(self):
+        with self.__lock:
+            for connection in self.__connections.values():
+                connection.close()
+
+            self.__connections = OrderedDict()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def abs_filename(self, day: date):
+        return os.path.join(self.__abs_dir, f'messages-{day.isoformat()}.db')
+
+
+    def __create(self, abs_filename):
+        os.makedirs(self.__abs_dir, exist_ok=True)
+
+        tmp_filename = f'{abs_filename}.{os.getpid()}-{threading.get_ident()}.tmp'
+        connection = sqlite3.connect(tmp_filename, isolation_level=None)
+
+        try:
+            connection.execute('PRAGMA journal_mode=WAL')  # persistent, so set only here
+
+            for statement in self.__SCHEMA:
+                connection.execute(statement)
+        finally:
+            connection.close()  # the WAL is checkpointed and removed
+
+        try:
+            os.link(tmp_filename, abs_filename)  # fails, rather than replaces, if created by another instance
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_filename)
+
+
+    def __open(self, abs_filename):
+        # transactions are explicit, so the connection is in autocommit mode...
+        connection = sqlite3.connect(abs_filename, timeout=self.__BUSY_TIMEOUT, isolation_level=None,
+                                     check_same_thread=False)
+
+        connection.execute('PRAGMA synchronous=NORMAL')  # in WAL mode, a power loss may lose commits, not integrity
+        connection.execute(f'PRAGMA mmap_size={self.__MMAP_SIZE}')  # pages are read from the OS cache, not copied
+
+        return connection
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def abs_dir(self):
+        return self.__abs_dir
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'MessagePartitions:{{abs_dir:{self.abs_dir}, open:{len(self.__connections)}}}'
@@ -46,6 +46,18 @@ class MessageRecord(Message):
         return cls(uid, rec, routing_key, body, origin)
 
 
+    @classmethod
+    def construct_from_db_row(cls, row):
+        # row: (uid, rec, origin, routing, body), as written by MessageRecorder
+        uid, rec_field, origin, routing, body_field = row
+
+        rec = ISODatetime.construct_from_db_field(rec_field)
+        routing_key = PublicationRoutingKey.construct_from_jdict(routing)
+        body = None if body_field is None else cls.loads(body_field)
+
+        return cls(uid, rec, routing_key, body, origin)
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     def __init__(self, uid: int, rec: ISODatetime, routing_key: RoutingKey, body, origin):
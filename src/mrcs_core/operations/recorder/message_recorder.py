@@ -0,0 +1,366 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A recorder of Messages to day-partitioned SQLite databases, written in batches
+Note that recorder components follow system time, not model time.
+
+record(..) only stamps the message with its time of receipt, and queues it in a bounded ring buffer - it never
+writes, so never blocks on the database. The buffer is flushed by the recorder thread when it holds batch_size
+messages, or its oldest message has waited max_latency seconds, whichever comes first. If the buffer is at its
+capacity, the oldest message is dropped, and counted in dropped - capacity should cover the longest stall of the
+database that is to be tolerated without loss.
+
+If a partition cannot be written - the database is locked beyond the busy timeout, or the disk is full - the messages
+that were not committed are returned to the head of the buffer, in order, within its capacity. The recorder thread
+retries after max_latency, doubling the interval after each consecutive failure, up to MAX_RETRY_INTERVAL.
+
+Each flush is a single transaction for each partition that it touches - ordinarily only today's. The uids of the
+batch are allocated together, the rec fields are formatted together - the date and time of a second is formatted
+only once - and the rows are inserted by one executemany(..) of a statement that the connection prepares once and
+keeps in its statement cache. Partitions are in WAL mode, so readers of the log do not block the recorder.
+
+The rec field is in ISODatetime DB format, in UTC, with millisecond precision. Partitions are managed by
+MessagePartitions, and the log is read by MessageLog.
+
+with MessageRecorder.construct('TEST') as recorder:
+    recorder.record(message)
+
+https://www.sqlite.org/wal.html
+https://www.sqlite.org/lang_transaction.html
+https://docs.python.org/3/library/sqlite3.html#sqlite3.Cursor.executemany
+"""
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import groupby
+from typing import Callable
+
+from mrcs_core.data.json import JSONify
+from mrcs_core.messaging.message import Message
+from mrcs_core.messaging.routing_key import RoutingKey
+from mrcs_core.operations.recorder.message_partitions import MessagePartitions
+from mrcs_core.sys.host import Host
+from mrcs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MessageRecorder(object):
+    """
+    A recorder of Messages to day-partitioned SQLite databases, written in batches
+    """
+
+    DEFAULT_BATCH_SIZE = 500
+    DEFAULT_MAX_LATENCY = 0.2  # seconds
+    DEFAULT_CAPACITY = 10_000  # messages
+
+    MAX_RETRY_INTERVAL = 10.0  # seconds
+
+    __INSERT = ('INSERT INTO message (uid, rec, origin, routing, source_type, source_sector, source_serial, '
+                'target_type, target_sector, target_serial, body) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)')
+
+
+    @classmethod
+    def construct(cls, db_mode, host=Host, **kwargs):
+        return cls(MessagePartitions.construct(db_mode, host=host), **kwargs)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, partitions: MessagePartitions, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_latency: float = DEFAULT_MAX_LATENCY, capacity: int = DEFAULT_CAPACITY,
+                 clock: Callable[[], int] = time.time_ns):
+        if batch_size < 1 or capacity < batch_size:
+            raise ValueError(f'batch_size:{batch_size}, capacity:{capacity}')
+
+        self.__partitions = partitions
+        self.__batch_size = int(batch_size)
+        self.__max_latency = float(max_latency)
+        self.__capacity = int(capacity)
+        self.__clock = clock  # epoch nanoseconds
+
+        self.__buffer = deque()  # (rec_ns, message), never longer than capacity
+        self.__oldest_ns = None  # monotonic time at which the oldest buffered message was received
+        self.__dropped = 0
+
+        self.__retry_interval = None  # seconds, while writes are failing
+        self.__retry_ns = None  # monotonic time of the next attempt, while writes are failing
+
+        self.__condition = threading.Condition()
+        self.__write_lock = threading.Lock()  # batches are written in the order in which they were drained
+        self.__thread = None
+        self.__is_stopping = False
+
+        self.__next_uid = None  # found on the first write
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+    def __len__(self):
+        with self.__condition:
+            return len(self.__buffer)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def record(self, message: Message):
+        with self.__condition:
+            if not self.__buffer:
+                self.__oldest_ns = time.monotonic_ns()
+                self.__condition.notify()  # start the latency timer
+
+            self.__buffer.append((self.__clock(), message))
+
+            if len(self.__buffer) > self.__capacity:
+                self.__buffer.popleft()
+                self.__dropped += 1
+
+            if len(self.__buffer) == self.__batch_size:
+                self.__condition.notify()
+
+
+    def flush(self) -> int:
+        with self.__write_lock:
+            batch = self.__drain()
+
+            if batch:
+                self.__write(batch)
+
+            return len(batch)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.is_running:
+            return
+
+        self.__is_stopping = False
+
+        self.__thread = threading.Thread(target=self.__run, name=self.__class__.__name__, daemon=True)
+        self.__thread.start()
+
+
+    def stop(self):
+        if self.is_running:
+            with self.__condition:
+                self.__is_stopping = True
+                self.__condition.notify()
+
+            self.__thread.join()
+            self.__thread = None
+
+        self.flush()
+
+
+    def close(self):
+        self.stop()
+
+        with self.__write_lock:
+            self.__partitions.close()
+
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                while not self.__is_stopping and not self.__is_due():
+                    self.__condition.wait(self.__timeout())
+
+                if self.__is_stopping:
+                    return
+
+            try:
+                self.flush()
+
+            except Exception as ex:
+                with self.__condition:
+                    if self.__retry_interval is None:
+                        self.__retry_interval = self.__max_latency
+                    else:
+                        self.__retry_interval = min(self.__retry_interval * 2, self.MAX_RETRY_INTERVAL)
+
+                    self.__retry_ns = time.monotonic_ns() + int(self.__retry_interval * 1_000_000_000)
+
+                Logging.getLogger().error(f'{self.__class__.__name__}: flush failed: {ex!r}, '
+                                          f'retry in {self.__retry_interval}s, dropped:{self.dropped}')
+
+            else:
+                with self.__condition:
+                    self.__retry_interval = None
+                    self.__retry_ns = None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __is_due(self):
+        if self.__retry_ns is not None:
+            return bool(self.__buffer) and self.__timeout() == 0.0
+
+        if len(self.__buffer) >= self.__batch_size:
+            return True
+
+        return bool(self.__buffer) and self.__timeout() == 0.0
+
+
+    def __timeout(self):
+        # seconds until the next retry is due, or the oldest buffered message reaches max_latency, or None if empty
+        if not self.__buffer:
+            return None
+
+        if self.__retry_ns is not None:
+            return max((self.__retry_ns - time.monotonic_ns()) / 1_000_000_000, 0.0)
+
+        waited = (time.monotonic_ns() - self.__oldest_ns) / 1_000_000_000
+
+        return max(self.__max_latency - waited, 0.0)
+
+
+    def __drain(self):
+        with self.__condition:
+            batch = list(self.__buffer)
+
+            self.__buffer.clear()
+            self.__oldest_ns = None
+
+        return batch
+
+
+    def __restore(self, batch):
+        # returns the unwritten messages to the head of the buffer, ahead of any received since they were drained
+        with self.__condition:
+            self.__buffer.extendleft(reversed(batch))
+            self.__oldest_ns = time.monotonic_ns()
+
+            while len(self.__buffer) > self.__capacity:
+                self.__buffer.popleft()
+                self.__dropped += 1
+
+
+    def __write(self, batch):
+        dumps = JSONify.dumps
+        separators = JSONify.COMPACT_SEPARATORS
+
+        if self.__next_uid is None:
+            self.__next_uid = self.__partitions.last_uid() + 1
+
+        recs = self.__rec_fields(rec_ns for rec_ns, _ in batch)
+        fields = [(rec, message.origin) + self.__routing_fields(message.routing_key) +
+                  (dumps(message.body, separators=separators),) for rec, (_, message) in zip(recs, batch)]
+
+        written = 0
+
+        for day_field, day_fields in groupby(fields, key=lambda row: row[0][:10]):
+            day_fields = list(day_fields)
+
+            try:
+                self.__write_partition(MessagePartitions.day_of_rec(day_field), day_fields)
+            except (sqlite3.Error, OSError):
+                self.__restore(batch[written:])
+                raise
+
+            written += len(day_fields)
+
+
+    def __write_partition(self, day, fields):
+        connection = self.__partitions.connection(day, create=True)
+
+        connection.execute('BEGIN IMMEDIATE')  # take the write lock now, so that the uid allocation holds
+
+        try:
+            partition_uid = connection.execute('SELECT coalesce(max(uid), 0) + 1 FROM message').fetchone()[0]
+            first_uid = max(self.__next_uid, partition_uid)
+
+            connection.executemany(self.__INSERT, ((first_uid + i,) + row for i, row in enumerate(fields)))
+            connection.execute('COMMIT')
+
+        except BaseException:
+            if connection.in_transaction:  # SQLite may already have rolled back
+                connection.execute('ROLLBACK')
+            raise
+
+        self.__next_uid = first_uid + len(fields)
+
+
+    @staticmethod
+    @lru_cache(maxsize=RoutingKey._PARSE_CACHE_SIZE)
+    def __routing_fields(routing_key: RoutingKey):
+        # routing keys are interned and hashable, so each distinct key is decomposed only once
+        fields = [routing_key.as_json()]
+
+        for spec in (routing_key.source, routing_key.target):
+            equipment_type = None if spec.equipment_type is None else spec.equipment_type.value
+            fields.extend((equipment_type, spec.sector_number, spec.serial_number))
+
+        return tuple(fields)
+
+
+    @staticmethod
+    def __rec_fields(rec_ns_values):
+        # ISODatetime DB format, in UTC - messages arrive in bursts, so most share their second with their neighbour
+        fields = []
+        prev_seconds = None
+        prefix = None
+
+        for rec_ns in rec_ns_values:
+            seconds, nanos = divmod(rec_ns, 1_000_000_000)
+
+            if seconds != prev_seconds:
+                prefix = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(seconds))
+                prev_seconds = seconds
+
+            fields.append(f'{prefix}.{nanos // 1_000_000:03d}')
+
+        return fields
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def partitions(self):
+        return self.__partitions
+
+
+    @property
+    def batch_size(self):
+        return self.__batch_size
+
+
+    @property
+    def max_latency(self):
+        return self.__max_latency
+
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+
+    @property
+    def dropped(self):
+        with self.__condition:
+            return self.__dropped
+
+
+    @property
+    def is_running(self):
+        return self.__thread is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'MessageRecorder:{{partitions:{self.partitions}, batch_size:{self.batch_size}, '
+                f'max_latency:{self.max_latency}, capacity:{self.capacity}, pending:{len(self)}, '
+                f'dropped:{self.dropped}, is_running:{self.is_running}}}')
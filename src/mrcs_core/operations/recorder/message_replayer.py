@@ -0,0 +1,105 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A replayer of recorded messages, with their original spacing
+Note that recorder components follow system time, not model time.
+
+Records are read from a MessageLog by scan(..), so are never all held in memory, and are passed undecoded to the
+publish callback - typically as record.routing, record.as_bytes(). Each record is due at the true time of the first
+record, plus its recorded period from the first record, divided by speed - as Clock.speed. Due times are reckoned
+from that single anchor on the monotonic clock, rather than by accumulating sleeps, so that a long replay does not
+drift. A record that is already due is published without any wait. A speed of None replays as fast as the publish
+callback permits.
+
+replayer = MessageReplayer(MessageLog.construct('TEST'), publish, speed=10)
+replayer.run(start=start, end=end)
+
+https://docs.python.org/3/library/time.html#time.monotonic
+"""
+
+import threading
+import time
+from typing import Callable
+
+from mrcs_core.data.equipment_identity import EquipmentSpecification
+from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.operations.recorder.message_log import MessageLog
+from mrcs_core.operations.recorder.replay_record import ReplayRecord
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class MessageReplayer(object):
+    """
+    A replayer of recorded messages, with their original spacing
+    """
+
+    def __init__(self, log: MessageLog, publish: Callable[[ReplayRecord], None], speed: float | None = 1.0):
+        if speed is not None and speed <= 0:
+            raise ValueError(f'speed:{speed}')
+
+        self.__log = log
+        self.__publish = publish
+        self.__speed = speed
+
+        self.__stopping = threading.Event()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def run(self, start: ISODatetime | None = None, end: ISODatetime | None = None,
+            source: EquipmentSpecification | None = None, target: EquipmentSpecification | None = None,
+            after_uid: int | None = None) -> int:
+        # blocks until the replay is complete, or stopped - returns the number of records published
+        self.__stopping.clear()
+
+        publish = self.__publish
+        speed = self.__speed
+
+        anchor_true = None
+        anchor_millis = None
+        count = 0
+
+        for record in self.__log.scan(start=start, end=end, source=source, target=target, after_uid=after_uid):
+            if speed is not None:
+                if anchor_true is None:
+                    anchor_true = time.monotonic()
+                    anchor_millis = record.rec_millis
+
+                else:
+                    wait = anchor_true + (record.rec_millis - anchor_millis) / (1000 * speed) - time.monotonic()
+
+                    if wait > 0 and self.__stopping.wait(wait):
+                        break
+
+            if self.__stopping.is_set():
+                break
+
+            publish(record)
+            count += 1
+
+        return count
+
+
+    def stop(self):
+        self.__stopping.set()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def log(self):
+        return self.__log
+
+
+    @property
+    def speed(self):
+        return self.__speed
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'MessageReplayer:{{log:{self.log}, speed:{self.speed}}}'
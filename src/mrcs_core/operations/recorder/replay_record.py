@@ -0,0 +1,111 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+An undecoded MessageRecord, as read by MessageLog.scan(..) for replay
+Note that recorder components follow system time, not model time.
+
+The body is held as the bytes of its stored JSON, and is decoded only when the body property is read. as_bytes()
+assembles a Message payload around the stored bytes, so that a record can be re-published without decoding or
+re-encoding its body.
+"""
+
+from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.data.json import JSONable, JSONify
+from mrcs_core.messaging.routing_key import PublicationRoutingKey
+from mrcs_core.operations.recorder.message_record import MessageRecord
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ReplayRecord(object):
+    """
+    An undecoded MessageRecord
+    """
+
+    __slots__ = ('__uid', '__rec_millis', '__origin', '__routing', '__raw_body')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, uid: int, rec_millis: int, origin: str, routing: str, raw_body: bytes | None):
+        self.__uid = uid
+        self.__rec_millis = rec_millis  # epoch milliseconds
+        self.__origin = origin
+        self.__routing = routing
+        self.__raw_body = raw_body  # UTF-8 JSON
+
+
+    def __eq__(self, other):
+        try:
+            return (self.uid == other.uid and self.rec_millis == other.rec_millis and self.origin == other.origin and
+                    self.routing == other.routing and self.raw_body == other.raw_body)
+        except (AttributeError, TypeError):
+            return False
+
+
+    def __lt__(self, other):
+        return self.uid < other.uid
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def as_bytes(self) -> bytes:
+        # as Message.Payload.as_bytes(), without a round trip through the body
+        raw_body = b'null' if self.raw_body is None else self.raw_body
+
+        return b''.join((b'{"origin":', JSONify.dumps(self.origin).encode(), b',"body":', raw_body, b'}'))
+
+
+    def as_message_record(self) -> MessageRecord:
+        return MessageRecord(self.uid, self.rec, self.routing_key, self.body, self.origin)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def uid(self):
+        return self.__uid
+
+
+    @property
+    def rec_millis(self):
+        return self.__rec_millis
+
+
+    @property
+    def rec(self):
+        return ISODatetime.construct_from_timestamp(self.__rec_millis / 1000)
+
+
+    @property
+    def origin(self):
+        return self.__origin
+
+
+    @property
+    def routing(self):
+        return self.__routing
+
+
+    @property
+    def routing_key(self):
+        return PublicationRoutingKey.construct_from_jdict(self.__routing)  # memoised
+
+
+    @property
+    def raw_body(self):
+        return self.__raw_body
+
+
+    @property
+    def body(self):
+        return None if self.__raw_body is None else JSONable.loads(self.__raw_body)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'ReplayRecord:{{uid:{self.uid}, rec_millis:{self.rec_millis}, origin:{self.origin}, '
+                f'routing:{self.routing}, raw_body:{self.raw_body}}}')
@@ -8,8 +8,14 @@ If a configuration is not present, then the model clock follows the system clock
 
 No-inspections are included because the run / pause / resume methods guard the object state.
 
+The persisted true_start and true_stop are wall-clock times, so that any process can reconstruct the model time.
+Within a process, the model time is anchored to time.monotonic_ns() on construction and at run / pause / resume /
+reload, and is then held as integer nanoseconds of model period since model_start - it cannot be moved by an NTP
+step or a change to the system clock. A ClockISODatetime is materialised only by now(..).
+
 WARNING: The configuration of the clock should only be saved using the ClockManager service - this ensures that
-dependent processes are updated with any clock configuration change.
+dependent processes are updated with any clock configuration change. Dependent processes may also subscribe to
+changes with a PersistenceWatcher.
 
 {
     "is_running": true,
@@ -20,7 +26,9 @@ dependent processes are updated with any clock configuration change.
 }
 """
 
+import time
 from collections import OrderedDict
+from datetime import timedelta
 from typing import Any
 
 from mrcs_core.data.json import PersistentJSONable
@@ -37,6 +45,8 @@ class Clock(PersistentJSONable):
 
     START_OF_TIME_YEAR = 1804  # Pen-y-Darren is built by Richard Trevithick
 
+    __MICROSECOND = timedelta(microseconds=1)
+
     # ----------------------------------------------------------------------------------------------------------------
 
     __FILENAME = "clock_conf.json"
@@ -85,6 +95,13 @@ class Clock(PersistentJSONable):
         self.__true_start = true_start
         self.__true_stop = true_stop
 
+        self.__anchor_ns = None  # monotonic ns at the anchor
+        self.__anchor_period_ns = None  # model period ns at the anchor
+
+        if model_start is not None and true_start is not None:
+            true_now = ClockISODatetime.now() if is_running or true_stop is None else true_stop
+            self.__anchor(self.__ns(true_now - true_start) * speed)
+
 
     def __eq__(self, other: Any):
         try:
@@ -99,15 +116,20 @@ class Clock(PersistentJSONable):
 
     # noinspection PyUnresolvedReferences
     def now(self):
-        if self.model_start is None:
+        if self.model_start is None or self.__anchor_ns is None:
             return ClockISODatetime.now()
 
-        now = ClockISODatetime.now() if self.is_running else self.true_stop
+        return self.model_start + timedelta(microseconds=self.model_period_ns() // 1000)
 
-        true_period = now - self.true_start
-        model_period = true_period * self.speed
 
-        return self.model_start + model_period
+    def model_period_ns(self):
+        if self.model_start is None or self.__anchor_ns is None:
+            return None
+
+        if not self.is_running:
+            return self.__anchor_period_ns
+
+        return self.__anchor_period_ns + (time.monotonic_ns() - self.__anchor_ns) * self.speed
 
 
     def run(self):
@@ -121,6 +143,8 @@ class Clock(PersistentJSONable):
         self.__true_stop = None
         self.__is_running = True
 
+        self.__anchor(0)
+
 
     def pause(self):
         if not self.exists(Host):
@@ -129,6 +153,8 @@ class Clock(PersistentJSONable):
         if not self.is_running:
             return
 
+        self.__anchor(self.model_period_ns())
+
         self.__true_stop = ClockISODatetime.now()
         self.__is_running = False
 
@@ -147,6 +173,8 @@ class Clock(PersistentJSONable):
         self.__true_stop = None
         self.__is_running = True
 
+        self.__anchor(self.__anchor_period_ns)
+
 
     # noinspection PyTypeChecker
     def reload(self, stored: ClockISODatetime):
@@ -155,6 +183,7 @@ class Clock(PersistentJSONable):
         if self.model_start is None:
             self.__model_start = stored
             self.__true_start = now
+            model_period = timedelta()
 
         else:
             model_period = stored - self.model_start
@@ -164,6 +193,20 @@ class Clock(PersistentJSONable):
         self.__true_stop = None
         self.__is_running = True
 
+        self.__anchor(self.__ns(model_period))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __anchor(self, period_ns):
+        self.__anchor_ns = time.monotonic_ns()
+        self.__anchor_period_ns = period_ns
+
+
+    @classmethod
+    def __ns(cls, period: timedelta):
+        return (period // cls.__MICROSECOND) * 1000
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
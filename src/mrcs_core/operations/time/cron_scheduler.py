@@ -0,0 +1,253 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A scheduler of Cronjobs, in model time
+
+Jobs are held in a binary heap, in Cronjob order, and indexed by (target, event_id). Scheduling is O(log n), and
+cancellation is O(1) - a cancelled entry is marked dead, and discarded when it reaches the top of the heap, or when
+dead entries come to outnumber live ones. Scheduling a job with the (target, event_id) of a pending job replaces it.
+
+The scheduler thread sleeps until the first job falls due: the model period to its on_datetime, divided by the clock
+speed. While the clock is paused, it sleeps until replan(..) is called. replan(..) must be called whenever the clock
+is run, paused, resumed or reloaded, or its speed changes - typically from a PersistenceWatcher subscription to
+Clock. A job whose on_datetime has no zone is taken to be in the zone of the model clock.
+
+Callbacks are made on the scheduler thread, in Cronjob order, so should return promptly.
+
+with CronScheduler(clock, on_cronjob) as scheduler:
+    scheduler.schedule(Cronjob(target, 'abc', on_datetime))
+
+https://docs.python.org/3/library/heapq.html#priority-queue-implementation-notes
+https://docs.python.org/3/library/threading.html#condition-objects
+"""
+
+import heapq
+import itertools
+import threading
+from typing import Callable
+
+from mrcs_core.operations.time.clock import Clock
+from mrcs_core.operations.time.cronjob import Cronjob
+from mrcs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class CronScheduler(object):
+    """
+    A scheduler of Cronjobs, in model time
+    """
+
+    __KEY = 0  # entry: [key, sequence, job, is_live] - key is the job, with a zoned on_datetime
+    __JOB = 2
+    __IS_LIVE = 3
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, clock: Clock, callback: Callable[[Cronjob], None]):
+        self.__clock = clock
+        self.__callback = callback
+
+        self.__heap = []
+        self.__entries = {}  # (target, event_id): entry
+        self.__sequence = itertools.count()  # equal keys are taken in order of scheduling
+
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__is_stopping = False
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+    def __len__(self):
+        with self.__condition:
+            return len(self.__entries)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def schedule(self, job: Cronjob):
+        key = job
+
+        if job.on_datetime.tzinfo is None:
+            key = Cronjob(job.target, job.event_id, job.on_datetime.replace(tzinfo=self.__clock.now().tzinfo))
+
+        entry = [key, next(self.__sequence), job, True]
+
+        with self.__condition:
+            self.__cancel((job.target, job.event_id))
+
+            heapq.heappush(self.__heap, entry)
+            self.__entries[(job.target, job.event_id)] = entry
+
+            if self.__heap[0] is entry:
+                self.__condition.notify()  # the wake-up is now earlier
+
+
+    def cancel(self, target, event_id) -> bool:
+        with self.__condition:
+            return self.__cancel((target, event_id))
+
+
+    def replan(self, clock: Clock | None = None):
+        with self.__condition:
+            if clock is not None:
+                self.__clock = clock
+
+            self.__condition.notify()
+
+
+    def clear(self):
+        with self.__condition:
+            self.__heap = []
+            self.__entries = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def pop_due(self):
+        with self.__condition:
+            return self.__pop_due()
+
+
+    def next_job(self):
+        with self.__condition:
+            self.__discard_dead()
+            return self.__heap[0][self.__JOB] if self.__heap else None
+
+
+    def next_wake(self):
+        with self.__condition:
+            return self.__timeout()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.is_running:
+            return
+
+        self.__is_stopping = False
+
+        self.__thread = threading.Thread(target=self.__run, name=self.__class__.__name__, daemon=True)
+        self.__thread.start()
+
+
+    def stop(self):
+        if not self.is_running:
+            return
+
+        with self.__condition:
+            self.__is_stopping = True
+            self.__condition.notify()
+
+        self.__thread.join()
+        self.__thread = None
+
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                while not self.__is_stopping:
+                    jobs = self.__pop_due()
+
+                    if jobs:
+                        break
+
+                    self.__condition.wait(self.__timeout())
+
+                if self.__is_stopping:
+                    return
+
+            for job in jobs:
+                try:
+                    self.__callback(job)
+                except Exception as ex:
+                    Logging.getLogger().error(f'{self.__class__.__name__}: callback failed: {ex!r}')
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __cancel(self, key) -> bool:
+        entry = self.__entries.pop(key, None)
+
+        if entry is None:
+            return False
+
+        entry[self.__IS_LIVE] = False
+
+        if len(self.__heap) > 2 * len(self.__entries):  # dead entries outnumber live ones
+            self.__heap = [entry for entry in self.__heap if entry[self.__IS_LIVE]]
+            heapq.heapify(self.__heap)
+
+        return True
+
+
+    def __discard_dead(self):
+        while self.__heap and not self.__heap[0][self.__IS_LIVE]:
+            heapq.heappop(self.__heap)
+
+
+    def __pop_due(self):
+        self.__discard_dead()
+
+        if not self.__heap:
+            return []
+
+        now = self.__clock.now()
+        jobs = []
+
+        while self.__heap and self.__heap[0][self.__KEY].on_datetime <= now:
+            entry = heapq.heappop(self.__heap)
+
+            if entry[self.__IS_LIVE]:
+                job = entry[self.__JOB]
+                del self.__entries[(job.target, job.event_id)]
+                jobs.append(job)
+
+        return jobs
+
+
+    def __timeout(self):
+        # true seconds to the first job, or None if there is none, or the model clock is paused
+        self.__discard_dead()
+
+        if not self.__heap:
+            return None
+
+        clock = self.__clock
+
+        if clock.model_start is not None and not clock.is_running:
+            return None
+
+        model_period = self.__heap[0][self.__KEY].on_datetime - clock.now()
+
+        return max(model_period.total_seconds() / clock.speed, 0.0)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def clock(self):
+        return self.__clock
+
+
+    @property
+    def is_running(self):
+        return self.__thread is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'CronScheduler:{{clock:{self.clock}, pending:{len(self)}, is_running:{self.is_running}}}'
@@ -0,0 +1,201 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+Atomic file replacement, with a selectable durability policy
+
+Each file is written to a uniquely-named temporary file in its own directory, synced according to the SyncPolicy,
+then renamed over its target. Under DATA and FULL policies, each target directory is synced once per commit, so that
+the renames themselves survive a crash. A batch stages any number of files, then commits them together - the sync of
+each shared directory is paid once per batch, not once per file. Each file is replaced atomically, but a batch is
+not atomic as a whole.
+
+with AtomicWriter(SyncPolicy.DATA) as writer:
+    writer.stage(abs_filename1, text1)
+    writer.stage(abs_filename2, text2)
+
+https://lwn.net/Articles/457667/
+https://man7.org/linux/man-pages/man2/fsync.2.html
+"""
+
+import os
+import secrets
+from enum import StrEnum, unique
+
+from mrcs_core.data.meta_enum import MetaEnum
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+@unique
+class SyncPolicy(StrEnum, metaclass=MetaEnum):
+    """
+    An enumeration of the durability policies for atomic writes
+    """
+
+    NONE = 'NONE'  # atomic with respect to other processes, but not to a crash
+    DATA = 'DATA'  # fdatasync each file, fsync each directory
+    FULL = 'FULL'  # fsync each file (including its metadata), fsync each directory
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AtomicWriter(object):
+    """
+    Atomic file replacement, with a selectable durability policy
+    """
+
+    DEFAULT_POLICY = SyncPolicy.NONE
+
+    __FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_CLOEXEC', 0)
+    __MODE = 0o666  # subject to umask, as with open(..)
+
+
+    @classmethod
+    def write(cls, abs_filename, text: str, policy: SyncPolicy | None = None):
+        writer = cls(policy=policy)
+
+        try:
+            writer.stage(abs_filename, text)
+        except BaseException:
+            writer.abort()
+            raise
+
+        writer.commit()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, policy: SyncPolicy | None = None):
+        self.__policy = self.DEFAULT_POLICY if policy is None else policy
+        self.__staged = []  # list of (tmp_filename, abs_filename)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def stage(self, abs_filename, text: str):
+        data = text.encode()
+
+        fd, tmp_filename = self.__create(abs_filename)  # may raise FileNotFoundError
+
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+
+            self.__sync_file(fd)
+
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_filename)
+            raise
+
+        os.close(fd)
+
+        self.__staged.append((tmp_filename, abs_filename))
+
+
+    def commit(self):
+        staged = self.__staged
+        self.__staged = []
+
+        abs_dirnames = []
+
+        try:
+            while staged:
+                tmp_filename, abs_filename = staged[0]
+                os.replace(tmp_filename, abs_filename)
+                staged.pop(0)
+
+                abs_dirname = os.path.dirname(os.path.abspath(abs_filename))
+                if abs_dirname not in abs_dirnames:
+                    abs_dirnames.append(abs_dirname)
+
+        finally:
+            for tmp_filename, _ in staged:
+                self.__unlink(tmp_filename)
+
+        for abs_dirname in abs_dirnames:
+            self.__sync_dir(abs_dirname)
+
+
+    def abort(self):
+        for tmp_filename, _ in self.__staged:
+            self.__unlink(tmp_filename)
+
+        self.__staged = []
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __create(self, abs_filename):
+        while True:
+            tmp_filename = f'{abs_filename}.{secrets.token_hex(6)}.tmp'
+
+            try:
+                return os.open(tmp_filename, self.__FLAGS, self.__MODE), tmp_filename
+            except FileExistsError:
+                continue
+
+
+    def __sync_file(self, fd):
+        if self.__policy == SyncPolicy.DATA:
+            getattr(os, 'fdatasync', os.fsync)(fd)
+
+        elif self.__policy == SyncPolicy.FULL:
+            os.fsync(fd)
+
+
+    def __sync_dir(self, abs_dirname):
+        if self.__policy == SyncPolicy.NONE:
+            return
+
+        try:
+            fd = os.open(abs_dirname, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+        except OSError:
+            return  # directories cannot be opened on this platform
+
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass  # directories cannot be synced on this platform
+        finally:
+            os.close(fd)
+
+
+    @staticmethod
+    def __unlink(tmp_filename):
+        try:
+            os.unlink(tmp_filename)
+        except FileNotFoundError:
+            pass
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def policy(self):
+        return self.__policy
+
+
+    @property
+    def staged_count(self):
+        return len(self.__staged)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'AtomicWriter:{{policy:{self.policy}, staged_count:{self.staged_count}}}'
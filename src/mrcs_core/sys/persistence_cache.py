@@ -0,0 +1,115 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A process-wide read-through cache of loaded persistent documents
+
+Entries are held per absolute filename and encryption key, as parsed jdicts with their last_modified datetime, and
+are valid only while the file signature - (st_mtime_ns, st_size, st_ino) - is unchanged. The inode changes with each
+atomic replacement, so a document of the same size, saved within the granularity of the mtime, is still detected. A
+manager that offers no signature is never cached. Managers invalidate entries explicitly on save and remove.
+
+Encryption keys are not held - entries are keyed on a digest of the key, salted once per process.
+
+Cached jdicts are shared between loads, so construct_from_jdict(..) must not mutate its jdict.
+
+https://docs.python.org/3/library/os.html#os.stat_result
+"""
+
+import hashlib
+import os
+import threading
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PersistenceCache(object):
+    """
+    A process-wide read-through cache of loaded persistent documents
+    """
+
+    __entries = {}  # abs_filename: {key digest: (signature, jdict, last_modified)}
+    __lock = threading.Lock()
+    __is_enabled = True
+
+    __KEY_SALT = os.urandom(16)
+
+
+    @classmethod
+    def set_enabled(cls, is_enabled: bool):
+        cls.__is_enabled = is_enabled
+
+        if not is_enabled:
+            cls.clear()
+
+
+    @classmethod
+    def is_enabled(cls):
+        return cls.__is_enabled
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def get(cls, manager, dirname, filename, encryption_key, signature):
+        if signature is None or not cls.__is_enabled:
+            return None
+
+        with cls.__lock:
+            entries = cls.__entries.get(cls.__abs_filename(manager, dirname, filename), {})
+            entry = entries.get(cls.__digest(encryption_key))
+
+        if entry is None or entry[0] != signature:
+            return None
+
+        return entry[1], entry[2]  # jdict, last_modified
+
+
+    @classmethod
+    def put(cls, manager, dirname, filename, encryption_key, signature, jdict, last_modified):
+        if signature is None or not cls.__is_enabled:
+            return
+
+        abs_filename = cls.__abs_filename(manager, dirname, filename)
+
+        with cls.__lock:
+            entries = cls.__entries.get(abs_filename)
+
+            if entries is None or any(entry[0] != signature for entry in entries.values()):
+                entries = cls.__entries[abs_filename] = {}  # the file has changed - drop all keys
+
+            entries[cls.__digest(encryption_key)] = (signature, jdict, last_modified)
+
+
+    @classmethod
+    def invalidate(cls, manager, dirname, filename):
+        with cls.__lock:
+            cls.__entries.pop(cls.__abs_filename(manager, dirname, filename), None)
+
+
+    @classmethod
+    def clear(cls):
+        with cls.__lock:
+            cls.__entries.clear()
+
+
+    @classmethod
+    def size(cls):
+        with cls.__lock:
+            return sum(len(entries) for entries in cls.__entries.values())
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @classmethod
+    def __digest(cls, encryption_key):
+        if encryption_key is None:
+            return None
+
+        return hashlib.blake2b(encryption_key.encode(), digest_size=16, key=cls.__KEY_SALT).digest()
+
+
+    @staticmethod
+    def __abs_filename(manager, dirname, filename):
+        return os.path.join(manager.mrcs_abs_dir(), dirname, filename)
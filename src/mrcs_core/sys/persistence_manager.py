@@ -2,13 +2,26 @@
 Created on 20 Oct 2020
 
 @author: Bruno Beloff (bbeloff@me.com)
+
+AsyncPersistenceManager offers the PersistenceManager operations as coroutines, for use within an asyncio event loop.
+ExecutorPersistenceManager runs the file I/O and Crypt work of a blocking manager in an executor, off the loop.
+
+FilesystemPersistenceManager decrypts a document as it is read, through the Crypt session of its key, so the cypher
+text is never held whole. A batch of documents is encrypted through a single session.
+
+https://docs.python.org/3/library/asyncio-eventloop.html#asyncio.loop.run_in_executor
 """
 
+import asyncio
+import io
 import os
-import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from functools import partial
 
 from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.sys.atomic_writer import AtomicWriter, SyncPolicy
+from mrcs_core.sys.persistence_cache import PersistenceCache
 
 
 # --------------------------------------------------------------------------------------------------------------------
@@ -51,6 +64,11 @@ class PersistenceManager(ABC):
         pass
 
 
+    @classmethod
+    def signature(cls, dirname, filename):
+        return None  # the document cannot be validated, so is not cached
+
+
     # ----------------------------------------------------------------------------------------------------------------
 
     @classmethod
@@ -66,6 +84,8 @@ class FilesystemPersistenceManager(PersistenceManager, ABC):
     classdocs
     """
 
+    _SYNC_POLICY = SyncPolicy.DATA  # configuration should survive a crash
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -92,16 +112,19 @@ class FilesystemPersistenceManager(PersistenceManager, ABC):
         abs_filename = cls.abs_filename(dirname, filename)
 
         try:
-            with open(abs_filename) as f:
-                text = f.read()
-
             if encryption_key:
                 from mrcs_core.data.crypt import Crypt  # late import
 
 
-                jstr = Crypt.decrypt(encryption_key, text)
+                plain = io.BytesIO()
+
+                with open(abs_filename, 'rb') as f:
+                    Crypt.session(encryption_key).decrypt_text_stream(f, plain)
+
+                jstr = str(plain.getbuffer(), 'utf-8')
             else:
-                jstr = text
+                with open(abs_filename) as f:
+                    jstr = f.read()
 
         except FileNotFoundError:
             return None, None
@@ -113,29 +136,38 @@ class FilesystemPersistenceManager(PersistenceManager, ABC):
 
 
     @classmethod
-    def save(cls, text, dirname, filename, encryption_key=None):
-        abs_dirname = cls.abs_dirname(dirname)
-        abs_filename = cls.abs_filename(dirname, filename)
+    def save(cls, text, dirname, filename, encryption_key=None, sync_policy: SyncPolicy | None = None):
+        cls.save_all(((text, dirname, filename),), encryption_key=encryption_key, sync_policy=sync_policy)
 
-        # file...
-        if filename:
-            os.makedirs(abs_dirname, exist_ok=True)
 
-        tmp_filename = '.'.join((abs_filename, str(int(time.time()))))
+    @classmethod
+    def save_all(cls, documents, encryption_key=None, sync_policy: SyncPolicy | None = None):
+        # documents: iterable of (text, dirname, filename)
+        locations = []
 
         if encryption_key:
             from mrcs_core.data.crypt import Crypt  # late import
 
 
-            saved_text = Crypt.encrypt(encryption_key, text)
+            crypt = Crypt.session(encryption_key)
         else:
-            saved_text = text + '\n'
+            crypt = None
 
-        with open(tmp_filename, "w") as f:
-            f.write(saved_text)
+        with AtomicWriter(cls._SYNC_POLICY if sync_policy is None else sync_policy) as writer:
+            for text, dirname, filename in documents:
+                if filename:
+                    os.makedirs(cls.abs_dirname(dirname), exist_ok=True)
 
-        # atomic operation...
-        os.rename(tmp_filename, abs_filename)
+                if crypt is not None:
+                    saved_text = crypt.encrypt_text(text)
+                else:
+                    saved_text = text + '\n'
+
+                writer.stage(cls.abs_filename(dirname, filename), saved_text)
+                locations.append((dirname, filename))
+
+        for dirname, filename in locations:
+            PersistenceCache.invalidate(cls, dirname, filename)
 
 
     @classmethod
@@ -147,6 +179,26 @@ class FilesystemPersistenceManager(PersistenceManager, ABC):
         except FileNotFoundError:
             pass
 
+        PersistenceCache.invalidate(cls, dirname, filename)
+
+
+    @classmethod
+    def signature(cls, dirname, filename):
+        try:
+            stat = os.stat(cls.abs_filename(dirname, filename))
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino  # the inode changes with each atomic replacement
+
+
+    @classmethod
+    def watcher(cls, poll_interval=1.0):
+        from mrcs_core.sys.persistence_watcher import PersistenceWatcher  # late import
+
+
+        return PersistenceWatcher.construct(cls, poll_interval=poll_interval)
+
 
     # ----------------------------------------------------------------------------------------------------------------
 
@@ -158,3 +210,114 @@ class FilesystemPersistenceManager(PersistenceManager, ABC):
     @classmethod
     def abs_filename(cls, dirname, filename):
         return str(os.path.join(cls.mrcs_abs_dir(), dirname, filename))
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class AsyncPersistenceManager(ABC):
+    """
+    classdocs
+    """
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    async def list(self, container, dirname):
+        pass
+
+
+    @abstractmethod
+    async def exists(self, dirname, filename):
+        pass
+
+
+    @abstractmethod
+    async def load(self, dirname, filename, encryption_key=None):
+        pass
+
+
+    @abstractmethod
+    async def save(self, text, dirname, filename, encryption_key=None):
+        pass
+
+
+    @abstractmethod
+    async def remove(self, dirname, filename):
+        pass
+
+
+    async def signature(self, dirname, filename):
+        return None  # the document cannot be validated, so is not cached
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def mrcs_abs_dir(self):
+        pass
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class ExecutorPersistenceManager(AsyncPersistenceManager):
+    """
+    runs the operations of a blocking PersistenceManager in an executor - the loop's default executor if none is given
+    """
+
+
+    def __init__(self, manager: type[PersistenceManager] | PersistenceManager, executor: Executor | None = None):
+        self.__manager = manager
+        self.__executor = executor
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def list(self, container, dirname):
+        return await self.__run(self.__manager.list, container, dirname)
+
+
+    async def exists(self, dirname, filename):
+        return await self.__run(self.__manager.exists, dirname, filename)
+
+
+    async def load(self, dirname, filename, encryption_key=None):
+        return await self.__run(self.__manager.load, dirname, filename, encryption_key=encryption_key)
+
+
+    async def save(self, text, dirname, filename, encryption_key=None):
+        return await self.__run(self.__manager.save, text, dirname, filename, encryption_key=encryption_key)
+
+
+    async def remove(self, dirname, filename):
+        return await self.__run(self.__manager.remove, dirname, filename)
+
+
+    async def signature(self, dirname, filename):
+        return await self.__run(self.__manager.signature, dirname, filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def mrcs_abs_dir(self):
+        return self.__manager.mrcs_abs_dir()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    async def __run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, partial(func, *args, **kwargs))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def manager(self):
+        return self.__manager
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'ExecutorPersistenceManager:{{manager:{self.manager}, executor:{self.__executor}}}'
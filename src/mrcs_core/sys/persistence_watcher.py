@@ -0,0 +1,496 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+Change notification for documents held by a FilesystemPersistenceManager
+
+A watcher observes the conf and inventory directories under the manager's mrcs_abs_dir(), and calls back the
+subscribers of each PersistentJSONable or MultiPersistentJSONable class whose persistence_location() has changed.
+A MultiPersistentJSONable class subscribed without a name receives the changes for all its names.
+
+On Linux, changes are notified by inotify, via the C library - elsewhere, the directories are polled for changes
+of (st_mtime_ns, st_size). Callbacks are made on the watcher thread, so should return promptly.
+
+with FilesystemPersistenceManager.watcher() as watcher:
+    watcher.subscribe(Clock, on_clock_change)
+
+https://man7.org/linux/man-pages/man7/inotify.7.html
+https://docs.python.org/3/library/ctypes.html
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from abc import ABC, abstractmethod
+from enum import StrEnum, unique
+from typing import Callable
+
+from mrcs_core.data.json import AbstractPersistentJSONable, MultiPersistentJSONable
+from mrcs_core.data.meta_enum import MetaEnum
+from mrcs_core.sys.logging import Logging
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+@unique
+class PersistenceChangeKind(StrEnum, metaclass=MetaEnum):
+    """
+    An enumeration of the kinds of document change
+    """
+
+    UPDATED = 'UPDATED'  # created or replaced
+    DELETED = 'DELETED'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PersistenceChange(object):
+    """
+    A change to the stored document of a persistent class
+    """
+
+
+    def __init__(self, kind: PersistenceChangeKind, persistent_class: type, dirname: str, filename: str,
+                 name: str | None = None):
+        self.__kind = kind
+        self.__persistent_class = persistent_class
+        self.__dirname = dirname
+        self.__filename = filename
+        self.__name = name  # MultiPersistentJSONable only
+
+
+    def __eq__(self, other):
+        try:
+            return (self.kind == other.kind and self.persistent_class == other.persistent_class and
+                    self.dirname == other.dirname and self.filename == other.filename and self.name == other.name)
+        except (AttributeError, TypeError):
+            return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def kind(self):
+        return self.__kind
+
+
+    @property
+    def persistent_class(self):
+        return self.__persistent_class
+
+
+    @property
+    def dirname(self):
+        return self.__dirname
+
+
+    @property
+    def filename(self):
+        return self.__filename
+
+
+    @property
+    def name(self):
+        return self.__name
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'PersistenceChange:{{kind:{self.kind}, persistent_class:{self.persistent_class.__name__}, '
+                f'dirname:{self.dirname}, filename:{self.filename}, name:{self.name}}}')
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PersistenceWatcher(ABC):
+    """
+    An abstract watcher over the conf and inventory directories of a FilesystemPersistenceManager
+    """
+
+    DEFAULT_POLL_INTERVAL = 1.0  # seconds
+
+
+    @classmethod
+    def construct(cls, manager, poll_interval=DEFAULT_POLL_INTERVAL):
+        if InotifyPersistenceWatcher.is_available():
+            return InotifyPersistenceWatcher(manager)
+
+        return PollingPersistenceWatcher(manager, poll_interval=poll_interval)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager):
+        self.__manager = manager
+        self.__dirnames = (AbstractPersistentJSONable.conf_dir(), AbstractPersistentJSONable.inventory_dir())
+
+        self.__subscriptions = []  # list of (persistent_class, dirname, filename, name, is_all_names, callback)
+        self.__lock = threading.Lock()
+        self.__thread = None
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def subscribe(self, persistent_class: type, callback: Callable[[PersistenceChange], None], name=None):
+        if issubclass(persistent_class, MultiPersistentJSONable):
+            dirname, filename = persistent_class.persistence_location(name)
+            is_all_names = name is None
+        else:
+            dirname, filename = persistent_class.persistence_location()
+            is_all_names = False
+
+        if dirname not in self.__dirnames:
+            raise ValueError(f'unwatched dirname:{dirname}')
+
+        subscription = (persistent_class, dirname, filename, name, is_all_names, callback)
+
+        with self.__lock:
+            self.__subscriptions.append(subscription)
+
+        return subscription
+
+
+    def unsubscribe(self, subscription) -> bool:
+        with self.__lock:
+            try:
+                self.__subscriptions.remove(subscription)
+                return True
+            except ValueError:
+                return False
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def start(self):
+        if self.is_running:
+            return
+
+        for dirname in self.dirnames:
+            os.makedirs(self.abs_dirname(dirname), exist_ok=True)
+
+        self._open()
+
+        self.__thread = threading.Thread(target=self._watch, name=self.__class__.__name__, daemon=True)
+        self.__thread.start()
+
+
+    def stop(self):
+        if not self.is_running:
+            return
+
+        self._interrupt()
+
+        self.__thread.join()
+        self.__thread = None
+
+        self._close()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @abstractmethod
+    def _open(self):
+        pass
+
+
+    @abstractmethod
+    def _watch(self):
+        pass
+
+
+    @abstractmethod
+    def _interrupt(self):
+        pass
+
+
+    @abstractmethod
+    def _close(self):
+        pass
+
+
+    def _dispatch(self, kind: PersistenceChangeKind, dirname: str, filename: str):
+        with self.__lock:
+            subscriptions = tuple(self.__subscriptions)
+
+        for persistent_class, sub_dirname, sub_filename, name, is_all_names, callback in subscriptions:
+            if dirname != sub_dirname:
+                continue
+
+            if is_all_names:
+                if len(filename) <= len(sub_filename) or not filename.endswith(sub_filename):
+                    continue
+
+                name = filename[:-(len(sub_filename) + 1)]  # as MultiPersistentJSONable.list(..)
+
+            elif filename != sub_filename:
+                continue
+
+            try:
+                callback(PersistenceChange(kind, persistent_class, dirname, filename, name=name))
+            except Exception as ex:
+                Logging.getLogger().error(f'{self.__class__.__name__}: callback failed: {ex!r}')
+
+
+    def _dispatch_all(self, kind: PersistenceChangeKind):
+        for dirname in self.dirnames:
+            try:
+                filenames = os.listdir(self.abs_dirname(dirname))
+            except FileNotFoundError:
+                continue
+
+            for filename in filenames:
+                self._dispatch(kind, dirname, filename)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def abs_dirname(self, dirname):
+        return os.path.join(self.__manager.mrcs_abs_dir(), dirname)
+
+
+    @property
+    def manager(self):
+        return self.__manager
+
+
+    @property
+    def dirnames(self):
+        return self.__dirnames
+
+
+    @property
+    def is_running(self):
+        return self.__thread is not None
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'{self.__class__.__name__}:{{manager:{self.manager}, is_running:{self.is_running}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class InotifyPersistenceWatcher(PersistenceWatcher):
+    """
+    A watcher notified by Linux inotify
+    """
+
+    __IN_CLOSE_WRITE = 0x00000008
+    __IN_MOVED_FROM = 0x00000040
+    __IN_MOVED_TO = 0x00000080
+    __IN_DELETE = 0x00000200
+    __IN_Q_OVERFLOW = 0x00004000
+    __IN_ISDIR = 0x40000000
+
+    __MASK = __IN_CLOSE_WRITE | __IN_MOVED_FROM | __IN_MOVED_TO | __IN_DELETE
+
+    __EVENT = struct.Struct('=iIII')  # wd, mask, cookie, len - followed by a NUL-padded name of len bytes
+    __BUFFER_SIZE = 64 * 1024
+
+    __libc = None
+
+
+    @classmethod
+    def is_available(cls):
+        return cls.__load_libc() is not None
+
+
+    @classmethod
+    def __load_libc(cls):
+        if cls.__libc is None and sys.platform.startswith('linux'):
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+                libc.inotify_init1, libc.inotify_add_watch  # may raise AttributeError
+                cls.__libc = libc
+
+            except (AttributeError, OSError):
+                pass
+
+        return cls.__libc
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, manager):
+        super().__init__(manager)
+
+        self.__fd = None
+        self.__interrupt_fds = None
+        self.__dirnames_by_wd = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _open(self):
+        libc = self.__load_libc()
+
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1')
+
+        for dirname in self.dirnames:
+            wd = libc.inotify_add_watch(fd, os.fsencode(self.abs_dirname(dirname)), self.__MASK)
+
+            if wd < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, f'inotify_add_watch: {dirname}')
+
+            self.__dirnames_by_wd[wd] = dirname
+
+        self.__fd = fd
+        self.__interrupt_fds = os.pipe()
+
+
+    def _watch(self):
+        interrupt_fd = self.__interrupt_fds[0]
+
+        while True:
+            readable, _, _ = select.select((self.__fd, interrupt_fd), (), ())
+
+            if interrupt_fd in readable:
+                return
+
+            try:
+                buffer = os.read(self.__fd, self.__BUFFER_SIZE)
+            except BlockingIOError:
+                continue
+
+            for kind, dirname, filename in self.__events(buffer):
+                if dirname is None:
+                    self._dispatch_all(kind)  # events were lost
+                else:
+                    self._dispatch(kind, dirname, filename)
+
+
+    def _interrupt(self):
+        os.write(self.__interrupt_fds[1], b'\0')
+
+
+    def _close(self):
+        os.close(self.__fd)
+
+        for fd in self.__interrupt_fds:
+            os.close(fd)
+
+        self.__fd = None
+        self.__interrupt_fds = None
+        self.__dirnames_by_wd = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __events(self, buffer):
+        offset = 0
+
+        while offset < len(buffer):
+            wd, mask, _, length = self.__EVENT.unpack_from(buffer, offset)
+            offset += self.__EVENT.size
+
+            filename = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & self.__IN_Q_OVERFLOW:
+                yield PersistenceChangeKind.UPDATED, None, None
+                continue
+
+            if mask & self.__IN_ISDIR or wd not in self.__dirnames_by_wd:
+                continue
+
+            if mask & (self.__IN_DELETE | self.__IN_MOVED_FROM):
+                yield PersistenceChangeKind.DELETED, self.__dirnames_by_wd[wd], filename
+
+            elif mask & (self.__IN_CLOSE_WRITE | self.__IN_MOVED_TO):
+                yield PersistenceChangeKind.UPDATED, self.__dirnames_by_wd[wd], filename
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class PollingPersistenceWatcher(PersistenceWatcher):
+    """
+    A watcher that polls for changes of (st_mtime_ns, st_size)
+    """
+
+
+    def __init__(self, manager, poll_interval=PersistenceWatcher.DEFAULT_POLL_INTERVAL):
+        super().__init__(manager)
+
+        self.__poll_interval = poll_interval
+        self.__stop = threading.Event()
+        self.__signatures = {}  # (dirname, filename): (st_mtime_ns, st_size)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def _open(self):
+        self.__stop.clear()
+        self.__signatures = self.__scan()
+
+
+    def _watch(self):
+        while not self.__stop.wait(self.__poll_interval):
+            signatures = self.__scan()
+
+            for location, signature in signatures.items():
+                if self.__signatures.get(location) != signature:
+                    self._dispatch(PersistenceChangeKind.UPDATED, *location)
+
+            for location in self.__signatures.keys() - signatures.keys():
+                self._dispatch(PersistenceChangeKind.DELETED, *location)
+
+            self.__signatures = signatures
+
+
+    def _interrupt(self):
+        self.__stop.set()
+
+
+    def _close(self):
+        self.__signatures = {}
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __scan(self):
+        signatures = {}
+
+        for dirname in self.dirnames:
+            try:
+                with os.scandir(self.abs_dirname(dirname)) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                stat = entry.stat()
+                                signatures[(dirname, entry.name)] = (stat.st_mtime_ns, stat.st_size)
+
+                        except FileNotFoundError:
+                            pass  # removed while scanning
+
+            except FileNotFoundError:
+                pass
+
+        return signatures
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def poll_interval(self):
+        return self.__poll_interval
@@ -0,0 +1,185 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A non-blocking, exponential-backoff limiter for repeated authentication failures
+
+Each failure recorded against a subject - for example, a caller and the document that it attempted to decrypt -
+locks that subject out for base_delay, doubling with each consecutive failure, up to max_delay. While a subject is
+locked out, check(..) raises RetryAfterError at once, without any attempt being made. No thread or event loop is
+ever put to sleep - other subjects, and other clients, are unaffected. A success clears the subject's record, and a
+record lapses once no failure has been seen for decay_interval.
+
+An allowance permits that number of consecutive failures before the lockout begins - a budget shared by the clients
+of a subject, so that an occasional mistake by one does not lock out the others.
+
+RetryAfterError is a KeyError, so callers that handled a wrong key continue to handle a rejection.
+
+https://en.wikipedia.org/wiki/Exponential_backoff
+https://www.rfc-editor.org/rfc/rfc9110#name-retry-after
+"""
+
+import asyncio
+import threading
+import time
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RetryAfterError(KeyError):
+    """
+    raised when a subject is locked out - retry_after is in seconds
+    """
+
+    def __init__(self, subject, retry_after: float):
+        super().__init__(subject)
+
+        self.__subject = subject
+        self.__retry_after = retry_after
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def subject(self):
+        return self.__subject
+
+
+    @property
+    def retry_after(self):
+        return self.__retry_after
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'RetryAfterError:{{subject:{self.subject}, retry_after:{self.retry_after:.3f}}}'
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class RejectionLimiter(object):
+    """
+    A non-blocking, exponential-backoff limiter for repeated authentication failures
+    """
+
+    DEFAULT_BASE_DELAY = 3.0  # seconds
+    DEFAULT_MAX_DELAY = 300.0  # seconds
+    DEFAULT_DECAY_INTERVAL = 900.0  # seconds
+    DEFAULT_MAX_SUBJECTS = 4096
+    DEFAULT_ALLOWANCE = 0
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 decay_interval=DEFAULT_DECAY_INTERVAL, max_subjects=DEFAULT_MAX_SUBJECTS,
+                 allowance=DEFAULT_ALLOWANCE, clock=time.monotonic):
+        self.__base_delay = base_delay
+        self.__max_delay = max_delay
+        self.__decay_interval = decay_interval
+        self.__max_subjects = max_subjects
+        self.__allowance = allowance
+        self.__clock = clock
+
+        self.__records = {}  # subject: (failures, last_failure, locked_until)
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def check(self, subject):
+        retry_after = self.retry_after(subject)
+
+        if retry_after > 0.0:
+            raise RetryAfterError(subject, retry_after)
+
+
+    async def wait_async(self, subject):
+        while (retry_after := self.retry_after(subject)) > 0.0:
+            await asyncio.sleep(retry_after)  # suspends this task only
+
+
+    def retry_after(self, subject):
+        with self.__lock:
+            record = self.__records.get(subject)
+
+        if record is None:
+            return 0.0
+
+        return max(record[2] - self.__clock(), 0.0)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def record_failure(self, subject):
+        now = self.__clock()
+
+        with self.__lock:
+            failures, last_failure, _ = self.__records.pop(subject, (0, now, now))
+
+            if now - last_failure > self.__decay_interval:
+                failures = 0
+
+            failures += 1
+            excess = failures - self.__allowance
+            delay = 0.0 if excess < 1 else min(self.__base_delay * 2 ** (excess - 1), self.__max_delay)
+
+            self.__records[subject] = (failures, now, now + delay)  # re-inserted as the most recent
+            self.__prune(now)
+
+        return delay
+
+
+    def record_success(self, subject):
+        with self.__lock:
+            self.__records.pop(subject, None)
+
+
+    def clear(self):
+        with self.__lock:
+            self.__records.clear()
+
+
+    def __prune(self, now):
+        if len(self.__records) <= self.__max_subjects:
+            return
+
+        for subject, (_, last_failure, locked_until) in list(self.__records.items()):
+            if locked_until <= now and now - last_failure > self.__decay_interval:
+                del self.__records[subject]
+
+        while len(self.__records) > self.__max_subjects:
+            del self.__records[next(iter(self.__records))]  # the least recent failure
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @property
+    def base_delay(self):
+        return self.__base_delay
+
+
+    @property
+    def max_delay(self):
+        return self.__max_delay
+
+
+    @property
+    def allowance(self):
+        return self.__allowance
+
+
+    @property
+    def subject_count(self):
+        with self.__lock:
+            return len(self.__records)
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return (f'RejectionLimiter:{{base_delay:{self.base_delay}, max_delay:{self.max_delay}, '
+                f'decay_interval:{self.__decay_interval}, allowance:{self.allowance}, '
+                f'subject_count:{self.subject_count}}}')
@@ -0,0 +1,239 @@
+"""
+Created on 18 Oct 2026
+
+@author: Bruno Beloff (bbeloff@me.com)
+
+A PersistenceManager that holds its documents in a single SQLite database, rather than one file per document
+
+Documents are keyed by (dirname, filename), and held with their modification time. The primary key is the only index,
+so exists(..) is a single index probe, and list(..) is a range scan over one dirname - there is no directory to scan.
+The database is in WAL mode, so readers do not block the writer. Each thread has its own connection, opened on first
+use and reused thereafter. Within transaction(), any number of saves and removes are committed together, or not at
+all.
+
+The database stands in for the MRCS directory: mrcs_abs_dir() returns its absolute filename, so that cached documents
+are distinguished from those of a FilesystemPersistenceManager.
+
+manager = SQLitePersistenceManager.construct('TEST')
+
+with manager.transaction():
+    conf1.save(manager)
+    conf2.save(manager)
+
+https://www.sqlite.org/wal.html
+https://www.sqlite.org/withoutrowid.html
+https://docs.python.org/3/library/sqlite3.html#sqlite3-controlling-transactions
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from mrcs_core.data.iso_datetime import ISODatetime
+from mrcs_core.sys.host import Host
+from mrcs_core.sys.persistence_cache import PersistenceCache
+from mrcs_core.sys.persistence_manager import PersistenceManager
+
+
+# --------------------------------------------------------------------------------------------------------------------
+
+class SQLitePersistenceManager(PersistenceManager):
+    """
+    A PersistenceManager that holds its documents in a single SQLite database
+    """
+
+    DB_FILENAME = 'persistence.db'
+
+    __BUSY_TIMEOUT = 5.0  # seconds
+
+    __SCHEMA = ('CREATE TABLE IF NOT EXISTS document ('
+                'dirname TEXT NOT NULL, '
+                'filename TEXT NOT NULL, '
+                'text TEXT NOT NULL, '
+                'mtime_ns INTEGER NOT NULL, '
+                'PRIMARY KEY (dirname, filename)'
+                ') WITHOUT ROWID')
+
+
+    @classmethod
+    def construct(cls, db_mode, host=Host):
+        return cls(host.mrcs_db_abs_file(db_mode, cls.DB_FILENAME))
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __init__(self, abs_filename):
+        self.__abs_filename = str(abs_filename)
+
+        self.__local = threading.local()  # connection, depth, invalidations
+        self.__connections = []
+        self.__lock = threading.Lock()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def list(self, container, dirname):
+        # container is ignored - the database is the container
+        cursor = self.__connection().execute(
+            'SELECT filename FROM document WHERE dirname = ? ORDER BY filename', (dirname,))
+
+        return [row[0] for row in cursor]
+
+
+    def exists(self, dirname, filename):
+        cursor = self.__connection().execute(
+            'SELECT 1 FROM document WHERE dirname = ? AND filename = ?', (dirname, filename))
+
+        return cursor.fetchone() is not None
+
+
+    def load(self, dirname, filename, encryption_key=None):
+        row = self.__connection().execute(
+            'SELECT text, mtime_ns FROM document WHERE dirname = ? AND filename = ?', (dirname, filename)).fetchone()
+
+        if row is None:
+            return None, None
+
+        text, mtime_ns = row
+
+        if encryption_key:
+            from mrcs_core.data.crypt import Crypt  # late import
+
+
+            jstr = Crypt.decrypt(encryption_key, text)
+        else:
+            jstr = text
+
+        last_modified = ISODatetime.construct_from_timestamp(mtime_ns // 1_000_000_000)
+
+        return jstr, last_modified
+
+
+    def save(self, text, dirname, filename, encryption_key=None):
+        self.save_all(((text, dirname, filename),), encryption_key=encryption_key)
+
+
+    def save_all(self, documents, encryption_key=None):
+        # documents: iterable of (text, dirname, filename)
+        with self.transaction() as connection:
+            for text, dirname, filename in documents:
+                if encryption_key:
+                    from mrcs_core.data.crypt import Crypt  # late import
+
+
+                    saved_text = Crypt.encrypt(encryption_key, text)
+                else:
+                    saved_text = text
+
+                connection.execute(
+                    'INSERT INTO document (dirname, filename, text, mtime_ns) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT (dirname, filename) DO UPDATE SET text = excluded.text, mtime_ns = excluded.mtime_ns',
+                    (dirname, filename, saved_text, time.time_ns()))
+
+                self.__local.invalidations.append((dirname, filename))
+
+
+    def remove(self, dirname, filename):
+        with self.transaction() as connection:
+            connection.execute('DELETE FROM document WHERE dirname = ? AND filename = ?', (dirname, filename))
+
+            self.__local.invalidations.append((dirname, filename))
+
+
+    def signature(self, dirname, filename):
+        return self.__connection().execute(
+            'SELECT mtime_ns, length(text) FROM document WHERE dirname = ? AND filename = ?',
+            (dirname, filename)).fetchone()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    @contextmanager
+    def transaction(self):
+        connection = self.__connection()
+
+        if self.__local.depth > 0:  # nested - the outermost transaction commits
+            self.__local.depth += 1
+            try:
+                yield connection
+            finally:
+                self.__local.depth -= 1
+            return
+
+        connection.execute('BEGIN IMMEDIATE')  # take the write lock now, rather than on the first write
+        self.__local.depth = 1
+
+        try:
+            yield connection
+
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+        else:
+            connection.execute('COMMIT')
+
+        finally:
+            self.__local.depth = 0
+
+            for dirname, filename in self.__local.invalidations:
+                PersistenceCache.invalidate(self, dirname, filename)
+
+            self.__local.invalidations = []
+
+
+    def close(self):
+        with self.__lock:
+            for connection in self.__connections:
+                connection.close()
+
+            self.__connections = []
+
+        self.__local = threading.local()
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __connection(self):
+        connection = getattr(self.__local, 'connection', None)
+
+        if connection is not None:
+            return connection
+
+        os.makedirs(os.path.dirname(self.__abs_filename), exist_ok=True)
+
+        # transactions are explicit, so the connection is in autocommit mode...
+        connection = sqlite3.connect(self.__abs_filename, timeout=self.__BUSY_TIMEOUT, isolation_level=None,
+                                     check_same_thread=False)
+
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')  # in WAL mode, a power loss may lose commits, not integrity
+        connection.execute(self.__SCHEMA)
+
+        self.__local.connection = connection
+        self.__local.depth = 0
+        self.__local.invalidations = []
+
+        with self.__lock:
+            self.__connections.append(connection)
+
+        return connection
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def mrcs_abs_dir(self):
+        return self.__abs_filename
+
+
+    @property
+    def abs_filename(self):
+        return self.__abs_filename
+
+
+    # ----------------------------------------------------------------------------------------------------------------
+
+    def __str__(self, *args, **kwargs):
+        return f'SQLitePersistenceManager:{{abs_filename:{self.abs_filename}}}'